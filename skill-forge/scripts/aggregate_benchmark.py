@@ -22,10 +22,14 @@ from pathlib import Path
 from typing import Any
 
 
+_EVAL_DIR_RE = re.compile(r'^eval-(\d+)$')
+
+
 def load_json(path: Path) -> dict[str, Any] | None:
     """Safely load a JSON file, returning None on failure."""
     try:
-        return json.loads(path.read_text())
+        with open(path, 'rb') as f:
+            return json.load(f)
     except (FileNotFoundError, json.JSONDecodeError):
         return None
 
@@ -34,7 +38,7 @@ def discover_eval_dirs(iteration_path: Path) -> list[Path]:
     """Find all eval-* directories in an iteration workspace."""
     eval_dirs: list[Path] = []
     for entry in sorted(iteration_path.iterdir()):
-        if entry.is_dir() and re.match(r'^eval-\d+$', entry.name):
+        if entry.is_dir() and _EVAL_DIR_RE.match(entry.name):
             eval_dirs.append(entry)
     return eval_dirs
 
@@ -135,7 +139,7 @@ def aggregate_benchmark(
     all_baseline_durations: list[float] = []
 
     for eval_dir in eval_dirs:
-        eval_id_match = re.match(r'^eval-(\d+)$', eval_dir.name)
+        eval_id_match = _EVAL_DIR_RE.match(eval_dir.name)
         eval_id = int(eval_id_match.group(1)) if eval_id_match else 0
 
         # Load eval metadata
@@ -0,0 +1,467 @@
+#!/usr/bin/env python3
+"""
+Purpose: Statically analyze a skill's bundled Python scripts with the ast module.
+Input: Path to a skill directory or its scripts/ directory
+Output: JSON report per script: docstring, CLI entry point, import-time side effects, heavy imports,
+        performance findings (--lint: flat findings list only)
+Usage: python scripts/analyze_scripts.py /path/to/skill [--workers 4] [--no-cache]
+       python scripts/analyze_scripts.py /path/to/skill --lint [--fail-on medium]
+
+Nothing is imported or executed. Results are cached by file content hash, and
+cache misses are parsed across a process pool when there are enough of them.
+A finding is exempted by a "# noqa: <code>" comment on its line (a bare
+"# noqa" exempts every code).
+"""
+
+import argparse
+import ast
+import json
+import multiprocessing
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from skill_utils import (
+    DEFAULT_CACHE_MAX_BYTES,
+    ResultCache,
+    default_cache_dir,
+    hash_inputs,
+    sha256_file,
+)
+
+
+# Bump whenever the analysis output changes so cached entries are dropped
+ANALYZER_VERSION = "4"
+
+# Below this many uncached scripts, process startup costs more than it saves
+PARALLEL_MIN_SCRIPTS = 8
+
+# Top-level imports that typically add 100ms+ to interpreter startup
+HEAVY_MODULES = {
+    'anthropic', 'boto3', 'cv2', 'jax', 'matplotlib', 'nltk', 'numpy', 'openai',
+    'pandas', 'playwright', 'polars', 'pyarrow', 'scipy', 'selenium', 'sklearn',
+    'spacy', 'sympy', 'tensorflow', 'torch', 'transformers',
+}
+
+# Calls that touch the outside world when they run at import time
+SIDE_EFFECT_CALLS = {
+    'open', 'print', 'input', 'exec', 'eval', 'exit', 'main',
+}
+SIDE_EFFECT_ATTRS = {
+    'run', 'Popen', 'call', 'check_call', 'check_output', 'system', 'urlopen',
+    'read_text', 'read_bytes', 'write_text', 'write_bytes', 'mkdir', 'makedirs',
+    'chdir', 'remove', 'unlink', 'rmtree', 'basicConfig', 'connect', 'exit',
+}
+
+
+SEVERITY_ORDER = ("critical", "high", "medium", "low")
+
+
+# --- AST Helpers ---
+
+def _call_name(node: ast.Call) -> str:
+    """Dotted name of a call target, e.g. "subprocess.run"; "" if not a name."""
+    parts: list[str] = []
+    target = node.func
+    while isinstance(target, ast.Attribute):
+        parts.append(target.attr)
+        target = target.value
+    if isinstance(target, ast.Name):
+        parts.append(target.id)
+    elif parts:
+        parts.append("<expr>")
+    return ".".join(reversed(parts))
+
+
+def _is_main_guard(node: ast.stmt) -> bool:
+    """True for `if __name__ == "__main__":`."""
+    if not isinstance(node, ast.If) or not isinstance(node.test, ast.Compare):
+        return False
+    test = node.test
+    operands = [test.left, *test.comparators]
+    return (
+        len(test.ops) == 1 and isinstance(test.ops[0], ast.Eq)
+        and any(isinstance(o, ast.Name) and o.id == "__name__" for o in operands)
+        and any(isinstance(o, ast.Constant) and o.value == "__main__" for o in operands)
+    )
+
+
+def _side_effect_calls(node: ast.AST) -> list[ast.Call]:
+    """Calls under node that do I/O, spawn processes or run the program."""
+    found = []
+    for child in ast.walk(node):
+        if not isinstance(child, ast.Call):
+            continue
+        name = _call_name(child)
+        leaf = name.rsplit(".", 1)[-1]
+        if name in SIDE_EFFECT_CALLS or ("." in name and leaf in SIDE_EFFECT_ATTRS):
+            found.append(child)
+    return found
+
+
+def _top_level(statements: list[ast.stmt]):
+    """Yield module-level statements, looking inside import-fallback try/if blocks.
+
+    The `if __name__ == "__main__":` block and function/class bodies are not
+    part of import time and are skipped.
+    """
+    for node in statements:
+        if _is_main_guard(node):
+            continue
+        if isinstance(node, ast.Try):
+            yield from _top_level(node.body)
+            for handler in node.handlers:
+                yield from _top_level(handler.body)
+            yield from _top_level(node.orelse)
+            yield from _top_level(node.finalbody)
+        elif isinstance(node, ast.If):
+            yield from _top_level(node.body)
+            yield from _top_level(node.orelse)
+        else:
+            yield node
+
+
+# --- Performance Lint ---
+
+# Finding code -> (severity, summary used in validation messages)
+PERF_CHECKS = {
+    "subprocess-in-loop": ("MEDIUM", "starts a subprocess inside a loop"),
+    "regex-compile-in-loop": ("MEDIUM", "recompiles a literal regex inside a loop; compile once at module level"),
+    "regex-call-in-loop": ("LOW", "calls re.* with a pattern inside a loop; use a precompiled pattern"),
+    "json-loads-read": ("LOW", "parses json.loads() of a whole-file read; check size or stream large inputs"),
+    "whole-file-read-in-loop": ("LOW", "reads whole files inside a loop; stream or read incrementally"),
+    "readlines": ("LOW", "materializes every line with readlines(); iterate the file instead"),
+}
+
+_SUBPROCESS_CALLS = {
+    'subprocess.run', 'subprocess.call', 'subprocess.check_call', 'subprocess.check_output',
+    'subprocess.Popen', 'subprocess.getoutput', 'subprocess.getstatusoutput', 'os.system', 'os.popen',
+}
+_REGEX_CALLS = {
+    're.match', 're.search', 're.fullmatch', 're.findall', 're.finditer',
+    're.sub', 're.subn', 're.split',
+}
+
+
+def _is_whole_read(node: ast.AST) -> bool:
+    """True for x.read_text(), x.read_bytes() and x.read() without a size."""
+    if not isinstance(node, ast.Call) or not isinstance(node.func, ast.Attribute):
+        return False
+    attr = node.func.attr
+    return attr in ('read_text', 'read_bytes') or (attr == 'read' and not node.args and not node.keywords)
+
+
+class _PerfVisitor(ast.NodeVisitor):
+    """Collect performance findings, tracking whether code runs per iteration."""
+
+    def __init__(self) -> None:
+        self.loop_depth = 0
+        self.findings: list[dict[str, Any]] = []
+        self._reported: set[int] = set()
+
+    def _add(self, node: ast.AST, code: str, detail: str) -> None:
+        self.findings.append({
+            "line": node.lineno,
+            "col": node.col_offset,
+            "code": code,
+            "severity": PERF_CHECKS[code][0],
+            "message": detail,
+        })
+
+    def _in_loop(self, nodes) -> None:
+        self.loop_depth += 1
+        for node in nodes:
+            self.visit(node)
+        self.loop_depth -= 1
+
+    def visit_For(self, node: ast.For | ast.AsyncFor) -> None:
+        self.visit(node.target)
+        self.visit(node.iter)  # evaluated once
+        self._in_loop(node.body + node.orelse)
+
+    visit_AsyncFor = visit_For
+
+    def visit_While(self, node: ast.While) -> None:
+        self._in_loop([node.test, *node.body, *node.orelse])
+
+    def _visit_comprehension(self, node: ast.ListComp | ast.SetComp | ast.GeneratorExp | ast.DictComp) -> None:
+        first, *rest = node.generators
+        self.visit(first.iter)
+        parts: list[ast.AST] = [first.target, *first.ifs]
+        for generator in rest:
+            parts += [generator.target, generator.iter, *generator.ifs]
+        parts += [node.key, node.value] if isinstance(node, ast.DictComp) else [node.elt]
+        self._in_loop(parts)
+
+    visit_ListComp = visit_SetComp = visit_GeneratorExp = visit_DictComp = _visit_comprehension
+
+    def _visit_scope(self, node: ast.AST) -> None:
+        # A function or class defined in a loop body does not run per iteration
+        depth, self.loop_depth = self.loop_depth, 0
+        self.generic_visit(node)
+        self.loop_depth = depth
+
+    visit_FunctionDef = visit_AsyncFunctionDef = visit_Lambda = visit_ClassDef = _visit_scope
+
+    def visit_Call(self, node: ast.Call) -> None:
+        name = _call_name(node)
+        attr = node.func.attr if isinstance(node.func, ast.Attribute) else ""
+
+        if name == "json.loads" and node.args and _is_whole_read(node.args[0]):
+            self._reported.add(id(node.args[0]))
+            self._add(node, "json-loads-read", f"json.loads({_call_name(node.args[0])}())")
+        elif attr == "readlines" and not node.args:
+            self._add(node, "readlines", f"{name}()")
+        elif self.loop_depth:
+            if name in _SUBPROCESS_CALLS:
+                self._add(node, "subprocess-in-loop", f"{name}() inside a loop")
+            elif name == "re.compile":
+                # Compiling a list of distinct patterns in a loop is fine;
+                # recompiling the same literal every iteration is not
+                if node.args and isinstance(node.args[0], ast.Constant):
+                    self._add(node, "regex-compile-in-loop", "re.compile() of a literal inside a loop")
+            elif name in _REGEX_CALLS:
+                self._add(node, "regex-call-in-loop", f"{name}() inside a loop")
+            elif _is_whole_read(node) and id(node) not in self._reported:
+                self._add(node, "whole-file-read-in-loop", f"{name}() inside a loop")
+
+        self.generic_visit(node)
+
+
+def lint_tree(tree: ast.Module) -> list[dict[str, Any]]:
+    """Return performance findings for a parsed script, in line order."""
+    visitor = _PerfVisitor()
+    visitor.visit(tree)
+    return sorted(visitor.findings, key=lambda f: (f["line"], f["col"]))
+
+
+# `# noqa` silences every finding on its line, `# noqa: code, code` just those
+_NOQA_RE = re.compile(r'#\s*noqa\b(?::\s*([\w-]+(?:\s*,\s*[\w-]+)*))?')
+
+
+def drop_suppressed(findings: list[dict[str, Any]], source: str) -> list[dict[str, Any]]:
+    """Remove findings whose line carries a matching # noqa comment."""
+    lines = source.splitlines()
+    kept: list[dict[str, Any]] = []
+    for finding in findings:
+        line = lines[finding["line"] - 1] if finding["line"] <= len(lines) else ""
+        match = _NOQA_RE.search(line)
+        if match and (match.group(1) is None or finding["code"] in {code.strip() for code in match.group(1).split(',')}):
+            continue
+        kept.append(finding)
+    return kept
+
+
+# --- Analysis ---
+
+def analyze_source(source: str, name: str = "<script>") -> dict[str, Any]:
+    """Analyze one script's source without importing it.
+
+    Returns the module docstring, the CLI style ("argparse", "click",
+    "typer", "sys.argv" or None), whether a __main__ guard exists, the
+    statements that run at import time beyond definitions and imports,
+    top-level imports of heavyweight modules, and performance findings.
+    """
+    try:
+        tree = ast.parse(source, filename=name)
+    except (SyntaxError, ValueError) as exc:
+        line = getattr(exc, "lineno", None)
+        return {
+            "name": name,
+            "syntax_error": f"{getattr(exc, 'msg', exc)} (line {line})" if line else str(exc),
+            "docstring": None,
+            "main_guard": False,
+            "cli": None,
+            "side_effects": [],
+            "heavy_imports": [],
+            "perf": [],
+        }
+
+    imported: set[str] = set()
+    heavy_imports: list[dict[str, Any]] = []
+    side_effects: list[dict[str, Any]] = []
+
+    for node in _top_level(tree.body):
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            modules = (
+                [alias.name for alias in node.names] if isinstance(node, ast.Import)
+                else [node.module or ""] if node.level == 0 else []
+            )
+            for module in modules:
+                root = module.split(".")[0]
+                imported.add(root)
+                if root in HEAVY_MODULES:
+                    heavy_imports.append({"line": node.lineno, "module": module})
+            continue
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Pass)):
+            continue
+        if isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant):
+            continue  # docstring or bare constant
+        for call in _side_effect_calls(node):
+            side_effects.append({"line": call.lineno, "call": _call_name(call)})
+
+    main_guard = any(_is_main_guard(node) for node in tree.body)
+    uses_argv = any(
+        isinstance(node, ast.Attribute) and node.attr == "argv"
+        and isinstance(node.value, ast.Name) and node.value.id == "sys"
+        for node in ast.walk(tree)
+    )
+    cli = next((lib for lib in ("argparse", "click", "typer") if lib in imported), None)
+    if cli is None and uses_argv:
+        cli = "sys.argv"
+
+    return {
+        "name": name,
+        "syntax_error": None,
+        "docstring": ast.get_docstring(tree),
+        "main_guard": main_guard,
+        "cli": cli,
+        "side_effects": side_effects,
+        "heavy_imports": heavy_imports,
+        "perf": drop_suppressed(lint_tree(tree), source),
+    }
+
+
+def analyze_file(path: str) -> dict[str, Any]:
+    """Analyze one script file; top-level so it can run in a worker process."""
+    file_path = Path(path)
+    try:
+        source = file_path.read_text()
+    except (OSError, UnicodeDecodeError) as exc:
+        return {"name": file_path.name, "syntax_error": f"unreadable: {exc}", "docstring": None,
+                "main_guard": False, "cli": None, "side_effects": [], "heavy_imports": [], "perf": []}
+    return analyze_source(source, file_path.name)
+
+
+def script_cache_key(path: Path) -> str:
+    """Cache key for one script's analysis: analyzer version plus file hash.
+
+    Scripts with identical content share an entry, so the cached "name"
+    is replaced with the script's own on every hit.
+    """
+    return hash_inputs(["script-analysis", ANALYZER_VERSION, sha256_file(path)])
+
+
+def analyze_scripts(
+    paths: list[Path],
+    cache: ResultCache | None = None,
+    workers: int | None = None,
+) -> dict[Path, dict[str, Any]]:
+    """Analyze many scripts, reusing cached results keyed by file hash.
+
+    Misses are parsed on a process pool once there are at least
+    PARALLEL_MIN_SCRIPTS of them; inside a pool worker (catalog mode)
+    or with workers=1 they are parsed in-process.
+    """
+    results: dict[Path, dict[str, Any]] = {}
+    misses: list[tuple[Path, str | None]] = []
+
+    for path in paths:
+        key = None
+        if cache is not None:
+            try:
+                key = script_cache_key(path)
+            except OSError:
+                key = None
+            cached = cache.get(key) if key else None
+            if cached is not None:
+                results[path] = {**cached, "name": path.name}
+                continue
+        misses.append((path, key))
+
+    in_worker = multiprocessing.parent_process() is not None
+    if workers == 1 or in_worker or len(misses) < PARALLEL_MIN_SCRIPTS:
+        analyses = [analyze_file(str(path)) for path, _ in misses]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            analyses = list(pool.map(analyze_file, [str(path) for path, _ in misses]))
+
+    for (path, key), analysis in zip(misses, analyses):
+        results[path] = analysis
+        if cache is not None and key:
+            cache.put(key, analysis)
+
+    return results
+
+
+def lint_report(scripts: list[Path], analyses: dict[Path, dict[str, Any]]) -> dict[str, Any]:
+    """Flatten per-script performance findings into one machine-readable report."""
+    findings = [
+        {"script": analyses[path]["name"], **finding}
+        for path in scripts for finding in analyses[path]["perf"]
+    ]
+    counts = {severity: 0 for severity in SEVERITY_ORDER}
+    for finding in findings:
+        counts[finding["severity"].lower()] += 1
+    return {"findings": findings, "counts": counts}
+
+
+def find_scripts(path: Path) -> list[Path]:
+    """Return the *.py files of a skill's scripts/ directory (or of path itself)."""
+    scripts_dir = path / "scripts" if (path / "scripts").is_dir() else path
+    return sorted(scripts_dir.glob("*.py"))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Statically analyze a skill's bundled Python scripts"
+    )
+    parser.add_argument("path", help="Skill directory or scripts/ directory")
+    parser.add_argument(
+        "--workers", "-j", type=int, default=None,
+        help="Worker processes for uncached scripts (default: CPU count)"
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Analyze every script even if a cached result exists"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="Cache directory (default: ~/.cache/skill-forge/scripts)"
+    )
+    parser.add_argument(
+        "--lint", action="store_true",
+        help="Report only performance findings (script, line, col, code, severity)"
+    )
+    parser.add_argument(
+        "--fail-on", choices=[*SEVERITY_ORDER, "never"], default="medium",
+        help="With --lint: exit 1 if any finding is at or above this severity (default: medium)"
+    )
+    args = parser.parse_args()
+
+    target = Path(args.path).expanduser().resolve()
+    if not target.is_dir():
+        print(json.dumps({"error": f"Not a directory: {target}"}), file=sys.stderr)
+        sys.exit(1)
+    if args.workers is not None and args.workers < 1:
+        print(json.dumps({"error": "--workers must be >= 1"}), file=sys.stderr)
+        sys.exit(1)
+
+    cache = None
+    if not args.no_cache:
+        cache_dir = Path(args.cache_dir).expanduser() if args.cache_dir else default_cache_dir("scripts")
+        cache = ResultCache(cache_dir, DEFAULT_CACHE_MAX_BYTES)
+
+    scripts = find_scripts(target)
+    analyses = analyze_scripts(scripts, cache, args.workers)
+    if args.lint:
+        lint = lint_report(scripts, analyses)
+        failing = SEVERITY_ORDER[:SEVERITY_ORDER.index(args.fail_on) + 1] if args.fail_on != "never" else ()
+        failed = any(lint["counts"][severity] for severity in failing)
+        report = {"status": "fail" if failed else "pass", "path": str(target), **lint}
+    else:
+        failed = False
+        report = {
+            "status": "success",
+            "path": str(target),
+            "scripts": [analyses[path] for path in scripts],
+        }
+    if cache is not None:
+        report["cache"] = {"hits": cache.hits, "misses": cache.misses}
+        cache.prune()
+    print(json.dumps(report, indent=2))
+
+    if failed:
+        sys.exit(1)
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Purpose: Measure frontmatter parser throughput on a large synthetic SKILL.md corpus.
+Input: Corpus size, body size, and repeat count
+Output: JSON report with documents/sec and MB/sec for the shared parser
+Usage: python scripts/benchmark_frontmatter.py [--docs 5000] [--body-lines 400] [--repeat 3]
+
+Each synthetic document mixes the frontmatter shapes seen in real catalogs:
+folded descriptions, allowed-tools lists, metadata maps, and nested hooks.
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from typing import Any
+
+from skill_utils import parse_frontmatter
+
+
+def make_document(index: int, body_lines: int, rng: random.Random) -> str:
+    """Build one synthetic SKILL.md document."""
+    words = ["audit", "deploy", "schema", "review", "pipeline", "render", "migrate", "lint"]
+    triggers = ", ".join(f'"{rng.choice(words)} {rng.choice(words)}"' for _ in range(6))
+    lines = [
+        "---",
+        f"name: synthetic-skill-{index}",
+        "description: >",
+        f"  Synthetic skill number {index} used for parser benchmarking. Handles",
+        f"  {rng.choice(words)} and {rng.choice(words)} workflows end to end.",
+        f"  Use when user says {triggers}.",
+        "allowed-tools:",
+        "  - Read",
+        "  - Grep",
+        "  - Bash(git:*)",
+        "metadata:",
+        "  author: bench",
+        f"  version: 1.{index % 10}.0",
+        "hooks:",
+        "  PreToolUse:",
+        '    - matcher: "Write"',
+        "      hooks:",
+        "        - type: prompt",
+        '          prompt: "Validate the write operation"',
+        "          once: true",
+        "---",
+        "",
+        f"# Synthetic Skill {index}",
+        "",
+    ]
+    for i in range(body_lines):
+        if i % 40 == 0:
+            lines.append(f"## Section {i // 40}")
+        else:
+            lines.append(f"Step {i}: {rng.choice(words)} the {rng.choice(words)} --- then continue.")
+    return "\n".join(lines) + "\n"
+
+
+def run_benchmark(docs: int, body_lines: int, repeat: int, seed: int = 42) -> dict[str, Any]:
+    """Parse the synthetic corpus repeat times and report the best throughput."""
+    rng = random.Random(seed)
+    corpus = [make_document(i, body_lines, rng) for i in range(docs)]
+    total_bytes = sum(len(doc.encode()) for doc in corpus)
+
+    timings: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for doc in corpus:
+            frontmatter, _, errors = parse_frontmatter(doc)
+            if not frontmatter or errors:
+                return {"error": f"Parser rejected a synthetic document: {errors}"}
+        timings.append(time.perf_counter() - start)
+
+    best = min(timings)
+    return {
+        "status": "success",
+        "documents": docs,
+        "body_lines": body_lines,
+        "corpus_bytes": total_bytes,
+        "repeat": repeat,
+        "best_seconds": round(best, 4),
+        "docs_per_second": round(docs / best, 1) if best > 0 else 0.0,
+        "mb_per_second": round(total_bytes / best / 1_000_000, 2) if best > 0 else 0.0,
+        "all_seconds": [round(t, 4) for t in timings],
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark the shared SKILL.md frontmatter parser"
+    )
+    parser.add_argument(
+        "--docs", type=int, default=5000,
+        help="Number of synthetic documents (default: 5000)"
+    )
+    parser.add_argument(
+        "--body-lines", type=int, default=400,
+        help="Body lines per document (default: 400)"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3,
+        help="Timed passes over the corpus; best is reported (default: 3)"
+    )
+    parser.add_argument(
+        "--seed", type=int, default=42,
+        help="Random seed for corpus generation (default: 42)"
+    )
+    args = parser.parse_args()
+
+    if args.docs < 1 or args.repeat < 1 or args.body_lines < 0:
+        print(json.dumps({"error": "--docs and --repeat must be >= 1, --body-lines >= 0"}), file=sys.stderr)
+        sys.exit(1)
+
+    result = run_benchmark(args.docs, args.body_lines, args.repeat, args.seed)
+    print(json.dumps(result, indent=2))
+
+    if "error" in result:
+        sys.exit(1)
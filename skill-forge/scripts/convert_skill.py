@@ -1,19 +1,39 @@
 #!/usr/bin/env python3
 """
 Purpose: Convert Claude Code skills to work on OpenAI Codex, Gemini CLI, Antigravity, and Cursor.
-Input: Path to a skill directory, target platforms, optional output directory
+Input: Path to a skill directory (or --catalog ROOT), target platforms, optional output directory
 Output: JSON conversion report with generated files and compatibility scores
-Usage: python scripts/convert_skill.py /path/to/skill --target codex,gemini,antigravity,cursor [--output dist/] [--dry-run] [--include-mcp]
+Usage: python scripts/convert_skill.py /path/to/skill --target codex,gemini,antigravity,cursor [--output dist/] [--dry-run] [--include-mcp] [--jobs 4] [--force]
+       python scripts/convert_skill.py --catalog ~/.claude/skills [--output dist/] [--workers 8]
+
+Platform generators run concurrently on a bounded thread pool (they are
+dominated by file copies and writes); results are merged in target order.
+scripts/ and references/ are stored once per content under <output>/.assets
+and placed into each platform tree as reflinks, hard links or copies.
+Reruns are incremental: a manifest under <output>/.convert-manifests records
+each target's input hashes and outputs, so only targets whose inputs
+changed are regenerated, unchanged files are left untouched, and outputs
+that are no longer produced are deleted (--force regenerates everything).
+--catalog converts every skill under ROOT on a process pool, computing
+tiers from a single listing of each agents/ and skills/ directory, and
+writes one aggregated report and one install script.
 """
 
 import argparse
+import errno
 import json
 import os
 import re
 import shutil
 import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
+
+from skill_utils import SkillDocument, hash_inputs, read_frontmatter, sha256_file
+from validate_skill import discover_catalog
 
 
 # --- Field Classification ---
@@ -70,109 +90,74 @@ PLATFORM_MCP_FILES = {
 }
 
 
-# --- Frontmatter Parsing (reused from validate_skill.py) ---
+# --- Tier Detection ---
 
-def parse_frontmatter(content: str) -> tuple[dict[str, Any] | None, str, list[str]]:
-    """Parse YAML frontmatter from SKILL.md content.
+class TierIndex:
+    """Which skill names own agents or sub-skills, per parent directory.
 
-    Returns (frontmatter_dict, body, errors).
-    Uses basic parsing to avoid PyYAML dependency.
+    A skill owns agents/<name>-*.md and skills/<name>-*/ beside it. Each
+    parent's agents/ and skills/ are listed once, on first use, into the
+    set of every hyphen-delimited prefix of their entries, so a tier is a
+    few set lookups instead of two globs per skill.
     """
-    errors: list[str] = []
-
-    if not content.startswith('---'):
-        return None, content, ["Missing opening '---' delimiter"]
-
-    parts = content.split('---', 2)
-    if len(parts) < 3:
-        return None, content, ["Missing closing '---' delimiter"]
-
-    yaml_text = parts[1].strip()
-    body = parts[2].strip()
-
-    if not yaml_text:
-        return None, body, ["Empty frontmatter"]
-
-    frontmatter: dict[str, Any] = {}
-    current_key = ""
-    current_value = ""
-    in_multiline = False
-    in_list = False
-    current_list: list[str] = []
 
-    for line in yaml_text.split('\n'):
-        stripped = line.strip()
+    __slots__ = ('_owners',)
 
-        if in_multiline:
-            if stripped and not re.match(r'^[a-z_-]+:', stripped):
-                current_value += " " + stripped
-                continue
-            else:
-                frontmatter[current_key] = current_value.strip()
-                in_multiline = False
+    def __init__(self) -> None:
+        self._owners: dict[Path, tuple[set[str], set[str]]] = {}
 
-        if in_list:
-            if stripped.startswith('- '):
-                current_list.append(stripped[2:].strip())
+    @staticmethod
+    def _prefixes(names: Iterable[str]) -> set[str]:
+        # "a-b-c" is matched by the patterns "a-*" and "a-b-*"
+        owners: set[str] = set()
+        for name in names:
+            if name.startswith('.'):
                 continue
-            else:
-                frontmatter[current_key] = current_list
-                in_list = False
-                current_list = []
-
-        match = re.match(r'^([a-z_-]+):\s*(.*)', stripped)
-        if match:
-            current_key = match.group(1)
-            value = match.group(2).strip()
-
-            if value == '>':
-                in_multiline = True
-                current_value = ""
-            elif value == '|':
-                in_multiline = True
-                current_value = ""
-            elif value == '':
-                in_list = True
-                current_list = []
-            else:
-                frontmatter[current_key] = value.strip('"').strip("'")
+            cut = name.find('-')
+            while cut != -1:
+                owners.add(name[:cut])
+                cut = name.find('-', cut + 1)
+        return owners
+
+    @staticmethod
+    def _list(directory: Path, dirs: bool) -> list[str]:
+        try:
+            with os.scandir(directory) as entries:
+                if dirs:
+                    return [e.name for e in entries if e.is_dir()]
+                return [e.name[:-3] for e in entries if e.name.endswith(".md")]
+        except OSError:
+            return []
+
+    def owners(self, parent: Path) -> tuple[set[str], set[str]]:
+        """(names owning agents, names owning sub-skills) under parent."""
+        owners = self._owners.get(parent)
+        if owners is None:
+            owners = (
+                self._prefixes(self._list(parent / "agents", dirs=False)),
+                self._prefixes(self._list(parent / "skills", dirs=True)),
+            )
+            self._owners[parent] = owners
+        return owners
+
+    def tier(self, skill_path: Path) -> int:
+        """Skill complexity tier (1-4) from directory structure."""
+        agent_owners, sub_skill_owners = self.owners(skill_path.parent)
+        has_agents = skill_path.name in agent_owners
+        has_sub_skills = skill_path.name in sub_skill_owners
+
+        if has_agents and has_sub_skills:
+            return 4  # Full ecosystem
+        if has_sub_skills:
+            return 3  # Multi-skill orchestrator
+        if (skill_path / "scripts").is_dir() or (skill_path / "references").is_dir():
+            return 2  # Skill + scripts/references
+        return 1  # Single skill
 
-    if in_multiline:
-        frontmatter[current_key] = current_value.strip()
-    if in_list and current_list:
-        frontmatter[current_key] = current_list
-
-    return frontmatter, body, errors
-
-
-# --- Tier Detection ---
 
 def detect_skill_tier(skill_path: Path) -> int:
     """Detect skill complexity tier (1-4) from directory structure."""
-    has_scripts = (skill_path / "scripts").is_dir()
-    has_references = (skill_path / "references").is_dir()
-    has_agents = False
-    has_sub_skills = False
-
-    # Check parent directory for agents/ and skills/ folders
-    parent = skill_path.parent
-    skill_name = skill_path.name
-
-    agents_dir = parent / "agents"
-    if agents_dir.is_dir():
-        has_agents = any(agents_dir.glob(f"{skill_name}-*.md"))
-
-    skills_dir = parent / "skills"
-    if skills_dir.is_dir():
-        has_sub_skills = any(skills_dir.glob(f"{skill_name}-*/"))
-
-    if has_agents and has_sub_skills:
-        return 4  # Full ecosystem
-    if has_sub_skills:
-        return 3  # Multi-skill orchestrator
-    if has_scripts or has_references:
-        return 2  # Skill + scripts/references
-    return 1  # Single skill
+    return TierIndex().tier(skill_path)
 
 
 # --- Field Classification ---
@@ -215,7 +200,8 @@ def calculate_compatibility_score(classification: dict[str, list[str]]) -> int:
 
 # --- Body Content Adaptation ---
 
-# Patterns to find and replace in skill body text per platform
+# Patterns to find and replace in skill body text per platform; replacements
+# are inserted literally (no backreferences)
 BODY_REPLACEMENTS: dict[str, list[tuple[str, str]]] = {
     "codex": [
         (r'~/\.claude/skills/', '~/.agents/skills/'),
@@ -259,31 +245,116 @@ BODY_WARNING_PATTERNS: list[tuple[str, str]] = [
 ]
 
 
-def adapt_body_content(body: str, target: str) -> tuple[str, list[str]]:
+def _first_char(pattern: str) -> str | None:
+    """The literal character every match of pattern starts with, if obvious."""
+    pattern = pattern.removeprefix(r'\b')
+    if pattern[:1] == '\\' and len(pattern) > 1 and not pattern[1].isalnum():
+        return pattern[1]
+    if pattern and pattern[0] not in '.^$*+?{}[]\\|()':
+        return pattern[0]
+    return None
+
+
+def _compile_body_scanner() -> tuple[re.Pattern[str], list[tuple[str, Any]]]:
+    """Combine every target's replacements and the warning patterns into one regex.
+
+    Each pattern becomes one capturing alternative; the dispatch table,
+    indexed by the alternative's group number (match.lastindex), holds
+    ("replace", pattern) or ("warn", message index). At any position the
+    earliest-listed pattern wins, which keeps each target's list order.
+    The tables are written so that replacement and warning patterns
+    never overlap. When every alternative starts with a known literal, a
+    lookahead on those characters lets the engine skip all other
+    positions without trying each alternative.
+    """
+    alternatives: list[str] = []
+    dispatch: list[tuple[str, Any]] = [("", None)]
+    for replacements in BODY_REPLACEMENTS.values():
+        for pattern, _ in replacements:
+            if ("replace", pattern) not in dispatch:
+                alternatives.append(pattern)
+                dispatch.append(("replace", pattern))
+                dispatch.extend([("", None)] * re.compile(pattern).groups)
+    for index, (pattern, _) in enumerate(BODY_WARNING_PATTERNS):
+        alternatives.append(pattern)
+        dispatch.append(("warn", index))
+        dispatch.extend([("", None)] * re.compile(pattern).groups)
+    combined = "|".join(f"({p})" for p in alternatives)
+    first = [_first_char(p) for p in alternatives]
+    if all(first):
+        combined = f"(?=[{''.join(re.escape(c) for c in sorted(set(first)))}])(?:{combined})"
+    return re.compile(combined), dispatch
+
+
+_BODY_SCAN_RE, _BODY_DISPATCH = _compile_body_scanner()
+
+
+def scan_body_findings(document: SkillDocument) -> list[dict[str, Any]]:
+    """Every manual-review match in the body with its offset and file line."""
+    findings: list[dict[str, Any]] = []
+    for match in document.find_all(_BODY_SCAN_RE):
+        kind, index = _BODY_DISPATCH[match.lastindex]
+        if kind == "warn":
+            findings.append({
+                "line": document.line_number(match.start()),
+                "offset": match.start(),
+                "text": match.group(0).strip(),
+                "message": BODY_WARNING_PATTERNS[index][1],
+            })
+    return findings
+
+
+def adapt_body_content(
+    body: str,
+    target: str,
+    document: SkillDocument | None = None,
+) -> tuple[str, list[str]]:
     """Adapt skill body content for a target platform.
 
     Replaces Claude-specific paths, file references, and config names.
     Returns (adapted_body, warnings) where warnings list things that
-    need manual review.
+    need manual review. The body is scanned once by a single combined
+    regex; when the skill's SkillDocument is passed, that scan is memoized
+    on it and shared by every target, so converting to all targets stays
+    linear in body size.
     """
-    adapted = body
-    warnings: list[str] = []
+    if document is None or document.body is not body:
+        document = SkillDocument.from_body(body)
+
+    replacements = dict(BODY_REPLACEMENTS.get(target, []))
+    pieces: list[str] = []
+    position = 0
+    fired: set[str] = set()
+    examples: dict[int, list[re.Match[str]]] = {}
+
+    for match in document.find_all(_BODY_SCAN_RE):
+        kind, key = _BODY_DISPATCH[match.lastindex]
+        if kind == "warn":
+            examples.setdefault(key, []).append(match)
+        elif key in replacements:
+            pieces.append(body[position:match.start()])
+            pieces.append(replacements[key])
+            position = match.end()
+            fired.add(key)
+    pieces.append(body[position:])
+    adapted = "".join(pieces)
+
+    warnings = [
+        f"Auto-replaced '{pattern.replace(chr(92), '')}' -> '{replacement}' in body text."
+        for pattern, replacement in BODY_REPLACEMENTS.get(target, [])
+        if pattern in fired
+    ]
 
-    # Apply automatic replacements
-    replacements = BODY_REPLACEMENTS.get(target, [])
-    for pattern, replacement in replacements:
-        new_text = re.sub(pattern, replacement, adapted)
-        if new_text != adapted:
-            warnings.append(f"Auto-replaced '{pattern.replace(chr(92), '')}' -> '{replacement}' in body text.")
-        adapted = new_text
-
-    # Scan for patterns that need manual attention
-    for pattern, message in BODY_WARNING_PATTERNS:
-        matches = re.findall(pattern, body)
+    # Patterns that need manual attention
+    for index, (_, message) in enumerate(BODY_WARNING_PATTERNS):
+        matches = examples.get(index)
         if matches:
-            unique = list(set(matches))[:3]  # Show up to 3 examples
-            examples = ", ".join(f"'{m.strip()}'" for m in unique)
-            warnings.append(f"Manual review needed: {message} Found: {examples}")
+            unique: dict[str, int] = {}
+            for m in matches:
+                unique.setdefault(m.group(0), document.line_number(m.start()))
+            shown = list(unique.items())[:3]  # Show up to 3 examples
+            found = ", ".join(f"'{text.strip()}' (line {line})" for text, line in shown)
+            warnings.append(f"Manual review needed: {message} Found: {found}")
 
     return adapted, warnings
 
@@ -352,6 +423,206 @@ def generate_frontmatter_text(fm: dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
+# --- Asset Materialization ---
+
+ASSET_STORE_DIR = ".assets"
+
+# Linux FICLONE ioctl: share the source's extents copy-on-write (btrfs, XFS, ...)
+_FICLONE = 0x40049409
+
+
+class AssetStore:
+    """Place identical asset files into several output trees without copying them.
+
+    Each destination is, in order of preference: a reflink of the source
+    (copy-on-write, so the trees stay independent), a hard link to a
+    content-addressed object under root (written once per content and
+    mode, never to the source, so editing an output cannot change the
+    skill), or a plain copy. A destination that already holds the same
+    content and mode is left untouched. Safe to share between generator
+    threads: every placement lands via a temporary name and os.replace.
+    """
+
+    __slots__ = ('root', 'reflink', 'hardlink', '_hashes', '_verified', '_lock', '_object_locks', 'counts')
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.reflink = sys.platform.startswith("linux")
+        self.hardlink = True
+        self._hashes: dict[Path, tuple[str, int, int]] = {}
+        self._verified: set[Path] = set()
+        self._lock = threading.Lock()
+        self._object_locks: dict[Path, threading.Lock] = {}
+        self.counts = {"reflink": 0, "hardlink": 0, "copy": 0, "unchanged": 0, "pruned": 0}
+
+    def _source_info(self, src: Path) -> tuple[str, int, int]:
+        """(sha256, size, permission bits) of a source file, hashed once per run."""
+        info = self._hashes.get(src)
+        if info is None:
+            stat = src.stat()
+            info = (sha256_file(src), stat.st_size, stat.st_mode & 0o777)
+            self._hashes[src] = info
+        return info
+
+    def remember(self, src: Path, sha: str, size: int, mode: int) -> None:
+        """Record a source file's hash computed elsewhere, so it is not re-read."""
+        self._hashes[src] = (sha, size, mode & 0o777)
+
+    def _try_reflink(self, src: Path, tmp: Path) -> bool:
+        if not self.reflink:
+            return False
+        import fcntl
+        try:
+            with open(src, 'rb') as source, open(tmp, 'wb') as dest:
+                fcntl.ioctl(dest.fileno(), _FICLONE, source.fileno())
+            shutil.copymode(src, tmp)
+            return True
+        except OSError as exc:
+            tmp.unlink(missing_ok=True)
+            if exc.errno in (errno.EOPNOTSUPP, errno.ENOTTY, errno.EXDEV, errno.EINVAL):
+                self.reflink = False
+            return False
+
+    def _object(self, src: Path, sha: str, mode: int) -> Path:
+        """The store's copy of src, written on first use.
+
+        An existing object is re-hashed once per run before anything links
+        to it: an output edited in place writes through to the shared inode,
+        and such an object is replaced by a fresh one.
+        """
+        obj = self.root / sha[:2] / f"{sha}-{mode:o}"
+        if obj in self._verified:
+            return obj
+        with self._lock:
+            lock = self._object_locks.setdefault(obj, threading.Lock())
+        with lock:
+            if obj in self._verified:
+                return obj
+            try:
+                intact = obj.stat().st_mode & 0o777 == mode and sha256_file(obj) == sha
+            except OSError:
+                intact = False
+            if not intact:
+                obj.parent.mkdir(parents=True, exist_ok=True)
+                tmp = obj.with_name(f"{obj.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+                try:
+                    if not self._try_reflink(src, tmp):
+                        shutil.copy2(src, tmp)
+                    os.replace(tmp, obj)
+                finally:
+                    tmp.unlink(missing_ok=True)
+            self._verified.add(obj)
+        return obj
+
+    def place(self, src: Path, dst: Path) -> str:
+        """Materialize src at dst; returns how: reflink, hardlink, copy or unchanged."""
+        sha, size, mode = self._source_info(src)
+        try:
+            stat = dst.stat()
+            if stat.st_nlink > 1 and self.hardlink:
+                # Already a link to the (verified) store object: nothing to compare
+                obj = self._object(src, sha, mode)
+                linked = os.path.samestat(stat, obj.stat())
+            else:
+                linked = False
+            if linked or (
+                stat.st_size == size and stat.st_mode & 0o777 == mode and sha256_file(dst) == sha
+            ):
+                with self._lock:
+                    self.counts["unchanged"] += 1
+                return "unchanged"
+        except OSError:
+            pass
+
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        tmp = dst.with_name(f".{dst.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            if self._try_reflink(src, tmp):
+                how = "reflink"
+            else:
+                how = "copy"
+                if self.hardlink:
+                    try:
+                        os.link(self._object(src, sha, mode), tmp)
+                        how = "hardlink"
+                    except OSError:
+                        self.hardlink = False
+                if how == "copy":
+                    shutil.copy2(src, tmp)
+            os.replace(tmp, dst)
+        finally:
+            tmp.unlink(missing_ok=True)
+        with self._lock:
+            self.counts[how] += 1
+        return how
+
+    def place_tree(self, src_dir: Path, dst_dir: Path) -> list[Path]:
+        """Materialize every file under src_dir at the same place under dst_dir.
+
+        Returns the destination paths in sorted order.
+        """
+        placed: list[Path] = []
+        for dirpath, dirnames, filenames in os.walk(src_dir, followlinks=True):
+            dirnames.sort()
+            rel = Path(dirpath).relative_to(src_dir)
+            for name in sorted(filenames):
+                dst = dst_dir / rel / name
+                self.place(Path(dirpath) / name, dst)
+                placed.append(dst)
+        return placed
+
+    def prune(self) -> int:
+        """Delete objects no output links to any more; returns how many.
+
+        An object with a single link is only referenced by the store
+        itself. Call once no placement is in progress.
+        """
+        removed = 0
+        try:
+            shards = [entry.path for entry in os.scandir(self.root) if entry.is_dir(follow_symlinks=False)]
+        except OSError:
+            return 0
+        for shard in shards:
+            with os.scandir(shard) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file(follow_symlinks=False) and entry.stat(follow_symlinks=False).st_nlink == 1:
+                            os.unlink(entry.path)
+                            removed += 1
+                    except OSError:
+                        pass
+            try:
+                os.rmdir(shard)
+            except OSError:
+                pass  # Still holds live objects
+        self._verified.clear()
+        self.counts["pruned"] += removed
+        return removed
+
+    def stats(self) -> dict[str, Any]:
+        """Placement counts by method, for the conversion report."""
+        return {"store": str(self.root), **self.counts}
+
+
+def copy_skill_assets(
+    skill_path: Path, target_dir: Path, platform_root: Path, assets: AssetStore | None
+) -> list[str]:
+    """Materialize scripts/ and references/ into target_dir.
+
+    Returns the placed files relative to platform_root. Without an
+    AssetStore, a private one under platform_root's parent is used.
+    """
+    if assets is None:
+        assets = AssetStore(platform_root.parent / ASSET_STORE_DIR)
+    files: list[str] = []
+    for folder in ("scripts", "references"):
+        src = skill_path / folder
+        if src.is_dir():
+            for dst in assets.place_tree(src, target_dir / folder):
+                files.append(str(dst.relative_to(platform_root)))
+    return files
+
+
 # --- Platform-Specific Generators ---
 
 def generate_openai_yaml(fm: dict[str, Any]) -> str:
@@ -420,13 +691,16 @@ def generate_codex_output(
     fm: dict[str, Any],
     body: str,
     output_dir: Path,
+    document: SkillDocument | None = None,
+    assets: AssetStore | None = None,
+    tier: int | None = None,
 ) -> dict[str, Any]:
     """Generate Codex-compatible skill output."""
     cleaned_fm, warnings = strip_claude_fields(fm, "codex")
     manual_steps: list[str] = []
 
     # Adapt body content for Codex
-    adapted_body, body_warnings = adapt_body_content(body, "codex")
+    adapted_body, body_warnings = adapt_body_content(body, "codex", document)
     warnings.extend(body_warnings)
 
     skill_name = fm.get("name", skill_path.name)
@@ -439,41 +713,27 @@ def generate_codex_output(
 
     # Generate SKILL.md with cleaned frontmatter and adapted body
     skill_md_content = generate_frontmatter_text(cleaned_fm) + "\n\n" + adapted_body
-    (target_dir / "SKILL.md").write_text(skill_md_content)
+    write_if_changed(target_dir / "SKILL.md", skill_md_content)
     files_created.append(f"{skill_name}/SKILL.md")
 
     # Generate openai.yaml
     agents_dir = target_dir / "agents"
     agents_dir.mkdir(exist_ok=True)
     openai_yaml = generate_openai_yaml(fm)
-    (agents_dir / "openai.yaml").write_text(openai_yaml)
+    write_if_changed(agents_dir / "openai.yaml", openai_yaml)
     files_created.append(f"{skill_name}/agents/openai.yaml")
 
     # Generate AGENTS.md with adapted body
     agents_md = generate_instruction_file(fm, adapted_body, "codex")
-    (target_dir / "AGENTS.md").write_text(agents_md)
+    write_if_changed(target_dir / "AGENTS.md", agents_md)
     files_created.append(f"{skill_name}/AGENTS.md")
 
-    # Copy scripts if present
-    src_scripts = skill_path / "scripts"
-    if src_scripts.is_dir():
-        dst_scripts = target_dir / "scripts"
-        shutil.copytree(src_scripts, dst_scripts, dirs_exist_ok=True)
-        for f in dst_scripts.rglob("*"):
-            if f.is_file():
-                files_created.append(str(f.relative_to(output_dir / "codex")))
-
-    # Copy references if present
-    src_refs = skill_path / "references"
-    if src_refs.is_dir():
-        dst_refs = target_dir / "references"
-        shutil.copytree(src_refs, dst_refs, dirs_exist_ok=True)
-        for f in dst_refs.rglob("*"):
-            if f.is_file():
-                files_created.append(str(f.relative_to(output_dir / "codex")))
+    # Materialize scripts and references (reflink / hardlink / copy)
+    files_created.extend(copy_skill_assets(skill_path, target_dir, output_dir / "codex", assets))
 
     # Tier 3-4 notes
-    tier = detect_skill_tier(skill_path)
+    if tier is None:
+        tier = detect_skill_tier(skill_path)
     if tier >= 3:
         manual_steps.append("Routing table uses Claude Code slash commands. Adapt to Codex $mention syntax.")
     if tier >= 4:
@@ -495,13 +755,16 @@ def generate_gemini_output(
     fm: dict[str, Any],
     body: str,
     output_dir: Path,
+    document: SkillDocument | None = None,
+    assets: AssetStore | None = None,
+    tier: int | None = None,
 ) -> dict[str, Any]:
     """Generate Gemini CLI compatible skill output."""
     cleaned_fm, warnings = strip_claude_fields(fm, "gemini")
     manual_steps: list[str] = []
 
     # Adapt body content for Gemini
-    adapted_body, body_warnings = adapt_body_content(body, "gemini")
+    adapted_body, body_warnings = adapt_body_content(body, "gemini", document)
     warnings.extend(body_warnings)
 
     skill_name = fm.get("name", skill_path.name)
@@ -513,33 +776,19 @@ def generate_gemini_output(
 
     # Generate SKILL.md with cleaned frontmatter and adapted body
     skill_md_content = generate_frontmatter_text(cleaned_fm) + "\n\n" + adapted_body
-    (target_dir / "SKILL.md").write_text(skill_md_content)
+    write_if_changed(target_dir / "SKILL.md", skill_md_content)
     files_created.append(f"{skill_name}/SKILL.md")
 
     # Generate GEMINI.md with adapted body
     gemini_md = generate_instruction_file(fm, adapted_body, "gemini")
-    (target_dir / "GEMINI.md").write_text(gemini_md)
+    write_if_changed(target_dir / "GEMINI.md", gemini_md)
     files_created.append(f"{skill_name}/GEMINI.md")
 
-    # Copy scripts if present
-    src_scripts = skill_path / "scripts"
-    if src_scripts.is_dir():
-        dst_scripts = target_dir / "scripts"
-        shutil.copytree(src_scripts, dst_scripts, dirs_exist_ok=True)
-        for f in dst_scripts.rglob("*"):
-            if f.is_file():
-                files_created.append(str(f.relative_to(output_dir / "gemini")))
-
-    # Copy references if present
-    src_refs = skill_path / "references"
-    if src_refs.is_dir():
-        dst_refs = target_dir / "references"
-        shutil.copytree(src_refs, dst_refs, dirs_exist_ok=True)
-        for f in dst_refs.rglob("*"):
-            if f.is_file():
-                files_created.append(str(f.relative_to(output_dir / "gemini")))
-
-    tier = detect_skill_tier(skill_path)
+    # Materialize scripts and references (reflink / hardlink / copy)
+    files_created.extend(copy_skill_assets(skill_path, target_dir, output_dir / "gemini", assets))
+
+    if tier is None:
+        tier = detect_skill_tier(skill_path)
     if tier >= 3:
         manual_steps.append("Routing table uses Claude Code slash commands. Gemini relies on description-based activation.")
     if tier >= 4:
@@ -561,13 +810,16 @@ def generate_antigravity_output(
     fm: dict[str, Any],
     body: str,
     output_dir: Path,
+    document: SkillDocument | None = None,
+    assets: AssetStore | None = None,
+    tier: int | None = None,
 ) -> dict[str, Any]:
     """Generate Antigravity compatible skill output."""
     cleaned_fm, warnings = strip_claude_fields(fm, "antigravity")
     manual_steps: list[str] = []
 
     # Adapt body content for Antigravity
-    adapted_body, body_warnings = adapt_body_content(body, "antigravity")
+    adapted_body, body_warnings = adapt_body_content(body, "antigravity", document)
     warnings.extend(body_warnings)
 
     skill_name = fm.get("name", skill_path.name)
@@ -579,33 +831,19 @@ def generate_antigravity_output(
 
     # Generate SKILL.md (name is optional on Antigravity but we keep it) with adapted body
     skill_md_content = generate_frontmatter_text(cleaned_fm) + "\n\n" + adapted_body
-    (target_dir / "SKILL.md").write_text(skill_md_content)
+    write_if_changed(target_dir / "SKILL.md", skill_md_content)
     files_created.append(f"{skill_name}/SKILL.md")
 
     # Generate GEMINI.md with adapted body
     gemini_md = generate_instruction_file(fm, adapted_body, "antigravity")
-    (target_dir / "GEMINI.md").write_text(gemini_md)
+    write_if_changed(target_dir / "GEMINI.md", gemini_md)
     files_created.append(f"{skill_name}/GEMINI.md")
 
-    # Copy scripts if present
-    src_scripts = skill_path / "scripts"
-    if src_scripts.is_dir():
-        dst_scripts = target_dir / "scripts"
-        shutil.copytree(src_scripts, dst_scripts, dirs_exist_ok=True)
-        for f in dst_scripts.rglob("*"):
-            if f.is_file():
-                files_created.append(str(f.relative_to(output_dir / "antigravity")))
-
-    # Copy references if present
-    src_refs = skill_path / "references"
-    if src_refs.is_dir():
-        dst_refs = target_dir / "references"
-        shutil.copytree(src_refs, dst_refs, dirs_exist_ok=True)
-        for f in dst_refs.rglob("*"):
-            if f.is_file():
-                files_created.append(str(f.relative_to(output_dir / "antigravity")))
-
-    tier = detect_skill_tier(skill_path)
+    # Materialize scripts and references (reflink / hardlink / copy)
+    files_created.extend(copy_skill_assets(skill_path, target_dir, output_dir / "antigravity", assets))
+
+    if tier is None:
+        tier = detect_skill_tier(skill_path)
     if tier >= 3:
         manual_steps.append("Routing table is Claude Code specific. Antigravity uses description-based activation.")
     if tier >= 4:
@@ -663,13 +901,16 @@ def generate_cursor_output(
     fm: dict[str, Any],
     body: str,
     output_dir: Path,
+    document: SkillDocument | None = None,
+    assets: AssetStore | None = None,
+    tier: int | None = None,
 ) -> dict[str, Any]:
     """Generate Cursor-compatible skill output."""
     cleaned_fm, warnings = strip_claude_fields(fm, "cursor")
     manual_steps: list[str] = []
 
     # Adapt body content for Cursor
-    adapted_body, body_warnings = adapt_body_content(body, "cursor")
+    adapted_body, body_warnings = adapt_body_content(body, "cursor", document)
     warnings.extend(body_warnings)
 
     skill_name = fm.get("name", skill_path.name)
@@ -681,35 +922,21 @@ def generate_cursor_output(
 
     # Generate SKILL.md with cleaned frontmatter and adapted body
     skill_md_content = generate_frontmatter_text(cleaned_fm) + "\n\n" + adapted_body
-    (target_dir / "SKILL.md").write_text(skill_md_content)
+    write_if_changed(target_dir / "SKILL.md", skill_md_content)
     files_created.append(f"{skill_name}/SKILL.md")
 
     # Generate .cursor/rules/<name>.mdc rule file
     rules_dir = target_dir / "rules"
     rules_dir.mkdir(exist_ok=True)
     cursor_rule = generate_cursor_rule(fm, adapted_body)
-    (rules_dir / f"{skill_name}.mdc").write_text(cursor_rule)
+    write_if_changed(rules_dir / f"{skill_name}.mdc", cursor_rule)
     files_created.append(f"{skill_name}/rules/{skill_name}.mdc")
 
-    # Copy scripts if present
-    src_scripts = skill_path / "scripts"
-    if src_scripts.is_dir():
-        dst_scripts = target_dir / "scripts"
-        shutil.copytree(src_scripts, dst_scripts, dirs_exist_ok=True)
-        for f in dst_scripts.rglob("*"):
-            if f.is_file():
-                files_created.append(str(f.relative_to(output_dir / "cursor")))
-
-    # Copy references if present
-    src_refs = skill_path / "references"
-    if src_refs.is_dir():
-        dst_refs = target_dir / "references"
-        shutil.copytree(src_refs, dst_refs, dirs_exist_ok=True)
-        for f in dst_refs.rglob("*"):
-            if f.is_file():
-                files_created.append(str(f.relative_to(output_dir / "cursor")))
-
-    tier = detect_skill_tier(skill_path)
+    # Materialize scripts and references (reflink / hardlink / copy)
+    files_created.extend(copy_skill_assets(skill_path, target_dir, output_dir / "cursor", assets))
+
+    if tier is None:
+        tier = detect_skill_tier(skill_path)
     if tier >= 3:
         manual_steps.append("Routing table is Claude Code specific. Cursor uses description-based activation.")
     if tier >= 4:
@@ -737,7 +964,8 @@ def convert_mcp_json_to_toml(mcp_json_path: Path) -> str | None:
         return None
 
     try:
-        data = json.loads(mcp_json_path.read_text())
+        with open(mcp_json_path, 'rb') as f:
+            data = json.load(f)
     except (json.JSONDecodeError, OSError):
         return None
 
@@ -783,7 +1011,8 @@ def convert_mcp_json_for_json_platform(mcp_json_path: Path, platform: str) -> st
         return None
 
     try:
-        data = json.loads(mcp_json_path.read_text())
+        with open(mcp_json_path, 'rb') as f:
+            data = json.load(f)
     except (json.JSONDecodeError, OSError):
         return None
 
@@ -904,6 +1133,127 @@ def generate_multiplatform_install(skill_name: str, platforms: list[str]) -> str
     return "\n".join(lines) + "\n"
 
 
+# --- Incremental Conversion ---
+
+# Bump whenever a generator's output changes for the same input, so every
+# recorded conversion is redone
+CONVERTER_VERSION = "1"
+CONVERT_MANIFEST_DIR = ".convert-manifests"
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """Write content unless path already holds exactly it; True if written.
+
+    Leaving an identical file alone keeps its mtime, which is how the
+    conversion manifest tells reused outputs from rebuilt ones.
+    """
+    try:
+        if path.read_text() == content:
+            return False
+    except (OSError, UnicodeDecodeError):
+        pass
+    path.write_text(content)
+    return True
+
+
+def find_mcp_json(skill_path: Path) -> Path | None:
+    """The .mcp.json next to the skill, else in its parent."""
+    for candidate in (skill_path / ".mcp.json", skill_path.parent / ".mcp.json"):
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def snapshot_sources(
+    skill_path: Path, mcp_json: Path | None, previous: dict[str, list[Any]]
+) -> dict[str, list[Any]]:
+    """Map every conversion input to [sha256, size, mtime_ns, mode, inode, ctime_ns].
+
+    Inputs are SKILL.md, scripts/, references/ and the .mcp.json in use,
+    keyed by path relative to the skill. A file whose size, mtime, inode
+    and ctime all match the previous manifest keeps its recorded hash
+    instead of being re-read; ctime catches files rewritten in place with
+    their mtime restored (as unzip does), which size and mtime alone miss.
+    """
+    paths = [skill_path / "SKILL.md"]
+    for folder in ("scripts", "references"):
+        for dirpath, dirnames, filenames in os.walk(skill_path / folder, followlinks=True):
+            dirnames.sort()
+            paths.extend(Path(dirpath) / name for name in sorted(filenames))
+    if mcp_json is not None:
+        paths.append(mcp_json)
+
+    sources: dict[str, list[Any]] = {}
+    for file_path in paths:
+        rel = Path(os.path.relpath(file_path, skill_path)).as_posix()
+        stat = file_path.stat()
+        current = [stat.st_size, stat.st_mtime_ns, stat.st_mode & 0o777, stat.st_ino, stat.st_ctime_ns]
+        known = previous.get(rel)
+        if known and known[1:] == current:
+            sha = known[0]
+        else:
+            sha = sha256_file(file_path)
+        sources[rel] = [sha, *current]
+    return sources
+
+
+def output_stats(out: Path, rel_paths) -> dict[str, list[int] | None]:
+    """[size, mtime_ns, inode] of each output file (None if missing), keyed by path under out.
+
+    The inode tells a replaced output apart even when the new file carries
+    the same size and mtime, e.g. a link to a store object copied from a
+    source whose mtime was restored. ctime is left out: linking another
+    output to the same store object changes it.
+    """
+    stats: dict[str, list[int] | None] = {}
+    for rel in rel_paths:
+        try:
+            stat = (out / rel).stat()
+            stats[rel] = [stat.st_size, stat.st_mtime_ns, stat.st_ino]
+        except OSError:
+            stats[rel] = None
+    return stats
+
+
+def load_convert_manifest(manifest_file: Path) -> dict[str, Any] | None:
+    """A previous conversion manifest, or None if absent or unreadable.
+
+    Manifests from other converter versions are returned too: their
+    fingerprints never match, but their outputs still need cleaning up.
+    """
+    try:
+        with open(manifest_file, 'rb') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return manifest if isinstance(manifest, dict) else None
+
+
+def remove_stale_outputs(out: Path, stale: list[str]) -> None:
+    """Delete outputs no longer produced and any directories left empty."""
+    for rel in stale:
+        target_file = out / rel
+        target_file.unlink(missing_ok=True)
+        parent = target_file.parent
+        while parent != out and parent.is_dir() and not any(parent.iterdir()):
+            parent.rmdir()
+            parent = parent.parent
+
+
+def write_mcp_config(mcp_json: Path, target: str, out: Path, skill_name: str) -> str | None:
+    """Convert .mcp.json for one target; returns the file relative to the platform root."""
+    if target == "codex":
+        content, filename = convert_mcp_json_to_toml(mcp_json), "config.toml"
+    else:
+        content, filename = convert_mcp_json_for_json_platform(mcp_json, target), PLATFORM_MCP_FILES[target]
+    if not content:
+        return None
+    platform_dir = out / target / skill_name
+    platform_dir.mkdir(parents=True, exist_ok=True)
+    write_if_changed(platform_dir / filename, content)
+    return f"{skill_name}/{filename}"
+
+
 # --- Main Conversion ---
 
 def convert_skill(
@@ -912,8 +1262,30 @@ def convert_skill(
     output_dir: str,
     dry_run: bool = False,
     include_mcp: bool = False,
+    jobs: int | None = None,
+    force: bool = False,
+    tier: int | None = None,
+    install_script: bool = True,
+    prune_assets: bool = True,
 ) -> dict[str, Any]:
-    """Convert a Claude Code skill to target platforms."""
+    """Convert a Claude Code skill to target platforms.
+
+    Targets are generated concurrently by up to jobs threads (default: one
+    per target); each platform result records its own "seconds".
+
+    A manifest under <output>/.convert-manifests records, per target, a
+    fingerprint of every input (source hashes, converter version, tier)
+    and the size, mtime and inode of every output. A target whose fingerprint
+    and outputs are unchanged is not regenerated; otherwise files are
+    only rewritten when their content changes, and outputs the target no
+    longer produces are deleted. force ignores the manifest.
+
+    tier is computed from the directory layout unless given (catalog mode
+    passes it from a TierIndex); install_script=False skips writing the
+    per-skill install-multiplatform.sh, and prune_assets=False leaves
+    unreferenced objects in the asset store (catalog mode prunes once,
+    after every skill is done).
+    """
     path = Path(skill_path).resolve()
     out = Path(output_dir).resolve()
 
@@ -922,13 +1294,14 @@ def convert_skill(
     if not skill_md.exists():
         return {"status": "error", "message": f"SKILL.md not found in {path}"}
 
-    content = skill_md.read_text()
-    fm, body, parse_errors = parse_frontmatter(content)
+    document = SkillDocument.from_path(skill_md)
+    fm, body, parse_errors = document.frontmatter, document.body, document.errors
     if not fm:
         return {"status": "error", "message": f"Invalid frontmatter: {'; '.join(parse_errors)}"}
 
     skill_name = fm.get("name", path.name)
-    tier = detect_skill_tier(path)
+    if tier is None:
+        tier = detect_skill_tier(path)
     classification = classify_frontmatter_fields(fm)
 
     # Dry run: just report compatibility
@@ -936,7 +1309,7 @@ def convert_skill(
         platform_scores: dict[str, Any] = {}
         for target in targets:
             _, warnings = strip_claude_fields(fm, target)
-            _, body_warnings = adapt_body_content(body, target)
+            _, body_warnings = adapt_body_content(body, target, document)
             warnings.extend(body_warnings)
             manual_steps: list[str] = []
             if tier >= 3:
@@ -958,9 +1331,11 @@ def convert_skill(
             "skill_name": skill_name,
             "tier": tier,
             "platforms": platform_scores,
+            "review_findings": scan_body_findings(document),
         }
 
     # Full conversion
+    start = time.perf_counter()
     out.mkdir(parents=True, exist_ok=True)
 
     platform_results: dict[str, Any] = {}
@@ -970,45 +1345,95 @@ def convert_skill(
         "antigravity": generate_antigravity_output,
         "cursor": generate_cursor_output,
     }
-
-    for target in targets:
-        if target in generators:
-            platform_results[target] = generators[target](path, fm, body, out)
-
-    # MCP config conversion
-    if include_mcp:
-        mcp_json = path / ".mcp.json"
-        if not mcp_json.exists():
-            mcp_json = path.parent / ".mcp.json"
-
-        if mcp_json.exists():
-            # Codex: convert to TOML
-            if "codex" in targets:
-                toml_content = convert_mcp_json_to_toml(mcp_json)
-                if toml_content:
-                    codex_dir = out / "codex" / skill_name
-                    codex_dir.mkdir(parents=True, exist_ok=True)
-                    (codex_dir / "config.toml").write_text(toml_content)
-                    if "codex" in platform_results:
-                        platform_results["codex"]["files_created"].append(f"{skill_name}/config.toml")
-
-            # Gemini, Antigravity, Cursor: convert to platform-specific JSON
-            json_platforms = {"gemini": "settings.json", "antigravity": "mcp_config.json", "cursor": "mcp.json"}
-            for platform, filename in json_platforms.items():
-                if platform in targets:
-                    json_content = convert_mcp_json_for_json_platform(mcp_json, platform)
-                    if json_content:
-                        platform_dir = out / platform / skill_name
-                        platform_dir.mkdir(parents=True, exist_ok=True)
-                        (platform_dir / filename).write_text(json_content)
-                        if platform in platform_results:
-                            platform_results[platform]["files_created"].append(f"{skill_name}/{filename}")
+    selected = [target for target in targets if target in generators]
+    jobs = jobs or max(1, len(selected))
+
+    # One manifest per source skill, so renaming the skill still finds (and
+    # removes) the outputs written under its old name
+    manifest_file = out / CONVERT_MANIFEST_DIR / f"{hash_inputs([str(path)])[:16]}.json"
+    # Loaded even with force: its outputs are what stale deletion compares against
+    previous = load_convert_manifest(manifest_file)
+    previous_targets: dict[str, Any] = previous.get("targets", {}) if previous else {}
+
+    mcp_json = find_mcp_json(path) if include_mcp else None
+    known_sources = previous.get("sources", {}) if previous and not force else {}
+    sources = snapshot_sources(path, mcp_json, known_sources)
+    source_keys = [f"{rel}:{info[0]}:{info[3]:o}" for rel, info in sorted(sources.items())]
+
+    assets = AssetStore(out / ASSET_STORE_DIR)
+    for rel, (sha, size, _, mode, *_) in sources.items():
+        if rel.startswith(("scripts/", "references/")):
+            assets.remember(path / rel, sha, size, mode)
+
+    # Fill the document's memoized body scan up front so the worker
+    # threads only ever read it
+    document.find_all(_BODY_SCAN_RE)
+
+    def generate(target: str) -> tuple[dict[str, Any], dict[str, Any]]:
+        began = time.perf_counter()
+        fingerprint = hash_inputs([
+            CONVERTER_VERSION, target, skill_name, str(tier), str(include_mcp), *source_keys,
+        ])
+        recorded = None if force else previous_targets.get(target)
+        if (
+            recorded
+            and recorded.get("fingerprint") == fingerprint
+            and output_stats(out, recorded["outputs"]) == recorded["outputs"]
+        ):
+            result = {**recorded["result"], "reused": True}
+            result["seconds"] = round(time.perf_counter() - began, 4)
+            return result, recorded
+
+        result = generators[target](path, fm, body, out, document, assets, tier)
+        if mcp_json is not None:
+            mcp_file = write_mcp_config(mcp_json, target, out, skill_name)
+            if mcp_file:
+                result["files_created"].append(mcp_file)
+        entry = {
+            "fingerprint": fingerprint,
+            "outputs": output_stats(out, [f"{target}/{f}" for f in result["files_created"]]),
+            "result": result,
+        }
+        result = {**result, "reused": False, "seconds": round(time.perf_counter() - began, 4)}
+        return result, entry
+
+    entries: dict[str, Any] = {}
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = {target: pool.submit(generate, target) for target in selected}
+        # Merge in the requested target order, not completion order
+        for target in selected:
+            platform_results[target], entries[target] = futures[target].result()
+
+    # Compare with the previous run: what changed, what stayed, what went away
+    rebuilt: list[str] = []
+    reused: list[str] = []
+    stale: list[str] = []
+    for target in selected:
+        old_outputs = previous_targets.get(target, {}).get("outputs", {})
+        for rel, stat in entries[target]["outputs"].items():
+            (reused if old_outputs.get(rel) == stat else rebuilt).append(rel)
+        stale.extend(rel for rel in old_outputs if rel not in entries[target]["outputs"])
+    remove_stale_outputs(out, stale)
+    if prune_assets:
+        assets.prune()
+
+    manifest_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_manifest = manifest_file.with_name(f"{manifest_file.name}.{os.getpid()}.tmp")
+    tmp_manifest.write_text(json.dumps({
+        "converter_version": CONVERTER_VERSION,
+        "skill_path": str(path),
+        "skill_name": skill_name,
+        "sources": sources,
+        "targets": {**previous_targets, **entries},
+    }, indent=1))
+    os.replace(tmp_manifest, manifest_file)
 
     # Generate multi-platform install script
     install_script_path = out / "install-multiplatform.sh"
-    install_content = generate_multiplatform_install(skill_name, targets)
-    install_script_path.write_text(install_content)
-    os.chmod(install_script_path, 0o755)
+    if install_script:
+        install_content = generate_multiplatform_install(skill_name, targets)
+        write_if_changed(install_script_path, install_content)
+        os.chmod(install_script_path, 0o755)
 
     return {
         "status": "success",
@@ -1016,14 +1441,220 @@ def convert_skill(
         "tier": tier,
         "platforms": platform_results,
         "install_script": str(install_script_path),
+        "review_findings": scan_body_findings(document),
+        "assets": assets.stats(),
+        "incremental": {
+            "manifest": str(manifest_file),
+            "reused_targets": [t for t in selected if platform_results[t]["reused"]],
+            "rebuilt": rebuilt,
+            "reused": reused,
+            "deleted": stale,
+        },
+        "jobs": jobs,
+        "seconds": round(time.perf_counter() - start, 4),
+    }
+
+
+# --- Catalog Conversion ---
+
+def convert_catalog_entry(
+    skill_path: str,
+    targets: list[str],
+    output_dir: str,
+    dry_run: bool,
+    include_mcp: bool,
+    force: bool,
+    tier: int,
+) -> dict[str, Any]:
+    """Convert one catalog skill with a precomputed tier.
+
+    Top-level so it can run in a worker process. Targets are generated
+    serially: the catalog already keeps one process per CPU busy.
+    """
+    result = convert_skill(
+        skill_path, targets, output_dir, dry_run, include_mcp,
+        jobs=1, force=force, tier=tier, install_script=False, prune_assets=False,
+    )
+    result["path"] = skill_path
+    return result
+
+
+def remove_departed_skills(root: Path, out: Path, present: set[str]) -> list[str]:
+    """Delete the outputs and manifest of every skill under root that is gone."""
+    removed: list[str] = []
+    manifest_dir = out / CONVERT_MANIFEST_DIR
+    if not manifest_dir.is_dir():
+        return removed
+    for manifest_file in sorted(manifest_dir.glob("*.json")):
+        try:
+            with open(manifest_file, 'rb') as f:
+                manifest = json.load(f)
+            skill_path = manifest["skill_path"]
+        except (OSError, ValueError, KeyError, TypeError):
+            continue
+        if skill_path in present or not Path(skill_path).is_relative_to(root):
+            continue
+        remove_stale_outputs(out, [
+            rel for entry in manifest.get("targets", {}).values() for rel in entry.get("outputs", {})
+        ])
+        manifest_file.unlink(missing_ok=True)
+        removed.append(skill_path)
+    return removed
+
+
+def summarize_catalog_entry(result: dict[str, Any]) -> dict[str, Any]:
+    """One skill's line in the catalog report: scores and findings, not file lists."""
+    entry: dict[str, Any] = {"path": result["path"], "status": result["status"]}
+    if result["status"] == "error":
+        entry["message"] = result["message"]
+        return entry
+    entry["skill_name"] = result["skill_name"]
+    entry["tier"] = result["tier"]
+    entry["platforms"] = {
+        target: {
+            "compatibility_score": platform["compatibility_score"],
+            "warnings": platform["warnings"],
+            "manual_steps": platform["manual_steps"],
+            **({"reused": platform["reused"]} if "reused" in platform else {}),
+        }
+        for target, platform in result["platforms"].items()
+    }
+    if "incremental" in result:
+        incremental = result["incremental"]
+        entry["rebuilt"] = len(incremental["rebuilt"])
+        entry["reused"] = len(incremental["reused"])
+        entry["deleted"] = len(incremental["deleted"])
+        entry["seconds"] = result["seconds"]
+    return entry
+
+
+def convert_catalog(
+    catalog_root: str,
+    targets: list[str],
+    output_dir: str,
+    dry_run: bool = False,
+    include_mcp: bool = False,
+    force: bool = False,
+    workers: int | None = None,
+) -> dict[str, Any]:
+    """Convert every skill under catalog_root to every target.
+
+    Skills are found like validate_skill.py --catalog. Tiers come from one
+    TierIndex, so each parent's agents/ and skills/ is listed once for the
+    whole catalog. Skills are converted on a process pool (workers=1:
+    in-process) into one output tree that shares the asset store and the
+    conversion manifests, and a single install script covers all of them.
+    Skills whose names collide are not converted, and the outputs of
+    skills that have left the catalog are deleted.
+    """
+    start = time.perf_counter()
+    root = Path(catalog_root).resolve()
+    out = Path(output_dir).resolve()
+
+    # An output tree inside the catalog holds converted skills; never convert those
+    skills = [
+        path for kind, path in discover_catalog(root)
+        if kind == "skill" and not path.is_relative_to(out)
+    ]
+    if not skills:
+        return {"status": "error", "message": f"No skills found under {root}"}
+
+    index = TierIndex()
+    tiers = {path: index.tier(path) for path in skills}
+
+    # Output directories are named after the skill, so two skills claiming
+    # one name would overwrite each other
+    claimed: dict[str, list[Path]] = {}
+    for path in skills:
+        name = (read_frontmatter(path / "SKILL.md") or {}).get("name")
+        claimed.setdefault(name if isinstance(name, str) and name else path.name, []).append(path)
+    conflicts = {name: paths for name, paths in claimed.items() if len(paths) > 1}
+
+    results: list[dict[str, Any]] = []
+    for name, paths in conflicts.items():
+        for path in paths:
+            others = ", ".join(str(other) for other in paths if other != path)
+            results.append({
+                "status": "error",
+                "path": str(path),
+                "message": f"Skill name '{name}' is also used by {others}",
+            })
+    blocked = {path for paths in conflicts.values() for path in paths}
+    todo = [path for path in skills if path not in blocked]
+
+    removed: list[str] = []
+    if not dry_run:
+        out.mkdir(parents=True, exist_ok=True)
+        # Before converting, so a skill that moved can reclaim its outputs
+        removed = remove_departed_skills(root, out, {str(path) for path in skills})
+
+    args = (targets, str(out), dry_run, include_mcp, force)
+    if workers == 1 or len(todo) <= 1:
+        results.extend(convert_catalog_entry(str(path), *args, tiers[path]) for path in todo)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(convert_catalog_entry, str(path), *args, tiers[path]): path
+                for path in todo
+            }
+            for future in as_completed(futures):
+                try:
+                    results.append(future.result())
+                except Exception as exc:  # A crashed worker fails its skill, not the run
+                    results.append({
+                        "status": "error",
+                        "path": str(futures[future]),
+                        "message": f"{type(exc).__name__}: {exc}",
+                    })
+    results.sort(key=lambda result: result["path"])
+
+    converted = [result for result in results if result["status"] != "error"]
+    report: dict[str, Any] = {
+        "status": "dry_run" if dry_run else "success" if len(converted) == len(results) else "partial",
+        "catalog": str(root),
+        "targets": targets,
+        "summary": {
+            "skills": len(results),
+            "converted": len(converted),
+            "failed": len(results) - len(converted),
+            "tiers": {
+                str(tier): sum(1 for result in converted if result["tier"] == tier)
+                for tier in range(1, 5)
+            },
+        },
+        "skills": [summarize_catalog_entry(result) for result in results],
     }
+    if not dry_run:
+        # Workers skip pruning: one skill's unlinked object may be about to
+        # be linked by another
+        pruned = AssetStore(out / ASSET_STORE_DIR).prune()
+        install_script_path = out / "install-multiplatform.sh"
+        if converted:
+            label = f"{root.name} ({len(converted)} skills)"
+            write_if_changed(install_script_path, generate_multiplatform_install(label, targets))
+            os.chmod(install_script_path, 0o755)
+        report["summary"].update({
+            "files_rebuilt": sum(len(r["incremental"]["rebuilt"]) for r in converted),
+            "files_reused": sum(len(r["incremental"]["reused"]) for r in converted),
+            "files_deleted": sum(len(r["incremental"]["deleted"]) for r in converted),
+            "skills_removed": removed,
+            "assets_pruned": pruned,
+        })
+        report["output_dir"] = str(out)
+        report["install_script"] = str(install_script_path)
+    report["seconds"] = round(time.perf_counter() - start, 4)
+    return report
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
         description="Convert Claude Code skills to other platforms"
     )
-    parser.add_argument("path", help="Path to skill directory")
+    parser.add_argument("path", nargs="?", help="Path to skill directory")
+    parser.add_argument(
+        "--catalog", metavar="ROOT",
+        help="Convert every skill under ROOT into one output tree with one report and install script"
+    )
     parser.add_argument(
         "--target", "-t", default="all",
         help="Comma-separated targets: codex,gemini,antigravity,cursor,all (default: all)"
@@ -1040,23 +1671,54 @@ if __name__ == "__main__":
         "--include-mcp", action="store_true",
         help="Convert .mcp.json config files for target platforms"
     )
+    parser.add_argument(
+        "--force", action="store_true",
+        help="Ignore the conversion manifest and regenerate every target"
+    )
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=None,
+        help="Platforms generated concurrently (default: one thread per target; 1 = serial)"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None,
+        help="Skills converted in parallel with --catalog (default: CPU count; 1 = in-process)"
+    )
     args = parser.parse_args()
 
-    if not os.path.isdir(args.path):
-        print(json.dumps({"status": "error", "message": f"Not a directory: {args.path}"}), file=sys.stderr)
+    if (args.path is None) == (args.catalog is None):
+        print(json.dumps({"status": "error", "message": "Give either a skill path or --catalog ROOT"}), file=sys.stderr)
+        sys.exit(1)
+
+    source = args.catalog or args.path
+    if not os.path.isdir(source):
+        print(json.dumps({"status": "error", "message": f"Not a directory: {source}"}), file=sys.stderr)
         sys.exit(1)
 
     targets = args.target.split(",")
     if "all" in targets:
         targets = ["codex", "gemini", "antigravity", "cursor"]
 
+    if args.jobs is not None and args.jobs < 1:
+        print(json.dumps({"status": "error", "message": "--jobs must be >= 1"}), file=sys.stderr)
+        sys.exit(1)
+    if args.workers is not None and args.workers < 1:
+        print(json.dumps({"status": "error", "message": "--workers must be >= 1"}), file=sys.stderr)
+        sys.exit(1)
+
     valid_targets = {"codex", "gemini", "antigravity", "cursor"}
     invalid = set(targets) - valid_targets
     if invalid:
         print(json.dumps({"status": "error", "message": f"Invalid targets: {', '.join(invalid)}"}), file=sys.stderr)
         sys.exit(1)
 
-    result = convert_skill(args.path, targets, args.output, args.dry_run, args.include_mcp)
+    if args.catalog:
+        result = convert_catalog(
+            args.catalog, targets, args.output, args.dry_run, args.include_mcp, args.force, args.workers
+        )
+    else:
+        result = convert_skill(
+            args.path, targets, args.output, args.dry_run, args.include_mcp, args.jobs, args.force
+        )
 
     if result["status"] == "error":
         print(json.dumps(result, indent=2), file=sys.stderr)
@@ -13,77 +13,11 @@ Analyzes the skill's description and instructions to produce:
 
 import argparse
 import json
-import re
 import sys
 from pathlib import Path
 from typing import Any
 
-# Use shared parser when available; inline fallback for standalone execution
-try:
-    from skill_utils import parse_frontmatter_simple as parse_frontmatter
-except ImportError:
-    def parse_frontmatter(content: str) -> tuple[dict[str, Any] | None, str]:  # type: ignore[misc]
-        """Parse YAML frontmatter from SKILL.md content (inline fallback)."""
-        if not content.startswith('---'):
-            return None, content
-        parts = content.split('---', 2)
-        if len(parts) < 3:
-            return None, content
-        yaml_text, body = parts[1].strip(), parts[2].strip()
-        frontmatter: dict[str, Any] = {}
-        current_key, current_value, in_multiline = "", "", False
-        for line in yaml_text.split('\n'):
-            stripped = line.strip()
-            if in_multiline:
-                if stripped and not re.match(r'^[a-z_-]+:', stripped):
-                    current_value += " " + stripped
-                    continue
-                frontmatter[current_key] = current_value.strip()
-                in_multiline = False
-            match = re.match(r'^([a-z_-]+):\s*(.*)', stripped)
-            if match:
-                current_key, value = match.group(1), match.group(2).strip()
-                if value in ('>', '|'):
-                    in_multiline, current_value = True, ""
-                elif value:
-                    frontmatter[current_key] = value.strip('"').strip("'")
-        if in_multiline:
-            frontmatter[current_key] = current_value.strip()
-        return frontmatter, body
-
-
-def extract_trigger_phrases(description: str) -> list[str]:
-    """Extract quoted trigger phrases from the description."""
-    phrases = re.findall(r'"([^"]+)"', description)
-    return phrases
-
-
-def extract_keywords(description: str) -> list[str]:
-    """Extract domain keywords from the description."""
-    stop_words = {
-        'use', 'when', 'user', 'says', 'the', 'and', 'for', 'with', 'that',
-        'this', 'from', 'are', 'was', 'were', 'been', 'have', 'has', 'had',
-        'will', 'would', 'could', 'should', 'may', 'might', 'can', 'does',
-        'not', 'but', 'also', 'more', 'into', 'than', 'then', 'its', 'all',
-        'any', 'each', 'both', 'such', 'only', 'own', 'same', 'other',
-    }
-
-    words = re.findall(r'[a-z]+(?:-[a-z]+)*', description.lower())
-    keywords = [w for w in words if len(w) > 3 and w not in stop_words]
-    # Deduplicate while preserving order
-    seen: set[str] = set()
-    unique: list[str] = []
-    for w in keywords:
-        if w not in seen:
-            seen.add(w)
-            unique.append(w)
-    return unique[:20]
-
-
-def extract_headings(body: str) -> list[str]:
-    """Extract section headings from the SKILL.md body."""
-    headings = re.findall(r'^#{1,3}\s+(.+)$', body, re.MULTILINE)
-    return headings
+from skill_utils import SkillDocument
 
 
 def generate_trigger_evals(
@@ -196,18 +130,18 @@ def generate_eval_set(skill_path: str, output_path: str | None = None) -> dict[s
     if not skill_md.exists():
         return {"error": f"SKILL.md not found at {path}"}
 
-    content = skill_md.read_text()
-    frontmatter, body = parse_frontmatter(content)
+    document = SkillDocument.from_path(skill_md)
+    frontmatter = document.frontmatter
 
     if not frontmatter:
         return {"error": "Could not parse SKILL.md frontmatter"}
 
     name = frontmatter.get("name", path.name)
-    description = frontmatter.get("description", "")
+    description = document.description
 
-    trigger_phrases = extract_trigger_phrases(description)
-    keywords = extract_keywords(description)
-    headings = extract_headings(body)
+    trigger_phrases = document.quoted_phrases
+    keywords = document.keywords[:20]
+    headings = document.headings
 
     trigger_evals = generate_trigger_evals(name, description, trigger_phrases, keywords)
     negative_evals = generate_negative_evals(name, keywords)
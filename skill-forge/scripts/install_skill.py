@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Purpose: Install a packaged .skill file into ~/.claude/skills and ~/.claude/agents.
+Input: Path to a .skill file built by package_skill.py
+Output: JSON install report (per skill: extracted vs reused members)
+Usage: python scripts/install_skill.py dist/skill-name.skill [--target ~/.claude] [--workers 8] [--force]
+
+Installs the same layout as install.sh:
+- Main skill (skill-name/) and sub-skills (skills/skill-name-*/) to <target>/skills/
+- Agent definitions (agents/*.md) to <target>/agents/
+Scripts, install.sh, LICENSE and MANIFEST.json stay in the package.
+
+Each skill directory is assembled in a staging directory beside its final
+location and swapped in with renames only after every member has been
+written and verified, so a failed install leaves the previous one intact.
+Members are extracted on a thread pool and hashed while they stream
+against the package's MANIFEST.json; members whose installed copy already
+has the right hash are hard-linked from it instead of extracted, and a
+skill whose tree already matches the package is not touched at all.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from package_skill import MANIFEST_NAME
+from skill_utils import extract_verified, safe_member_path, sha256_file
+
+
+# --- Install Plan ---
+
+def default_target() -> Path:
+    """The Claude configuration directory skills and agents install into."""
+    return Path.home() / ".claude"
+
+
+def install_destination(arc: str, skill_name: str) -> tuple[str, str] | None:
+    """Map an archive path to (group, path within group), or None if not installed.
+
+    Groups are skill directory names, or "agents" for agent files.
+    """
+    parts = arc.split('/')
+    if parts[0] == skill_name and len(parts) > 1:
+        return skill_name, '/'.join(parts[1:])
+    if parts[0] == "skills" and len(parts) > 2:
+        return parts[1], '/'.join(parts[2:])
+    if parts[0] == "agents" and len(parts) == 2 and arc.endswith(".md"):
+        return "agents", parts[1]
+    return None
+
+
+def read_install_plan(
+    zf: zipfile.ZipFile,
+) -> tuple[str, dict[str, list[tuple[zipfile.ZipInfo, str, str | None, int]]]]:
+    """Group a package's members by install location.
+
+    Returns (skill_name, {group: [(info, relative path, sha256, mode)]}).
+    sha256 is None for packages built before MANIFEST.json existed; those
+    members are checked against the ZIP CRC only.
+    """
+    try:
+        manifest = json.loads(zf.read(MANIFEST_NAME))
+        files = {f["path"]: f for f in manifest["files"]}
+        skill_name = manifest["skill_name"]
+    except KeyError:
+        manifest, files = None, {}
+        roots = {
+            info.filename.split('/')[0] for info in zf.infolist()
+            if info.filename.endswith("/SKILL.md") and info.filename.count('/') == 1
+        }
+        if len(roots) != 1:
+            raise ValueError("Package has no MANIFEST.json and no single top-level SKILL.md")
+        skill_name = roots.pop()
+
+    groups: dict[str, list[tuple[zipfile.ZipInfo, str, str | None, int]]] = {}
+    for info in zf.infolist():
+        if info.is_dir():
+            continue
+        safe_member_path(Path("."), info.filename)
+        destination = install_destination(info.filename, skill_name)
+        if destination is None:
+            continue
+        group, rel = destination
+        safe_member_path(Path("."), group)
+        entry = files.get(info.filename)
+        if entry is not None:
+            sha, mode = entry["sha256"], int(entry["mode"], 8)
+        else:
+            sha, mode = None, (info.external_attr >> 16) or 0o100644
+        groups.setdefault(group, []).append((info, rel, sha, mode))
+    return skill_name, groups
+
+
+# --- Staged Extraction ---
+
+def place_member(
+    zf: zipfile.ZipFile,
+    info: zipfile.ZipInfo,
+    current: Path,
+    stage: Path,
+    sha: str | None,
+    mode: int,
+    force: bool,
+) -> tuple[str, int]:
+    """Put one member at stage, reusing current when it already matches.
+
+    Returns ("reused" | "extracted", bytes written). A matching file with
+    the same mode is hard-linked; one whose mode differs is copied and
+    counted as extracted, since the live file must not change before the
+    swap.
+    """
+    if not force and sha is not None and current.is_file() and sha256_file(current) == sha:
+        stage.parent.mkdir(parents=True, exist_ok=True)
+        if current.stat().st_mode & 0o777 == mode & 0o777:
+            try:
+                os.link(current, stage)
+                return "reused", 0
+            except OSError:
+                pass
+            shutil.copy2(current, stage)
+            return "reused", 0
+        shutil.copyfile(current, stage)
+        os.chmod(stage, mode & 0o777)
+        return "extracted", stage.stat().st_size
+    return "extracted", extract_verified(zf, info, stage, sha, mode)
+
+
+def tree_files(root: Path) -> set[str]:
+    """Relative paths of every file under root."""
+    found: set[str] = set()
+    for dirpath, _, filenames in os.walk(root):
+        rel_dir = Path(dirpath).relative_to(root).as_posix()
+        prefix = "" if rel_dir == "." else f"{rel_dir}/"
+        found.update(prefix + name for name in filenames)
+    return found
+
+
+def install_package(
+    package: Path, target: Path, workers: int | None = None, force: bool = False
+) -> dict[str, Any]:
+    """Install a .skill package into target/skills and target/agents."""
+    start = time.perf_counter()
+    skills_dir = target / "skills"
+    agents_dir = target / "agents"
+    token = f"{os.getpid()}"
+    staged: dict[str, Path] = {}
+
+    try:
+        with zipfile.ZipFile(package) as zf:
+            skill_name, groups = read_install_plan(zf)
+            if not groups:
+                return {"error": f"Package contains nothing to install: {package}"}
+
+            tasks = []
+            for group, members in groups.items():
+                if group == "agents":
+                    final, stage_root = agents_dir, agents_dir / f".install-{token}"
+                else:
+                    final, stage_root = skills_dir / group, skills_dir / f".{group}.install-{token}"
+                stage_root.parent.mkdir(parents=True, exist_ok=True)
+                staged[group] = stage_root
+                for info, rel, sha, mode in members:
+                    tasks.append((group, info, final / rel, stage_root / rel, sha, mode))
+
+            # Threads share one ZipFile: member reads are serialized by zipfile,
+            # while decompression, hashing and writes run in parallel
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                outcomes = list(pool.map(
+                    lambda t: place_member(zf, t[1], t[2], t[3], t[4], t[5], force), tasks
+                ))
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile) as exc:
+        for stage_root in staged.values():
+            shutil.rmtree(stage_root, ignore_errors=True)
+        return {"error": f"Install failed, nothing changed: {exc}"}
+
+    report: dict[str, dict[str, Any]] = {}
+    for (group, *_), (outcome, written) in zip(tasks, outcomes):
+        entry = report.setdefault(group, {"extracted": 0, "reused": 0, "bytes_written": 0})
+        entry[outcome] += 1
+        entry["bytes_written"] += written
+
+    # Every member is verified and staged; swap the results into place.
+    # Replaced files and trees are set aside, not deleted, until every swap
+    # has succeeded, so a failure part-way can put them all back.
+    swapped: list[tuple[Path, Path | None]] = []
+
+    def swap_in(staged_path: Path, final: Path) -> None:
+        old = None
+        if final.exists():
+            old = final.with_name(f".{final.name}.old-{token}")
+            os.replace(final, old)
+        swapped.append((final, old))
+        os.replace(staged_path, final)
+
+    try:
+        for group, stage_root in staged.items():
+            entry = report[group]
+            if group == "agents":
+                if entry["extracted"] == 0:
+                    entry["status"] = "unchanged"
+                    continue
+                entry["status"] = "installed"
+                for name in sorted(tree_files(stage_root)):
+                    swap_in(stage_root / name, agents_dir / name)
+                continue
+
+            final = skills_dir / group
+            if final.is_dir() and entry["extracted"] == 0 and tree_files(final) == tree_files(stage_root):
+                entry["status"] = "unchanged"
+                continue
+            entry["status"] = "upgraded" if final.exists() else "installed"
+            swap_in(stage_root, final)
+    except OSError as exc:
+        for final, old in reversed(swapped):
+            try:
+                if final.is_dir() and not final.is_symlink():
+                    shutil.rmtree(final)
+                else:
+                    final.unlink(missing_ok=True)
+                if old is not None:
+                    os.replace(old, final)
+            except OSError:
+                pass
+        return {"error": f"Install failed while moving staged files into place; previous install restored: {exc}"}
+    else:
+        for _, old in swapped:
+            if old is None:
+                continue
+            if old.is_dir() and not old.is_symlink():
+                shutil.rmtree(old, ignore_errors=True)
+            else:
+                old.unlink(missing_ok=True)
+    finally:
+        for stage_root in staged.values():
+            shutil.rmtree(stage_root, ignore_errors=True)
+
+    agents = report.pop("agents", None)
+    return {
+        "status": "success",
+        "package": str(package),
+        "skill_name": skill_name,
+        "target": str(target),
+        "skills": {name: report[name] for name in sorted(report)},
+        "agents": agents,
+        "extracted": sum(t["extracted"] for t in report.values()) + (agents["extracted"] if agents else 0),
+        "reused": sum(t["reused"] for t in report.values()) + (agents["reused"] if agents else 0),
+        "seconds": round(time.perf_counter() - start, 3),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Install a .skill package into ~/.claude"
+    )
+    parser.add_argument("package", help="Path to the .skill file")
+    parser.add_argument(
+        "--target", default=None,
+        help="Configuration directory to install into (default: ~/.claude)"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None,
+        help="Extraction threads (default: executor default)"
+    )
+    parser.add_argument(
+        "--force", action="store_true",
+        help="Extract every member even if the installed copy already matches"
+    )
+    args = parser.parse_args()
+
+    package = Path(args.package).expanduser().resolve()
+    if not package.is_file():
+        print(json.dumps({"error": f"Not a file: {args.package}"}), file=sys.stderr)
+        sys.exit(1)
+    if args.workers is not None and args.workers < 1:
+        print(json.dumps({"error": "--workers must be >= 1"}), file=sys.stderr)
+        sys.exit(1)
+
+    target = Path(args.target).expanduser().resolve() if args.target else default_target()
+    result = install_package(package, target, args.workers, args.force)
+
+    if "error" in result:
+        print(json.dumps(result), file=sys.stderr)
+        sys.exit(1)
+
+    print(json.dumps(result, indent=2))
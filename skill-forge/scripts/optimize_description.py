@@ -22,38 +22,10 @@ import sys
 from pathlib import Path
 from typing import Any
 
-# Use shared parser when available; inline fallback for standalone execution
-try:
-    from skill_utils import parse_frontmatter_simple as parse_frontmatter
-except ImportError:
-    def parse_frontmatter(content: str) -> tuple[dict[str, Any] | None, str]:  # type: ignore[misc]
-        """Parse YAML frontmatter from SKILL.md content (inline fallback)."""
-        if not content.startswith('---'):
-            return None, content
-        parts = content.split('---', 2)
-        if len(parts) < 3:
-            return None, content
-        yaml_text, body = parts[1].strip(), parts[2].strip()
-        frontmatter: dict[str, Any] = {}
-        current_key, current_value, in_multiline = "", "", False
-        for line in yaml_text.split('\n'):
-            stripped = line.strip()
-            if in_multiline:
-                if stripped and not re.match(r'^[a-z_-]+:', stripped):
-                    current_value += " " + stripped
-                    continue
-                frontmatter[current_key] = current_value.strip()
-                in_multiline = False
-            match = re.match(r'^([a-z_-]+):\s*(.*)', stripped)
-            if match:
-                current_key, value = match.group(1), match.group(2).strip()
-                if value in ('>', '|'):
-                    in_multiline, current_value = True, ""
-                elif value:
-                    frontmatter[current_key] = value.strip('"').strip("'")
-        if in_multiline:
-            frontmatter[current_key] = current_value.strip()
-        return frontmatter, body
+from skill_utils import read_frontmatter
+
+
+_WORD_RE = re.compile(r'[a-z]+(?:-[a-z]+)*')
 
 
 def split_eval_set(
@@ -91,7 +63,7 @@ def score_description(
     This script provides a baseline heuristic score.
     """
     desc_lower = description.lower()
-    desc_words = set(re.findall(r'[a-z]+(?:-[a-z]+)*', desc_lower))
+    desc_words = set(_WORD_RE.findall(desc_lower))
 
     correct = 0
     total = len(eval_set)
@@ -99,7 +71,7 @@ def score_description(
 
     for eval_item in eval_set:
         prompt = eval_item.get("prompt", "").lower()
-        prompt_words = set(re.findall(r'[a-z]+(?:-[a-z]+)*', prompt))
+        prompt_words = set(_WORD_RE.findall(prompt))
         should_trigger = eval_item.get("should_trigger", True)
 
         # Heuristic: keyword overlap ratio
@@ -144,9 +116,10 @@ def suggest_improvements(
 
     if false_negatives:
         missing_keywords: set[str] = set()
+        desc_words = set(_WORD_RE.findall(description.lower()))
         for fn in false_negatives:
-            prompt_words = set(re.findall(r'[a-z]+(?:-[a-z]+)*', fn["prompt"].lower()))
-            missing_keywords.update(prompt_words - set(re.findall(r'[a-z]+(?:-[a-z]+)*', description.lower())))
+            prompt_words = set(_WORD_RE.findall(fn["prompt"].lower()))
+            missing_keywords.update(prompt_words - desc_words)
 
         # Filter out stop words
         stop_words = {'the', 'and', 'for', 'with', 'that', 'this', 'from', 'can', 'you', 'help', 'need', 'want'}
@@ -185,13 +158,14 @@ def run_optimization(
     if not skill_md.exists():
         return {"error": f"SKILL.md not found at {path}"}
 
-    content = skill_md.read_text()
-    frontmatter, body = parse_frontmatter(content)
+    # Only the description is scored, so skip reading the body
+    frontmatter = read_frontmatter(skill_md)
 
     if not frontmatter:
         return {"error": "Could not parse SKILL.md frontmatter"}
 
-    eval_data = json.loads(Path(eval_set_path).read_text())
+    with open(eval_set_path, 'rb') as f:
+        eval_data = json.load(f)
     all_evals = eval_data.get("evals", [])
 
     if not all_evals:
@@ -3,7 +3,11 @@
 Purpose: Package a Claude Code skill into a distributable .skill (ZIP) file.
 Input: Path to skill directory (or parent with skills/ and agents/)
 Output: .skill ZIP file ready for distribution
-Usage: python scripts/package_skill.py /path/to/skill-root --output ./dist
+Usage: python scripts/package_skill.py /path/to/skill-root --output ./dist [--workers 8] [--level 6]
+       python scripts/package_skill.py /path/to/skill-root --method lzma --rule .csv=bzip2
+       python scripts/package_skill.py /path/to/skill-root --delta-from old/skill-name.skill
+       python scripts/package_skill.py /path/to/extracted-package --apply-delta skill-name.delta.skill
+       python scripts/package_skill.py --batch 'catalog/*' @more-roots.txt --output ./dist [--workers 8]
 
 The script packages:
 - Main skill directory (skill-name/)
@@ -11,16 +15,59 @@ The script packages:
 - Agent definitions (agents/skill-name-*.md)
 - Scripts directory (scripts/)
 - install.sh (if present)
+- MANIFEST.json (sha256, size and mode of every member)
+
+Members are compressed concurrently on a thread pool and written in a fixed
+order by a single writer. Already-compressed formats (images, archives, PDFs)
+are stored; unknown types are stored unless a sample probe shows they shrink.
+Builds are reproducible: fixed member order, timestamps (SOURCE_DATE_EPOCH or
+1980-01-01) and modes. Re-running on an unchanged tree writes nothing, and
+unchanged members are copied compressed from the previous package. Excluded directories (.git, node_modules,
+__pycache__, ...) are never walked.
+File hashes and compressed members are cached by content hash under
+~/.cache/skill-forge/package, so with --batch a file vendored into many
+skills is compressed once across the whole process pool.
+A .skillignore file in the root adds gitignore-style exclusion patterns.
 """
 
 import argparse
+import glob
+import hashlib
 import json
 import os
+import re
+import shutil
+import struct
 import sys
+import time
 import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Any
 
+from skill_utils import (
+    DEFAULT_CACHE_MAX_BYTES,
+    ZIP_BZIP2,
+    ZIP_DEFLATED,
+    ZIP_EPOCH,
+    ZIP_LZMA,
+    ZIP_STORED,
+    ResultCache,
+    ZipMember,
+    ZipStreamWriter,
+    default_cache_dir,
+    extract_verified,
+    hash_inputs,
+    make_member,
+    read_frontmatter,
+    read_raw_member,
+    safe_member_path,
+    sha256_file,
+)
+
 
 EXCLUDED_PATTERNS = {
     '__pycache__',
@@ -35,99 +82,856 @@ EXCLUDED_PATTERNS = {
     'Thumbs.db',
 }
 
+# A name is excluded if it equals or ends with a pattern; equality implies
+# endswith, so one str.endswith(tuple) call covers both
+_EXCLUDED_SUFFIXES = tuple(EXCLUDED_PATTERNS)
+
+SKILLIGNORE_FILE = ".skillignore"
+
+DEFAULT_COMPRESS_LEVEL = 6
+
+# Compressed members are far larger than validation results
+PACKAGE_CACHE_MAX_BYTES = DEFAULT_CACHE_MAX_BYTES * 4
+
 
 def should_exclude(path: Path) -> bool:
     """Check if a file/directory should be excluded from the package."""
-    for part in path.parts:
-        for pattern in EXCLUDED_PATTERNS:
-            if part == pattern or part.endswith(pattern):
-                return True
-    return False
+    return any(part.endswith(_EXCLUDED_SUFFIXES) for part in path.parts)
+
+
+# --- .skillignore ---
+
+def _translate_glob(pattern: str) -> str:
+    """Translate one gitignore glob (no leading !, no trailing /) to a regex."""
+    anchored = "/" in pattern.rstrip("/")
+    pattern = pattern.lstrip("/")
+    out: list[str] = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+            continue
+        if pattern.startswith("/**", i) and i + 3 == n:
+            out.append("/.*")
+            i += 3
+            continue
+        if pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+            continue
+        if c == "*":
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            end = pattern.find("]", i + 1)
+            if end == -1:
+                out.append(re.escape(c))
+            else:
+                body = pattern[i + 1:end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append(f"[{body.replace(chr(92), chr(92) * 2)}]")
+                i = end
+        elif c == "\\" and i + 1 < n:
+            i += 1
+            out.append(re.escape(pattern[i]))
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return ("" if anchored else "(?:.*/)?") + "".join(out)
+
+
+class IgnoreMatcher:
+    """Gitignore-style patterns compiled into one regex per (negated, dir) case.
+
+    Paths are POSIX-style and relative to the packaging root. A pattern
+    ending in / matches directories only; a pattern containing another /
+    is anchored to the root; !pattern re-includes. As in git, nothing
+    inside an ignored directory can be re-included, because the walker
+    never enters it.
+    """
+
+    __slots__ = ('patterns', '_file', '_dir', '_keep_file', '_keep_dir')
+
+    def __init__(self, lines: list[str]) -> None:
+        ignore_file: list[str] = []
+        ignore_dir: list[str] = []
+        keep_file: list[str] = []
+        keep_dir: list[str] = []
+        self.patterns = 0
+        for raw in lines:
+            line = raw.rstrip("\n").rstrip()
+            if not line or line.startswith("#"):
+                continue
+            negated = line.startswith("!")
+            if negated:
+                line = line[1:]
+            dir_only = line.endswith("/")
+            regex = _translate_glob(line.rstrip("/"))
+            (keep_dir if negated else ignore_dir).append(regex)
+            if not dir_only:
+                (keep_file if negated else ignore_file).append(regex)
+            self.patterns += 1
+
+        def compile_all(regexes: list[str]) -> re.Pattern[str] | None:
+            return re.compile("(?:" + "|".join(regexes) + r")\Z") if regexes else None
+
+        self._file = compile_all(ignore_file)
+        self._dir = compile_all(ignore_dir)
+        self._keep_file = compile_all(keep_file)
+        self._keep_dir = compile_all(keep_dir)
+
+    @classmethod
+    def from_file(cls, path: Path) -> "IgnoreMatcher | None":
+        """Load a .skillignore file; None if it does not exist or is empty."""
+        try:
+            lines = path.read_text().splitlines()
+        except OSError:
+            return None
+        matcher = cls(lines)
+        return matcher if matcher.patterns else None
+
+    def ignored(self, rel_path: str, is_dir: bool) -> bool:
+        """True if rel_path matches an ignore pattern and no ! pattern."""
+        regex, keep = (self._dir, self._keep_dir) if is_dir else (self._file, self._keep_file)
+        if regex is None or not regex.match(rel_path):
+            return False
+        return keep is None or not keep.match(rel_path)
+
+
+# --- File Collection ---
+
+def walk_files(
+    base: Path, root: Path, ignore: IgnoreMatcher | None = None
+) -> list[tuple[Path, str]]:
+    """Return (absolute_path, archive_path) for every file under base.
+
+    Uses os.scandir and never descends into excluded or ignored
+    directories, so their contents are never listed. Entries are sorted
+    per directory; symlinked directories are not followed.
+    """
+    files: list[tuple[Path, str]] = []
+    prefix = base.relative_to(root).as_posix()
+    stack: list[tuple[str, str]] = [(str(base), prefix)]
+
+    while stack:
+        directory, rel_dir = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            continue
+        subdirs: list[tuple[str, str]] = []
+        for entry in entries:
+            if entry.name.endswith(_EXCLUDED_SUFFIXES):
+                continue
+            rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+            if entry.is_dir(follow_symlinks=False):
+                if ignore is None or not ignore.ignored(rel, True):
+                    subdirs.append((entry.path, rel))
+            elif entry.is_file() and (ignore is None or not ignore.ignored(rel, False)):
+                files.append((Path(entry.path), rel))
+        # Reversed so the stack pops subdirectories in name order
+        stack.extend(reversed(subdirs))
+
+    return files
 
 
 def find_skill_name(skill_path: Path) -> str | None:
-    """Extract skill name from SKILL.md frontmatter."""
-    skill_md = skill_path / "SKILL.md"
-    if not skill_md.exists():
+    """Extract skill name from SKILL.md frontmatter.
+
+    Reads only the frontmatter header, never the body.
+    """
+    frontmatter = read_frontmatter(skill_path / "SKILL.md")
+    if not frontmatter:
         return None
 
-    content = skill_md.read_text()
-    for line in content.split('\n'):
-        line = line.strip()
-        if line.startswith('name:'):
-            return line.split(':', 1)[1].strip().strip('"').strip("'")
-    return None
+    name = frontmatter.get("name")
+    return name if isinstance(name, str) and name else None
 
 
-def collect_files(root: Path, skill_name: str) -> list[tuple[Path, str]]:
+def collect_files(
+    root: Path, skill_name: str, ignore: IgnoreMatcher | None = None
+) -> list[tuple[Path, str]]:
     """Collect all files to include in the package.
 
-    Returns list of (absolute_path, archive_path) tuples.
+    Returns list of (absolute_path, archive_path) tuples. ignore defaults
+    to the root's .skillignore, if any.
     """
+    if ignore is None:
+        ignore = IgnoreMatcher.from_file(root / SKILLIGNORE_FILE)
+
+    def keep(rel: str) -> bool:
+        return ignore is None or not ignore.ignored(rel, False)
+
     files: list[tuple[Path, str]] = []
 
     # Main skill directory
     main_dir = root / skill_name
     if main_dir.is_dir():
-        for f in main_dir.rglob('*'):
-            if f.is_file() and not should_exclude(f):
-                archive_path = str(f.relative_to(root))
-                files.append((f, archive_path))
+        files.extend(walk_files(main_dir, root, ignore))
 
     # Sub-skills directory
     skills_dir = root / "skills"
     if skills_dir.is_dir():
-        for sub_dir in skills_dir.iterdir():
+        for sub_dir in sorted(skills_dir.iterdir()):
             if sub_dir.is_dir() and sub_dir.name.startswith(f"{skill_name}-"):
-                for f in sub_dir.rglob('*'):
-                    if f.is_file() and not should_exclude(f):
-                        archive_path = str(f.relative_to(root))
-                        files.append((f, archive_path))
+                if ignore is None or not ignore.ignored(f"skills/{sub_dir.name}", True):
+                    files.extend(walk_files(sub_dir, root, ignore))
 
     # Agents directory
     agents_dir = root / "agents"
     if agents_dir.is_dir():
-        for f in agents_dir.glob(f"{skill_name}-*.md"):
-            if f.is_file():
-                archive_path = str(f.relative_to(root))
+        for f in sorted(agents_dir.glob(f"{skill_name}-*.md")):
+            archive_path = f"agents/{f.name}"
+            if f.is_file() and keep(archive_path):
                 files.append((f, archive_path))
 
     # Scripts directory
     scripts_dir = root / "scripts"
     if scripts_dir.is_dir():
-        for f in scripts_dir.rglob('*'):
-            if f.is_file() and not should_exclude(f):
-                archive_path = str(f.relative_to(root))
-                files.append((f, archive_path))
+        files.extend(walk_files(scripts_dir, root, ignore))
 
     # Install script
     install_sh = root / "install.sh"
-    if install_sh.exists():
+    if install_sh.exists() and keep("install.sh"):
         files.append((install_sh, "install.sh"))
 
     # LICENSE
     for license_name in ["LICENSE", "LICENSE.txt", "LICENSE.md"]:
         license_file = root / license_name
-        if license_file.exists():
+        if license_file.exists() and keep(license_name):
             files.append((license_file, license_name))
             break
 
     return files
 
 
-def package_skill(root_path: str, output_dir: str) -> dict[str, Any]:
-    """Package a skill into a .skill ZIP file."""
-    root = Path(root_path).resolve()
-    out = Path(output_dir).resolve()
+# --- Compression Policy ---
+
+COMPRESSION_METHODS = {
+    "stored": ZIP_STORED,
+    "deflate": ZIP_DEFLATED,
+    "bzip2": ZIP_BZIP2,
+    "lzma": ZIP_LZMA,
+}
+_METHOD_NAMES = {method: name for name, method in COMPRESSION_METHODS.items()}
+
+# Formats that are already compressed; deflating them only burns CPU
+STORED_EXTENSIONS = {
+    '.7z', '.avif', '.br', '.bz2', '.docx', '.gif', '.gz', '.heic', '.jar', '.jpeg',
+    '.jpg', '.m4a', '.mov', '.mp3', '.mp4', '.ogg', '.pdf', '.png', '.pptx', '.rar',
+    '.skill', '.tgz', '.webm', '.webp', '.whl', '.woff', '.woff2', '.xlsx', '.xz',
+    '.zip', '.zst',
+}
+
+# Text formats that always compress well; no probe needed
+TEXT_EXTENSIONS = {
+    '.cfg', '.css', '.csv', '.html', '.ini', '.js', '.json', '.jsonl', '.md', '.py',
+    '.rst', '.sh', '.sql', '.svg', '.toml', '.ts', '.tsv', '.txt', '.xml', '.yaml', '.yml',
+}
+
+PROBE_SAMPLE_BYTES = 16 * 1024
+PROBE_MIN_SAVING = 0.05
+
+
+def probe_compressible(raw: bytes) -> bool:
+    """Deflate up to three samples (start, middle, end) at level 1.
+
+    A file is worth compressing if the samples shrink by at least
+    PROBE_MIN_SAVING.
+    """
+    if len(raw) <= PROBE_SAMPLE_BYTES * 3:
+        sample = raw
+    else:
+        middle = len(raw) // 2
+        sample = b''.join((
+            raw[:PROBE_SAMPLE_BYTES],
+            raw[middle:middle + PROBE_SAMPLE_BYTES],
+            raw[-PROBE_SAMPLE_BYTES:],
+        ))
+    if not sample:
+        return False
+    return len(zlib.compress(sample, 1)) <= len(sample) * (1 - PROBE_MIN_SAVING)
+
+
+class CompressionPolicy:
+    """Pick a ZIP method per member: extension rules first, then a probe.
+
+    Extensions in rules (e.g. {".csv": ZIP_LZMA}) win; known compressed
+    formats are stored; known text uses method; anything else uses method
+    only if probe_compressible() says it will shrink.
+    """
+
+    __slots__ = ('method', 'level', 'rules')
+
+    def __init__(
+        self,
+        method: int = ZIP_DEFLATED,
+        level: int = DEFAULT_COMPRESS_LEVEL,
+        rules: dict[str, int] | None = None,
+    ) -> None:
+        self.method = method
+        self.level = level
+        self.rules = rules or {}
+
+    def choose(self, name: str, raw: bytes) -> tuple[int, str]:
+        """Return (method, reason) for one member."""
+        ext = os.path.splitext(name)[1].lower()
+        if ext in self.rules:
+            return self.rules[ext], "rule"
+        if ext in STORED_EXTENSIONS:
+            return ZIP_STORED, "compressed-format"
+        if ext in TEXT_EXTENSIONS:
+            return self.method, "text"
+        if probe_compressible(raw):
+            return self.method, "probe"
+        return ZIP_STORED, "probe"
+
+    def describe(self) -> dict[str, Any]:
+        """JSON form recorded in MANIFEST.json."""
+        return {
+            "method": _METHOD_NAMES[self.method],
+            "level": self.level,
+            "rules": {ext: _METHOD_NAMES[m] for ext, m in sorted(self.rules.items())},
+        }
+
+    def label(self, method: int) -> str:
+        """Report key for a method, e.g. "deflate-6" or "stored"."""
+        name = _METHOD_NAMES[method]
+        return name if method == ZIP_STORED else f"{name}-{self.level}"
+
+
+def parse_rules(specs: list[str]) -> dict[str, int]:
+    """Parse ["EXT=METHOD", ...] into {".ext": method}; raises ValueError."""
+    rules: dict[str, int] = {}
+    for spec in specs:
+        ext, sep, method = spec.partition("=")
+        if not sep or method not in COMPRESSION_METHODS or not ext:
+            raise ValueError(f"Invalid --rule '{spec}' (expected EXT=stored|deflate|bzip2|lzma)")
+        rules[ext.lower() if ext.startswith(".") else f".{ext.lower()}"] = COMPRESSION_METHODS[method]
+    return rules
+
+
+# --- Manifest ---
+
+MANIFEST_NAME = "MANIFEST.json"
+
+# Bump whenever archive layout or member encoding changes, so old packages
+# are rebuilt instead of reused
+PACKAGE_FORMAT_VERSION = 1
+
+
+def archive_date_time() -> tuple[int, int, int, int, int, int]:
+    """Timestamp for every member: SOURCE_DATE_EPOCH (UTC) if set, else 1980-01-01."""
+    epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    if epoch and epoch.isdigit():
+        return max(time.gmtime(int(epoch))[:6], ZIP_EPOCH)
+    return ZIP_EPOCH
+
+
+def hash_member(item: tuple[Path, str], cache: ResultCache | None = None) -> dict[str, Any]:
+    """Manifest entry for one source file: archive path, sha256, size, mode.
+
+    With a cache, the hash is looked up by (device, inode, size, mtime,
+    ctime), so an unmodified file, or another hard link to it, is read only
+    once. ctime is part of the key because tools such as unzip restore the
+    mtime of a file they rewrite in place; nothing can set ctime back.
+    """
+    path, name = item
+    stat = os.stat(path)
+    sha = None
+    if cache is not None:
+        key = hash_inputs([
+            "stat", str(stat.st_dev), str(stat.st_ino), str(stat.st_size),
+            str(stat.st_mtime_ns), str(stat.st_ctime_ns),
+        ])
+        sha = cache.get(key)
+    if not isinstance(sha, str):
+        sha = sha256_file(path)
+        if cache is not None:
+            cache.put(key, sha)
+    return {
+        "path": name,
+        "sha256": sha,
+        "size": stat.st_size,
+        "mode": 0o100755 if stat.st_mode & 0o111 else 0o100644,
+    }
+
+
+def build_manifest(
+    skill_name: str, entries: list[dict[str, Any]], policy: "CompressionPolicy"
+) -> dict[str, Any]:
+    """Describe a package completely enough to decide whether to rebuild it."""
+    return {
+        "format": PACKAGE_FORMAT_VERSION,
+        "skill_name": skill_name,
+        "date_time": list(archive_date_time()),
+        "compression": policy.describe(),
+        "files": [
+            {"path": e["path"], "sha256": e["sha256"], "size": e["size"], "mode": oct(e["mode"])}
+            for e in entries
+        ],
+    }
+
+
+def manifest_bytes(manifest: dict[str, Any]) -> bytes:
+    """Canonical serialization, so equal manifests are equal bytes."""
+    return (json.dumps(manifest, indent=2, sort_keys=True) + "\n").encode()
+
+
+def read_package_manifest(zip_path: Path) -> tuple[dict[str, Any], dict[str, zipfile.ZipInfo]] | None:
+    """Return (manifest, member infos) of an existing package, or None."""
+    try:
+        with zipfile.ZipFile(zip_path) as zf:
+            manifest = json.loads(zf.read(MANIFEST_NAME))
+            return manifest, {info.filename: info for info in zf.infolist()}
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+        return None
+
+
+# --- Compression Pipeline ---
+
+# method, CRC-32, uncompressed size, flags; followed by the compressed bytes
+_MEMBER_BLOB = struct.Struct('<HIQH')
+
+
+def member_cache_key(sha256: str, method: int, level: int) -> str:
+    """Cache key for a compressed member; the data depends only on these."""
+    return hash_inputs(["member", str(PACKAGE_FORMAT_VERSION), sha256, str(method), str(level)])
+
+
+def member_blob(member: ZipMember) -> bytes:
+    """Serialize a compressed member's data for the shared cache."""
+    return _MEMBER_BLOB.pack(member.method, member.crc, member.size, member.flags) + member.data
+
+
+def member_from_blob(
+    name: str, blob: bytes, date_time: tuple[int, ...], mode: int
+) -> ZipMember | None:
+    """Rebuild a ZipMember from member_blob() output, or None if it is malformed."""
+    if len(blob) < _MEMBER_BLOB.size:
+        return None
+    method, crc, size, flags = _MEMBER_BLOB.unpack_from(blob)
+    return ZipMember(name, method, crc, size, blob[_MEMBER_BLOB.size:], date_time, mode << 16, flags)
+
+
+def ordered_map(pool: ThreadPoolExecutor, fn, items: list, window: int):
+    """Like pool.map, but with at most window results in flight.
+
+    Results are yielded in input order, so a large early member cannot
+    leave every later compressed member buffered in memory.
+    """
+    pending: deque = deque()
+    for item in items:
+        pending.append(pool.submit(fn, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def write_package(
+    files: list[tuple[Path, str]],
+    zip_path: Path,
+    skill_name: str,
+    workers: int | None = None,
+    policy: CompressionPolicy | None = None,
+    incremental: bool = True,
+    cache: ResultCache | None = None,
+) -> dict[str, Any]:
+    """Build zip_path from files with a MANIFEST.json, reusing what it can.
+
+    Sources are hashed first. If the existing package's manifest matches,
+    nothing is written. Otherwise unchanged members are copied compressed
+    from the existing package, and the rest are compressed on a thread
+    pool while the calling thread writes members in a fixed order. Member
+    timestamps and modes are normalized, so equal inputs give a
+    byte-identical archive. A member that does not shrink is stored.
+
+    With a cache, file hashes and compressed members are shared by content
+    hash across packages and runs, so a file vendored into many skills is
+    compressed once.
+    """
+    policy = policy or CompressionPolicy()
+    workers = workers or min(32, os.cpu_count() or 1)
+    start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        entries = list(pool.map(lambda item: hash_member(item, cache), files))
+    manifest = build_manifest(skill_name, entries, policy)
+    date_time = tuple(manifest["date_time"])
+
+    previous = read_package_manifest(zip_path) if incremental else None
+    reusable: dict[str, zipfile.ZipInfo] = {}
+    if previous is not None:
+        old_manifest, old_infos = previous
+        if manifest_bytes(old_manifest) == manifest_bytes(manifest):
+            return {"unchanged": True, "workers": workers, "seconds": round(time.perf_counter() - start, 4)}
+        if {k: v for k, v in old_manifest.items() if k != "files"} == \
+                {k: v for k, v in manifest.items() if k != "files"}:
+            old_files = {(f["path"], f["sha256"], f["mode"]) for f in old_manifest.get("files", [])}
+            reusable = {
+                f["path"]: old_infos[f["path"]] for f in manifest["files"]
+                if (f["path"], f["sha256"], f["mode"]) in old_files and f["path"] in old_infos
+            }
 
-    # Find the main skill directory
-    skill_name = None
-    for item in root.iterdir():
+    tmp_path = zip_path.with_name(f"{zip_path.name}.{os.getpid()}.tmp")
+    per_policy: dict[str, dict[str, Any]] = {}
+    input_bytes = 0
+
+    cached = 0
+
+    # Returns (member, reason, seconds, cache hit); hits are summed by the
+    # caller so the worker threads share no counters
+    def compress(item: tuple[tuple[Path, str], dict[str, Any]]) -> tuple[ZipMember | None, str, float, bool]:
+        (path, name), entry = item
+        if name in reusable:
+            return None, "reused", 0.0, False
+        with open(path, 'rb') as f:
+            raw = f.read()
+        began = time.perf_counter()
+        method, reason = policy.choose(name, raw)
+        key = member_cache_key(entry["sha256"], method, policy.level)
+        if cache is not None and method != ZIP_STORED:
+            blob = cache.get_bytes(key)
+            member = member_from_blob(name, blob, date_time, entry["mode"]) if blob else None
+            if member is not None and member.size == len(raw):
+                if member.method == ZIP_STORED:
+                    member.data, reason = raw, "no-gain"
+                return member, reason, time.perf_counter() - began, True
+        member = make_member(name, raw, method, policy.level, date_time, entry["mode"])
+        if method != ZIP_STORED and len(member.data) >= member.size:
+            member = make_member(name, raw, ZIP_STORED, 0, date_time, entry["mode"])
+            reason = "no-gain"
+        if cache is not None and method != ZIP_STORED:
+            # Incompressible results are cached as a header only; the data is raw
+            stub = member if member.method != ZIP_STORED else ZipMember(
+                name, ZIP_STORED, member.crc, member.size, b'', date_time, 0, 0)
+            cache.put_bytes(key, member_blob(stub))
+        return member, reason, time.perf_counter() - began, False
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool, \
+                ZipStreamWriter(tmp_path) as writer, \
+                open(zip_path, 'rb') if reusable else nullcontext() as old_archive:
+            work = list(zip(files, entries))
+            for ((_, name), _), (member, reason, seconds, hit) in zip(
+                work, ordered_map(pool, compress, work, workers * 4)
+            ):
+                cached += hit
+                if member is None:
+                    member = read_raw_member(old_archive, reusable[name])
+                input_bytes += member.size
+                writer.add(member)
+                stats = per_policy.setdefault(policy.label(member.method), {
+                    "files": 0, "input_bytes": 0, "output_bytes": 0, "seconds": 0.0, "reasons": {},
+                })
+                stats["files"] += 1
+                stats["input_bytes"] += member.size
+                stats["output_bytes"] += len(member.data)
+                stats["seconds"] += seconds
+                stats["reasons"][reason] = stats["reasons"].get(reason, 0) + 1
+            writer.add(make_member(MANIFEST_NAME, manifest_bytes(manifest), ZIP_DEFLATED, 9, date_time))
+        os.replace(tmp_path, zip_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+    for stats in per_policy.values():
+        stats["saved_bytes"] = stats["input_bytes"] - stats["output_bytes"]
+        stats["seconds"] = round(stats["seconds"], 4)
+
+    elapsed = time.perf_counter() - start
+    output_bytes = zip_path.stat().st_size
+    return {
+        "unchanged": False,
+        "workers": workers,
+        "method": _METHOD_NAMES[policy.method],
+        "level": policy.level,
+        "reused": len(reusable),
+        "compressed": len(files) - len(reusable) - cached,
+        "cached": cached,
+        "input_bytes": input_bytes,
+        "output_bytes": output_bytes,
+        "ratio": round(output_bytes / input_bytes, 4) if input_bytes else 0.0,
+        "seconds": round(elapsed, 4),
+        "mb_per_second": round(input_bytes / elapsed / 1_000_000, 2) if elapsed > 0 else 0.0,
+        "policies": dict(sorted(per_policy.items())),
+    }
+
+
+# --- Delta Packages ---
+
+DELTA_NAME = "DELTA.json"
+DELTA_OBJECTS = "objects/"
+
+
+def build_delta(base_manifest: dict[str, Any], full_package: Path, delta_path: Path) -> dict[str, Any]:
+    """Write a delta package that turns the base manifest's tree into full_package's.
+
+    Members are content-addressed (objects/<sha256>), and only contents the
+    base does not already have anywhere are shipped, so renames and moves
+    cost nothing. Objects are copied compressed from full_package.
+    DELTA.json records the base and target manifests plus added, changed
+    and deleted paths.
+    """
+    target = read_package_manifest(full_package)
+    if target is None:
+        return {"error": f"Package has no readable {MANIFEST_NAME}: {full_package}"}
+    target_manifest, target_infos = target
+
+    base_files = {f["path"]: f for f in base_manifest["files"]}
+    target_files = {f["path"]: f for f in target_manifest["files"]}
+    base_hashes = {f["sha256"] for f in base_manifest["files"]}
+
+    added = [p for p in target_files if p not in base_files]
+    changed = [
+        p for p, f in target_files.items()
+        if p in base_files and (base_files[p]["sha256"], base_files[p]["mode"]) != (f["sha256"], f["mode"])
+    ]
+    deleted = [p for p in base_files if p not in target_files]
+
+    objects: dict[str, str] = {}
+    for path, entry in target_files.items():
+        if entry["sha256"] not in base_hashes:
+            objects.setdefault(entry["sha256"], path)
+
+    delta = {
+        "format": PACKAGE_FORMAT_VERSION,
+        "skill_name": target_manifest["skill_name"],
+        "base_manifest_sha256": hashlib.sha256(manifest_bytes(base_manifest)).hexdigest(),
+        "base_files": [{"path": f["path"], "sha256": f["sha256"]} for f in base_manifest["files"]],
+        "target": target_manifest,
+        "added": added,
+        "changed": changed,
+        "deleted": deleted,
+        "objects": sorted(objects),
+    }
+
+    date_time = tuple(target_manifest["date_time"])
+    tmp_path = delta_path.with_name(f"{delta_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(full_package, 'rb') as source, ZipStreamWriter(tmp_path) as writer:
+            writer.add(make_member(DELTA_NAME, manifest_bytes(delta), ZIP_DEFLATED, 9, date_time))
+            for sha in delta["objects"]:
+                member = read_raw_member(source, target_infos[objects[sha]])
+                member.name = f"{DELTA_OBJECTS}{sha}"
+                writer.add(member)
+        os.replace(tmp_path, delta_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+    delta_bytes = delta_path.stat().st_size
+    full_bytes = full_package.stat().st_size
+    return {
+        "package": str(delta_path),
+        "added": len(added),
+        "changed": len(changed),
+        "deleted": len(deleted),
+        "objects": len(objects),
+        "size_bytes": delta_bytes,
+        "full_size_bytes": full_bytes,
+        "ratio": round(delta_bytes / full_bytes, 4) if full_bytes else 0.0,
+    }
+
+
+def apply_delta(delta_path: Path, install_dir: Path) -> dict[str, Any]:
+    """Update an extracted package tree in place from a delta package.
+
+    install_dir is a full .skill extracted as-is (unzip NAME.skill -d DIR),
+    with MANIFEST.json at its root; the ~/.claude layout install_skill.py
+    produces has no manifest and is upgraded by installing the new .skill.
+
+    Every base file the update reads from is hashed and checked against
+    the delta's base manifest before anything is modified. New contents
+    are staged under the install directory and verified while they are
+    written. Deleted paths are then set aside first, so a path that
+    changes between file and directory never blocks its replacement;
+    every file the update overwrites is set aside too, and MANIFEST.json
+    is swapped in last. If any step fails, every change is undone in
+    reverse order. Files that are not part of the package are left alone.
+    """
+    try:
+        with zipfile.ZipFile(delta_path) as zf:
+            delta = json.loads(zf.read(DELTA_NAME))
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile) as exc:
+        return {"error": f"Not a delta package: {delta_path} ({exc})"}
+    if delta.get("format") != PACKAGE_FORMAT_VERSION:
+        return {"error": f"Unsupported delta format: {delta.get('format')}"}
+
+    installed_manifest = install_dir / MANIFEST_NAME
+    if installed_manifest.is_file() and installed_manifest.read_bytes() == manifest_bytes(delta["target"]):
+        return {"status": "up-to-date", "install_dir": str(install_dir), "skill_name": delta["skill_name"]}
+
+    base_sha = {e["path"]: e["sha256"] for e in delta["base_files"]}
+    base_by_sha: dict[str, str] = {}
+    for path, sha in base_sha.items():
+        base_by_sha.setdefault(sha, path)
+    objects = set(delta["objects"])
+    target_files = delta["target"]["files"]
+
+    hashes: dict[str, str | None] = {}
+
+    def installed_sha(path: str) -> str | None:
+        if path not in hashes:
+            file_path = install_dir / path
+            hashes[path] = sha256_file(file_path) if file_path.is_file() else None
+        return hashes[path]
+
+    # Plan every path that must be (re)written and where its bytes come from,
+    # verifying each installed file the update relies on before touching any
+    try:
+        plan: list[tuple[dict[str, Any], Path, str]] = []
+        for entry in target_files:
+            dest = safe_member_path(install_dir, entry["path"])
+            sha = entry["sha256"]
+            if base_sha.get(entry["path"]) == sha:
+                if installed_sha(entry["path"]) != sha:
+                    return {"error": f"{entry['path']}: installed file does not match the delta's base; "
+                                     "reinstall the full package"}
+                if oct(0o100000 | (dest.stat().st_mode & 0o777)) == entry["mode"]:
+                    continue
+                plan.append((entry, dest, entry["path"]))
+            elif sha in objects:
+                plan.append((entry, dest, "delta"))
+            elif sha in base_by_sha:
+                source = base_by_sha[sha]
+                if installed_sha(source) != sha:
+                    return {"error": f"{source}: installed file does not match the delta's base"}
+                plan.append((entry, dest, source))
+            else:
+                return {"error": f"{entry['path']}: content in neither base nor delta"}
+        deletions = [safe_member_path(install_dir, p) for p in delta["deleted"]]
+    except ValueError as exc:
+        return {"error": str(exc)}
+
+    staging = install_dir / f".delta-staging-{os.getpid()}"
+    backup = install_dir / f".delta-backup-{os.getpid()}"
+    written = 0
+    # Undo log: ("moved", path, set-aside copy), ("placed", path, None),
+    # ("mkdir", directory, None) or ("rmdir", directory, None)
+    journal: list[tuple[str, Path, Path | None]] = []
+
+    def set_aside(path: Path) -> None:
+        kept = backup / str(len(journal))
+        kept.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(path, kept)
+        journal.append(("moved", path, kept))
+
+    def remove_empty_parents(path: Path) -> None:
+        parent = path.parent
+        while parent != install_dir and parent.is_dir() and not any(parent.iterdir()):
+            parent.rmdir()
+            journal.append(("rmdir", parent, None))
+            parent = parent.parent
+
+    def place(stage: Path, dest: Path) -> None:
+        missing: list[Path] = []
+        parent = dest.parent
+        while not parent.is_dir():
+            missing.append(parent)
+            parent = parent.parent
+        for directory in reversed(missing):
+            directory.mkdir()
+            journal.append(("mkdir", directory, None))
+        if dest.is_dir() and not dest.is_symlink():
+            dest.rmdir()  # Only ever empty here; anything else is not ours to remove
+            journal.append(("rmdir", dest, None))
+        elif dest.exists() or dest.is_symlink():
+            set_aside(dest)
+        os.replace(stage, dest)
+        journal.append(("placed", dest, None))
+
+    try:
+        staged: list[tuple[Path, Path]] = []
+        with zipfile.ZipFile(delta_path) as zf:
+            for index, (entry, dest, source) in enumerate(plan):
+                mode = int(entry["mode"], 8)
+                stage = staging / str(index)
+                if source == "delta":
+                    info = zf.getinfo(f"{DELTA_OBJECTS}{entry['sha256']}")
+                    written += extract_verified(zf, info, stage, entry["sha256"], mode)
+                else:
+                    stage.parent.mkdir(parents=True, exist_ok=True)
+                    shutil.copyfile(install_dir / source, stage)
+                    os.chmod(stage, mode & 0o777)
+                staged.append((stage, dest))
+        manifest_stage = staging / MANIFEST_NAME
+        manifest_stage.parent.mkdir(parents=True, exist_ok=True)
+        manifest_stage.write_bytes(manifest_bytes(delta["target"]))
+
+        for path in deletions:
+            if path.exists() or path.is_symlink():
+                set_aside(path)
+                remove_empty_parents(path)
+        for stage, dest in staged:
+            place(stage, dest)
+        place(manifest_stage, install_dir / MANIFEST_NAME)
+    except (OSError, ValueError, zipfile.BadZipFile) as exc:
+        restored = True
+        for kind, path, kept in reversed(journal):
+            try:
+                if kind == "moved":
+                    os.replace(kept, path)
+                elif kind == "placed":
+                    path.unlink(missing_ok=True)
+                elif kind == "mkdir":
+                    path.rmdir()
+                else:
+                    path.mkdir(exist_ok=True)
+            except OSError:
+                restored = False
+        if not restored:
+            return {"error": f"Delta apply failed and could not be fully undone; "
+                             f"set-aside files are kept in {backup}: {exc}"}
+        shutil.rmtree(backup, ignore_errors=True)
+        return {"error": f"Delta apply failed, installed tree restored: {exc}"}
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    shutil.rmtree(backup, ignore_errors=True)
+
+    return {
+        "status": "success",
+        "install_dir": str(install_dir),
+        "skill_name": delta["skill_name"],
+        "written": len(plan),
+        "deleted": len(deletions),
+        "unchanged": len(target_files) - len(plan),
+        "bytes_from_delta": written,
+    }
+
+
+def find_root_skill(root: Path) -> str | None:
+    """Name of the first directory under root with a named SKILL.md."""
+    for item in sorted(root.iterdir()):
         if item.is_dir() and (item / "SKILL.md").exists():
             skill_name = find_skill_name(item)
             if skill_name:
-                break
+                return skill_name
+    return None
+
+
+def package_skill(
+    root_path: str,
+    output_dir: str,
+    workers: int | None = None,
+    policy: CompressionPolicy | None = None,
+    incremental: bool = True,
+    delta_from: Path | None = None,
+    cache: ResultCache | None = None,
+) -> dict[str, Any]:
+    """Package a skill into a .skill ZIP file.
+
+    With delta_from (a previous .skill), a delta package against it is
+    also written next to the full package.
+    """
+    root = Path(root_path).resolve()
+    out = Path(output_dir).resolve()
 
+    skill_name = find_root_skill(root)
     if not skill_name:
         return {"error": "No valid skill found (no SKILL.md with name field)"}
 
@@ -139,38 +943,257 @@ def package_skill(root_path: str, output_dir: str) -> dict[str, Any]:
     # Create output directory
     out.mkdir(parents=True, exist_ok=True)
 
+    # Read the delta base first: it is often the package about to be replaced
+    base_manifest = None
+    if delta_from is not None:
+        base = read_package_manifest(delta_from)
+        if base is None:
+            return {"error": f"Base package has no readable {MANIFEST_NAME}: {delta_from}"}
+        base_manifest, _ = base
+
     # Create ZIP
     zip_path = out / f"{skill_name}.skill"
-    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zf:
-        for abs_path, arc_path in files:
-            zf.write(abs_path, arc_path)
+    compression = write_package(files, zip_path, skill_name, workers, policy, incremental, cache)
 
-    return {
+    result = {
         "status": "success",
         "skill_name": skill_name,
         "package": str(zip_path),
         "files_included": len(files),
         "size_bytes": zip_path.stat().st_size,
+        "compression": compression,
         "files": [arc for _, arc in files],
     }
+    if base_manifest is not None:
+        delta = build_delta(base_manifest, zip_path, out / f"{skill_name}.delta.skill")
+        if "error" in delta:
+            return delta
+        result["delta"] = delta
+    return result
+
+
+# --- Batch Packaging ---
+
+def expand_roots(patterns: list[str]) -> list[Path]:
+    """Expand root arguments (plain paths or globs) into unique directories, in order."""
+    roots: list[Path] = []
+    seen: set[Path] = set()
+    for pattern in patterns:
+        pattern = os.path.expanduser(pattern)
+        matches = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+        for match in matches:
+            path = Path(match).resolve()
+            if path.is_dir() and path not in seen:
+                seen.add(path)
+                roots.append(path)
+    return roots
+
+
+def package_batch_entry(
+    root: str,
+    output_dir: str,
+    policy: CompressionPolicy,
+    incremental: bool,
+    cache_dir: str | None,
+) -> dict[str, Any]:
+    """Package one root in a worker process.
+
+    Top-level so it can be pickled; each worker opens the shared on-disk
+    cache itself and compresses on a single thread, since the pool already
+    spreads work across CPUs.
+    """
+    cache = ResultCache(Path(cache_dir)) if cache_dir else None
+    result = package_skill(root, output_dir, 1, policy, incremental, cache=cache)
+    result.pop("files", None)
+    result["root"] = root
+    if cache is not None:
+        result["cache"] = {"hits": cache.hits, "misses": cache.misses}
+    return result
+
+
+def package_batch(
+    roots: list[Path],
+    output_dir: str,
+    workers: int | None = None,
+    policy: CompressionPolicy | None = None,
+    incremental: bool = True,
+    cache: ResultCache | None = None,
+) -> dict[str, Any]:
+    """Package many skill roots across a process pool into one output directory.
+
+    Roots whose skill name collides with an earlier root are rejected
+    before any work starts. Workers share the on-disk cache, so a file
+    vendored into many roots is compressed once. Returns one aggregate
+    report with per-package results in root order.
+    """
+    policy = policy or CompressionPolicy()
+    start = time.perf_counter()
+    cache_arg = str(cache.root) if cache else None
+
+    results: dict[Path, dict[str, Any]] = {}
+    owners: dict[str, Path] = {}
+    jobs: list[Path] = []
+    for root in roots:
+        name = find_root_skill(root)
+        if name is None:
+            results[root] = {"root": str(root), "error": "No valid skill found (no SKILL.md with name field)"}
+        elif name in owners:
+            results[root] = {"root": str(root), "error": f"Skill name '{name}' already packaged from {owners[name]}"}
+        else:
+            owners[name] = root
+            jobs.append(root)
+
+    if workers == 1 or len(jobs) <= 1:
+        for root in jobs:
+            results[root] = package_batch_entry(str(root), output_dir, policy, incremental, cache_arg)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(package_batch_entry, str(root), output_dir, policy, incremental, cache_arg): root
+                for root in jobs
+            }
+            for future in as_completed(futures):
+                root = futures[future]
+                try:
+                    results[root] = future.result()
+                except Exception as exc:  # A crashed worker fails its root, not the batch
+                    results[root] = {"root": str(root), "error": f"{type(exc).__name__}: {exc}"}
+
+    packages = [results[root] for root in roots]
+    built = [r for r in packages if "error" not in r]
+    compression = [r["compression"] for r in built]
+    return {
+        "status": "success" if len(built) == len(packages) else "partial",
+        "output": str(Path(output_dir).resolve()),
+        "workers": workers or os.cpu_count() or 1,
+        "packages": packages,
+        "totals": {
+            "roots": len(packages),
+            "packaged": len(built),
+            "failed": len(packages) - len(built),
+            "unchanged": sum(1 for c in compression if c["unchanged"]),
+            "files": sum(r["files_included"] for r in built),
+            "compressed": sum(c.get("compressed", 0) for c in compression),
+            "cached": sum(c.get("cached", 0) for c in compression),
+            "reused": sum(c.get("reused", 0) for c in compression),
+            "input_bytes": sum(c.get("input_bytes", 0) for c in compression),
+            "output_bytes": sum(r["size_bytes"] for r in built),
+            "cache_hits": sum(r.get("cache", {}).get("hits", 0) for r in built),
+            "cache_misses": sum(r.get("cache", {}).get("misses", 0) for r in built),
+        },
+        "seconds": round(time.perf_counter() - start, 3),
+    }
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
-        description="Package a Claude Code skill for distribution"
+        description="Package a Claude Code skill for distribution",
+        fromfile_prefix_chars="@",
+    )
+    parser.add_argument(
+        "paths", nargs="+", metavar="path",
+        help="Skill root directory (with --batch: several roots or globs; @FILE reads one per line)"
+    )
+    parser.add_argument(
+        "--batch", action="store_true",
+        help="Package every given root across a process pool and print one aggregate report"
     )
-    parser.add_argument("path", help="Path to skill root directory")
     parser.add_argument(
         "--output", "-o", default="./dist",
         help="Output directory for .skill file (default: ./dist)"
     )
+    parser.add_argument(
+        "--workers", "-j", type=int, default=None,
+        help="Compression threads; with --batch, worker processes (default: CPU count)"
+    )
+    parser.add_argument(
+        "--method", choices=["deflate", "bzip2", "lzma"], default="deflate",
+        help="Method for compressible members (default: deflate; lzma/bzip2 need Python's zipfile or 7-Zip to extract)"
+    )
+    parser.add_argument(
+        "--level", type=int, default=DEFAULT_COMPRESS_LEVEL, choices=range(0, 10), metavar="0-9",
+        help=f"Compression level / preset for --method (default: {DEFAULT_COMPRESS_LEVEL})"
+    )
+    parser.add_argument(
+        "--force", action="store_true",
+        help="Rebuild from scratch instead of reusing the existing package"
+    )
+    parser.add_argument(
+        "--delta-from", metavar="OLD.skill",
+        help="Also write <name>.delta.skill with only what changed since OLD.skill"
+    )
+    parser.add_argument(
+        "--apply-delta", metavar="DELTA.skill",
+        help="Update the extracted package at PATH (unzip of the base .skill, with MANIFEST.json) from a delta package"
+    )
+    parser.add_argument(
+        "--rule", action="append", default=[], metavar="EXT=METHOD",
+        help="Per-extension override, e.g. --rule .csv=lzma --rule .bin=stored (repeatable)"
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Ignore and do not update the shared hash and compressed-member cache"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="Cache directory (default: ~/.cache/skill-forge/package)"
+    )
+    parser.add_argument(
+        "--cache-max-mb", type=float, default=PACKAGE_CACHE_MAX_BYTES / (1024 * 1024),
+        help=f"Evict least recently used cache entries beyond this size (default: {PACKAGE_CACHE_MAX_BYTES >> 20})"
+    )
     args = parser.parse_args()
 
-    if not os.path.isdir(args.path):
-        print(json.dumps({"error": f"Not a directory: {args.path}"}), file=sys.stderr)
+    if not args.batch and len(args.paths) > 1:
+        parser.error("several paths need --batch")
+    if args.batch and (args.apply_delta or args.delta_from):
+        parser.error("--batch cannot be combined with --apply-delta or --delta-from")
+    if not args.batch and not os.path.isdir(args.paths[0]):
+        print(json.dumps({"error": f"Not a directory: {args.paths[0]}"}), file=sys.stderr)
+        sys.exit(1)
+    if args.workers is not None and args.workers < 1:
+        print(json.dumps({"error": "--workers must be >= 1"}), file=sys.stderr)
+        sys.exit(1)
+
+    if args.apply_delta:
+        result = apply_delta(Path(args.apply_delta).expanduser(), Path(args.paths[0]).resolve())
+        if "error" in result:
+            print(json.dumps(result), file=sys.stderr)
+            sys.exit(1)
+        print(json.dumps(result, indent=2))
+        sys.exit(0)
+
+    delta_from = Path(args.delta_from).expanduser().resolve() if args.delta_from else None
+    if delta_from is not None and not delta_from.is_file():
+        print(json.dumps({"error": f"Not a file: {args.delta_from}"}), file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        rules = parse_rules(args.rule)
+    except ValueError as exc:
+        print(json.dumps({"error": str(exc)}), file=sys.stderr)
         sys.exit(1)
+    policy = CompressionPolicy(COMPRESSION_METHODS[args.method], args.level, rules)
+
+    cache = None
+    if not args.no_cache:
+        cache_root = Path(args.cache_dir).expanduser() if args.cache_dir else default_cache_dir("package")
+        cache = ResultCache(cache_root, int(args.cache_max_mb * 1024 * 1024))
+
+    if args.batch:
+        roots = expand_roots(args.paths)
+        if not roots:
+            print(json.dumps({"error": "No directories match the given roots"}), file=sys.stderr)
+            sys.exit(1)
+        result = package_batch(roots, args.output, args.workers, policy, not args.force, cache)
+        if cache:
+            result["totals"]["cache_evicted"] = cache.prune()
+        print(json.dumps(result, indent=2))
+        sys.exit(0 if result["totals"]["failed"] == 0 else 1)
 
-    result = package_skill(args.path, args.output)
+    result = package_skill(args.paths[0], args.output, args.workers, policy, not args.force, delta_from, cache)
+    if cache:
+        cache.prune()
 
     if "error" in result:
         print(json.dumps(result), file=sys.stderr)
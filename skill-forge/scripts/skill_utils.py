@@ -6,8 +6,256 @@ Output: N/A (library module)
 Usage: from skill_utils import parse_frontmatter
 """
 
+import bisect
+import hashlib
+import importlib
+import json
+import os
 import re
-from typing import Any
+import struct
+import zlib
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+
+# --- Frontmatter Parsing ---
+
+# Compiled once at import; the parser is the hottest loop of catalog-wide runs.
+_CLOSING_DELIMITER_RE = re.compile(r'^---[ \t]*\r?$', re.MULTILINE)
+_KEY_VALUE_RE = re.compile(r'([A-Za-z_][\w.-]*)[ \t]*:(?:[ \t]+(.*))?$')
+_BLOCK_SCALAR_RE = re.compile(r'([|>])[+-]?[1-9]?$')
+_CLOSING_DELIMITER_BYTES_RE = re.compile(rb'---[ \t]*\r?\n?$')
+
+# Bounds for header-only reads: no single read exceeds one line chunk, and a
+# file with no closing delimiter is abandoned after the header budget.
+HEADER_CHUNK_BYTES = 8 * 1024
+HEADER_MAX_BYTES = 256 * 1024
+
+
+def locate_frontmatter(content: str) -> tuple[int, int, int] | None:
+    """Find the frontmatter block without copying any text.
+
+    Returns (yaml_start, yaml_end, body_start) offsets into content, or None
+    when the opening '---' or the closing '---' line is missing. Callers
+    slice the YAML text and body themselves, only when they need them.
+    """
+    if not content.startswith('---'):
+        return None
+
+    yaml_start = content.find('\n') + 1
+    if yaml_start == 0:
+        return None
+
+    closing = _CLOSING_DELIMITER_RE.search(content, yaml_start)
+    if not closing:
+        return None
+
+    return yaml_start, closing.start(), closing.end()
+
+
+def _indent_of(line: str) -> int:
+    """Return the number of leading spaces on a line."""
+    return len(line) - len(line.lstrip(' '))
+
+
+def _next_content_line(lines: list[str], i: int) -> int:
+    """Return the index of the next non-blank, non-comment line at or after i."""
+    n = len(lines)
+    while i < n:
+        stripped = lines[i].strip()
+        if stripped and not stripped.startswith('#'):
+            return i
+        i += 1
+    return n
+
+
+def _parse_scalar(value: str) -> Any:
+    """Convert an inline YAML scalar to a Python value.
+
+    Quoted strings are unquoted and simple flow sequences ([a, b]) become
+    lists. Everything else stays a string, so 'true' and '1.0' are kept
+    verbatim for the callers that compare them as text.
+    """
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in ('"', "'"):
+        inner = value[1:-1]
+        if value[0] == '"':
+            return inner.replace('\\"', '"')
+        return inner.replace("''", "'")
+
+    if len(value) >= 2 and value[0] == '[' and value[-1] == ']':
+        inner = value[1:-1].strip()
+        if not inner:
+            return []
+        return [_parse_scalar(item.strip()) for item in inner.split(',')]
+
+    return value.strip('"').strip("'")
+
+
+def _parse_block_scalar(
+    lines: list[str], i: int, parent_indent: int, folded: bool
+) -> tuple[str, int]:
+    """Parse a '>' (folded) or '|' (literal) block scalar starting at line i."""
+    n = len(lines)
+    block_indent = -1
+    collected: list[str] = []
+
+    while i < n:
+        line = lines[i]
+        if not line.strip():
+            collected.append('')
+            i += 1
+            continue
+        indent = _indent_of(line)
+        if indent <= parent_indent:
+            break
+        if block_indent < 0:
+            block_indent = indent
+        collected.append(line[min(indent, block_indent):].rstrip())
+        i += 1
+
+    if not folded:
+        return '\n'.join(collected).strip(), i
+
+    # Folded: single newlines become spaces, blank lines become newlines
+    parts: list[str] = []
+    for line in collected:
+        if not line:
+            parts.append('\n')
+        elif parts and parts[-1] != '\n':
+            parts.append(' ' + line.strip())
+        else:
+            parts.append(line.strip())
+    return ''.join(parts).strip(), i
+
+
+def _parse_value(
+    lines: list[str], i: int, value: str, indent: int
+) -> tuple[Any, int]:
+    """Parse the value of a 'key:' line whose own indentation is indent.
+
+    Line i is the first line after the key. Returns (value, next_index).
+    """
+    block = _BLOCK_SCALAR_RE.match(value)
+    if block:
+        return _parse_block_scalar(lines, i, indent, block.group(1) == '>')
+
+    if value:
+        # Plain scalars may continue on more-indented lines
+        n = len(lines)
+        while i < n:
+            line = lines[i]
+            stripped = line.strip()
+            if not stripped or _indent_of(line) <= indent:
+                break
+            value += ' ' + stripped
+            i += 1
+        return _parse_scalar(value), i
+
+    j = _next_content_line(lines, i)
+    if j == len(lines):
+        return '', j
+
+    child_indent = _indent_of(lines[j])
+    child = lines[j].lstrip(' ')
+    if child.startswith('-') and child_indent >= indent and (child == '-' or child[1] in ' \t'):
+        return _parse_sequence(lines, j, child_indent)
+    if child_indent > indent:
+        return _parse_mapping(lines, j, child_indent)
+    return '', i
+
+
+def _parse_sequence(lines: list[str], i: int, indent: int) -> tuple[list[Any], int]:
+    """Parse a block sequence whose '-' markers sit at the given indentation."""
+    items: list[Any] = []
+    n = len(lines)
+
+    while True:
+        i = _next_content_line(lines, i)
+        if i >= n:
+            break
+        line = lines[i]
+        line_indent = _indent_of(line)
+        stripped = line.strip()
+        if line_indent != indent or not (stripped == '-' or stripped.startswith(('- ', '-\t'))):
+            break
+
+        item = stripped[1:].strip()
+        if not item:
+            value, i = _parse_value(lines, i + 1, '', indent)
+            items.append(value)
+            continue
+
+        if _KEY_VALUE_RE.match(item) and not item.startswith(('"', "'")):
+            # Mapping inside a list item: re-anchor the first key at its own
+            # column so the remaining keys line up under it.
+            item_indent = line_indent + (len(line.rstrip()) - line_indent - len(item))
+            lines[i] = ' ' * item_indent + item
+            value, i = _parse_mapping(lines, i, item_indent)
+            items.append(value)
+            continue
+
+        items.append(_parse_scalar(item))
+        i += 1
+
+    return items, i
+
+
+def _parse_mapping(lines: list[str], i: int, indent: int) -> tuple[dict[str, Any], int]:
+    """Parse a block mapping whose keys sit at the given indentation."""
+    mapping: dict[str, Any] = {}
+    n = len(lines)
+
+    while True:
+        i = _next_content_line(lines, i)
+        if i >= n:
+            break
+        line = lines[i]
+        line_indent = _indent_of(line)
+        if line_indent < indent:
+            break
+        stripped = line.strip()
+        if line_indent > indent:
+            # Stray continuation line with no owner; skip it
+            i += 1
+            continue
+        if stripped == '-' or stripped.startswith(('- ', '-\t')):
+            break
+
+        match = _KEY_VALUE_RE.match(stripped)
+        if not match:
+            i += 1
+            continue
+
+        key = match.group(1)
+        value = (match.group(2) or '').strip()
+        mapping[key], i = _parse_value(lines, i + 1, value, line_indent)
+
+    return mapping, i
+
+
+def parse_frontmatter_fields(yaml_text: str) -> dict[str, Any]:
+    """Parse the YAML text between the '---' delimiters into a dict.
+
+    Supports the subset used by SKILL.md and agent files: scalar and quoted
+    values, '>' and '|' block scalars, nested mappings (metadata, hooks),
+    block and flow sequences, and sequences of mappings. Every line is
+    visited once, so the cost is linear in the size of the header.
+    """
+    lines = yaml_text.splitlines()
+    start = _next_content_line(lines, 0)
+    if start == len(lines):
+        return {}
+    frontmatter, _ = _parse_mapping(lines, start, _indent_of(lines[start]))
+    return frontmatter
+
+
+def _strip_bounds(content: str, start: int, end: int) -> tuple[int, int]:
+    """Return (start, end) narrowed to exclude surrounding whitespace."""
+    while start < end and content[start].isspace():
+        start += 1
+    while end > start and content[end - 1].isspace():
+        end -= 1
+    return start, end
 
 
 def parse_frontmatter(content: str) -> tuple[dict[str, Any] | None, str, list[str]]:
@@ -16,71 +264,55 @@ def parse_frontmatter(content: str) -> tuple[dict[str, Any] | None, str, list[st
     Returns (frontmatter_dict, body, errors).
     Uses basic parsing to avoid PyYAML dependency.
     """
-    errors: list[str] = []
-
     if not content.startswith('---'):
         return None, content, ["Missing opening '---' delimiter"]
 
-    parts = content.split('---', 2)
-    if len(parts) < 3:
+    bounds = locate_frontmatter(content)
+    if bounds is None:
         return None, content, ["Missing closing '---' delimiter"]
 
-    yaml_text = parts[1].strip()
-    body = parts[2].strip()
+    yaml_start, yaml_end, body_start = bounds
+    body_start, body_end = _strip_bounds(content, body_start, len(content))
+    body = content[body_start:body_end]
 
-    if not yaml_text:
+    yaml_start, yaml_end = _strip_bounds(content, yaml_start, yaml_end)
+    if yaml_start == yaml_end:
         return None, body, ["Empty frontmatter"]
 
-    frontmatter: dict[str, Any] = {}
-    current_key = ""
-    current_value = ""
-    in_multiline = False
-    in_list = False
-    current_list: list[str] = []
+    return parse_frontmatter_fields(content[yaml_start:yaml_end]), body, []
 
-    for line in yaml_text.split('\n'):
-        stripped = line.strip()
 
-        if in_multiline:
-            if stripped and not re.match(r'^[a-z_-]+:', stripped):
-                current_value += " " + stripped
-                continue
-            else:
-                frontmatter[current_key] = current_value.strip()
-                in_multiline = False
+def read_frontmatter(path: Path | str) -> dict[str, Any] | None:
+    """Read and parse only the frontmatter of a SKILL.md or agent file.
 
-        if in_list:
-            if stripped.startswith('- '):
-                current_list.append(stripped[2:].strip())
-                continue
-            else:
-                frontmatter[current_key] = current_list
-                in_list = False
-                current_list = []
-
-        match = re.match(r'^([a-z_-]+):\s*(.*)', stripped)
-        if match:
-            current_key = match.group(1)
-            value = match.group(2).strip()
-
-            if value == '>':
-                in_multiline = True
-                current_value = ""
-            elif value == '|':
-                in_multiline = True
-                current_value = ""
-            elif value == '':
-                in_list = True
-                current_list = []
-            else:
-                frontmatter[current_key] = value.strip('"').strip("'")
+    Streams the file line by line with bounded buffered reads and stops at
+    the closing '---' delimiter, so the body is never read from disk.
+    Returns None when the file is missing, has no frontmatter, or the
+    header exceeds HEADER_MAX_BYTES without closing.
+    """
+    header: list[bytes] = []
+    total = 0
+    at_line_start = True
 
-    if in_multiline:
-        frontmatter[current_key] = current_value.strip()
-    if in_list and current_list:
-        frontmatter[current_key] = current_list
+    try:
+        with open(path, 'rb', buffering=HEADER_CHUNK_BYTES) as f:
+            if not f.readline(HEADER_CHUNK_BYTES).startswith(b'---'):
+                return None
+            while total < HEADER_MAX_BYTES:
+                chunk = f.readline(HEADER_CHUNK_BYTES)
+                if not chunk:
+                    return None
+                if at_line_start and _CLOSING_DELIMITER_BYTES_RE.match(chunk):
+                    break
+                header.append(chunk)
+                total += len(chunk)
+                at_line_start = chunk.endswith(b'\n')
+            else:
+                return None
+    except OSError:
+        return None
 
-    return frontmatter, body, errors
+    return parse_frontmatter_fields(b''.join(header).decode('utf-8', errors='replace'))
 
 
 def parse_frontmatter_simple(content: str) -> tuple[dict[str, Any] | None, str]:
@@ -90,3 +322,641 @@ def parse_frontmatter_simple(content: str) -> tuple[dict[str, Any] | None, str]:
     """
     frontmatter, body, _ = parse_frontmatter(content)
     return frontmatter, body
+
+
+# --- Text Analysis ---
+
+_QUOTED_PHRASE_RE = re.compile(r'"([^"]+)"')
+_KEYWORD_RE = re.compile(r'[a-z]+(?:-[a-z]+)*')
+_HEADING_RE = re.compile(r'(#{1,6})[ \t]+(.+?)[ \t#]*$')
+_FENCE_PREFIXES = ('```', '~~~')
+
+KEYWORD_STOP_WORDS = frozenset({
+    'use', 'when', 'user', 'says', 'the', 'and', 'for', 'with', 'that',
+    'this', 'from', 'are', 'was', 'were', 'been', 'have', 'has', 'had',
+    'will', 'would', 'could', 'should', 'may', 'might', 'can', 'does',
+    'not', 'but', 'also', 'more', 'into', 'than', 'then', 'its', 'all',
+    'any', 'each', 'both', 'such', 'only', 'own', 'same', 'other',
+})
+
+
+def extract_trigger_phrases(description: str) -> list[str]:
+    """Extract quoted trigger phrases from the description."""
+    return _QUOTED_PHRASE_RE.findall(description)
+
+
+def extract_keywords(description: str, limit: int | None = 20) -> list[str]:
+    """Extract domain keywords from the description, deduplicated in order."""
+    seen: set[str] = set()
+    unique: list[str] = []
+    for w in _KEYWORD_RE.findall(description.lower()):
+        if len(w) > 3 and w not in KEYWORD_STOP_WORDS and w not in seen:
+            seen.add(w)
+            unique.append(w)
+            if limit is not None and len(unique) >= limit:
+                break
+    return unique
+
+
+# --- Token Estimation ---
+
+_TOKEN_PIECE_RE = re.compile(
+    r"(?P<contraction>'(?:s|t|re|ve|m|ll|d)\b)"
+    r"|(?P<upper> ?[A-Z]{2,}(?![a-z]))"
+    r"|(?P<word> ?[A-Za-z]+)"
+    r"|(?P<number> ?[0-9]{1,3})"
+    r"|(?P<wide> ?[^\x00-\x7f]+)"
+    r"|(?P<punct> ?[!-/:-@\[-`{-~]+)"
+    r"|(?P<space>\s+)"
+)
+
+
+def heuristic_token_count(text: str) -> int:
+    """Estimate BPE token count offline, without a vocabulary.
+
+    Splits text the way byte-pair tokenizers pre-tokenize it (words with a
+    leading space, digit groups, punctuation runs, whitespace runs) and
+    prices each piece: short words are one token, long words and acronyms
+    split further, punctuation pairs up, and non-ASCII runs cost about one
+    token per character. Tracks real tokenizers far better than chars/4 on
+    markdown full of code, paths and tables.
+    """
+    count = 0
+    for match in _TOKEN_PIECE_RE.finditer(text):
+        kind = match.lastgroup
+        length = match.end() - match.start()
+        if kind == "word":
+            length -= match.group().startswith(' ')
+            count += (length + 5) // 6
+        elif kind == "upper":
+            length -= match.group().startswith(' ')
+            count += (length + 2) // 3
+        elif kind == "punct":
+            count += (length + 1) // 2
+        elif kind == "wide":
+            count += length - match.group().startswith(' ')
+        elif kind == "space":
+            count += 1 + length // 16
+        else:
+            count += 1
+    return count
+
+
+def chars_token_count(text: str) -> int:
+    """The classic rough estimate: ~4 characters per token."""
+    return len(text) // 4
+
+
+TOKENIZERS: dict[str, Callable[[str], int]] = {
+    "heuristic": heuristic_token_count,
+    "chars4": chars_token_count,
+}
+
+
+def load_tokenizer(spec: str = "heuristic") -> Callable[[str], int]:
+    """Return a token counting function by name or 'module:function' path.
+
+    Built-ins are listed in TOKENIZERS. A 'module:function' spec plugs in
+    any offline counter importable from sys.path, e.g. a wrapper around a
+    locally installed BPE vocabulary. Raises ValueError for unknown specs.
+    """
+    if spec in TOKENIZERS:
+        return TOKENIZERS[spec]
+
+    module_name, sep, attr = spec.partition(':')
+    if not sep or not module_name or not attr:
+        known = ", ".join(sorted(TOKENIZERS))
+        raise ValueError(f"Unknown tokenizer '{spec}' (use one of: {known}, or module:function)")
+    try:
+        counter = getattr(importlib.import_module(module_name), attr)
+    except (ImportError, AttributeError) as exc:
+        raise ValueError(f"Cannot load tokenizer '{spec}': {exc}") from exc
+    if not callable(counter):
+        raise ValueError(f"Tokenizer '{spec}' is not callable")
+    return counter
+
+
+# --- Skill Document ---
+
+_UNSET: Any = object()
+
+
+class SkillDocument:
+    """A parsed SKILL.md with lazily computed, memoized views.
+
+    Parse a skill once and hand the same object to validation, conversion,
+    eval generation and optimization. Each view is computed on first access
+    and cached on the instance; nothing is derived until it is asked for.
+    """
+
+    __slots__ = (
+        'content', 'path',
+        '_frontmatter', '_body', '_errors',
+        '_lines', '_line_offsets', '_headings',
+        '_quoted_phrases', '_keywords', '_token_estimate', '_matches',
+        '_body_line',
+    )
+
+    def __init__(self, content: str, path: Path | None = None) -> None:
+        self.content = content
+        self.path = path
+        self._frontmatter: dict[str, Any] | None = _UNSET
+        self._body: str = _UNSET
+        self._errors: list[str] = _UNSET
+        self._lines: list[str] | None = None
+        self._line_offsets: list[int] | None = None
+        self._headings: list[tuple[int, int, str]] | None = None
+        self._quoted_phrases: list[str] | None = None
+        self._keywords: list[str] | None = None
+        self._token_estimate: int | None = None
+        self._matches: dict[re.Pattern[str], list[re.Match[str]]] | None = None
+        self._body_line: int | None = None
+
+    @classmethod
+    def from_path(cls, path: Path | str) -> "SkillDocument":
+        """Load a SKILL.md (or agent .md) file from disk."""
+        path = Path(path)
+        return cls(path.read_text(), path)
+
+    @classmethod
+    def from_body(cls, body: str) -> "SkillDocument":
+        """Wrap body text that has no frontmatter of its own."""
+        document = cls(body)
+        document._frontmatter = None
+        document._body = body
+        document._errors = []
+        return document
+
+    def _parse(self) -> None:
+        self._frontmatter, self._body, self._errors = parse_frontmatter(self.content)
+
+    @property
+    def frontmatter(self) -> dict[str, Any] | None:
+        """Parsed frontmatter fields, or None when the header is invalid."""
+        if self._frontmatter is _UNSET:
+            self._parse()
+        return self._frontmatter
+
+    @property
+    def body(self) -> str:
+        """Body text after the closing delimiter, stripped."""
+        if self._body is _UNSET:
+            self._parse()
+        return self._body
+
+    @property
+    def errors(self) -> list[str]:
+        """Frontmatter parse errors."""
+        if self._errors is _UNSET:
+            self._parse()
+        return self._errors
+
+    @property
+    def name(self) -> str:
+        """The 'name' field, or '' when absent."""
+        value = (self.frontmatter or {}).get("name", "")
+        return value if isinstance(value, str) else ""
+
+    @property
+    def description(self) -> str:
+        """The 'description' field, or '' when absent."""
+        value = (self.frontmatter or {}).get("description", "")
+        return value if isinstance(value, str) else ""
+
+    @property
+    def lines(self) -> list[str]:
+        """Body split into lines."""
+        if self._lines is None:
+            self._lines = self.body.split('\n')
+        return self._lines
+
+    @property
+    def line_offsets(self) -> list[int]:
+        """Character offset in the body at which each line starts."""
+        if self._line_offsets is None:
+            offsets = [0]
+            position = 0
+            for line in self.lines[:-1]:
+                position += len(line) + 1
+                offsets.append(position)
+            self._line_offsets = offsets
+        return self._line_offsets
+
+    def line_number(self, position: int) -> int:
+        """1-based line in the file (content) of a character offset into the body."""
+        if self._body_line is None:
+            bounds = locate_frontmatter(self.content) if self.content is not self.body else None
+            start = _strip_bounds(self.content, bounds[2], len(self.content))[0] if bounds else 0
+            self._body_line = self.content.count('\n', 0, start)
+        return self._body_line + bisect.bisect_right(self.line_offsets, position)
+
+    @property
+    def headings(self) -> list[tuple[int, int, str]]:
+        """Markdown headings as (line_index, level, text), skipping code fences."""
+        if self._headings is None:
+            headings: list[tuple[int, int, str]] = []
+            in_fence = False
+            for index, line in enumerate(self.lines):
+                if line.lstrip().startswith(_FENCE_PREFIXES):
+                    in_fence = not in_fence
+                    continue
+                if in_fence or not line.startswith('#'):
+                    continue
+                match = _HEADING_RE.match(line)
+                if match:
+                    headings.append((index, len(match.group(1)), match.group(2)))
+            self._headings = headings
+        return self._headings
+
+    @property
+    def quoted_phrases(self) -> list[str]:
+        """Quoted trigger phrases from the description."""
+        if self._quoted_phrases is None:
+            self._quoted_phrases = extract_trigger_phrases(self.description)
+        return self._quoted_phrases
+
+    @property
+    def keywords(self) -> list[str]:
+        """All distinct description keywords, in order of first use."""
+        if self._keywords is None:
+            self._keywords = extract_keywords(self.description, limit=None)
+        return self._keywords
+
+    @property
+    def token_estimate(self) -> int:
+        """Rough body token count (~4 characters per token)."""
+        if self._token_estimate is None:
+            self._token_estimate = len(self.body) // 4
+        return self._token_estimate
+
+    def find_all(self, pattern: re.Pattern[str]) -> list[re.Match[str]]:
+        """Return every match of a compiled pattern in the body, memoized per pattern."""
+        if self._matches is None:
+            self._matches = {}
+        matches = self._matches.get(pattern)
+        if matches is None:
+            matches = list(pattern.finditer(self.body))
+            self._matches[pattern] = matches
+        return matches
+
+
+# --- Content Hashing & Result Cache ---
+
+HASH_CHUNK_BYTES = 1024 * 1024
+DEFAULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+def sha256_file(path: Path | str) -> str:
+    """Return the hex SHA-256 of a file, read in fixed-size chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while chunk := f.read(HASH_CHUNK_BYTES):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_inputs(parts: Iterable[bytes | str]) -> str:
+    """Return one hex SHA-256 over a sequence of parts.
+
+    Each part is length-prefixed so ('ab', 'c') and ('a', 'bc') differ.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        data = part.encode() if isinstance(part, str) else part
+        digest.update(len(data).to_bytes(8, 'big'))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def default_cache_dir(name: str) -> Path:
+    """Return the cache directory for one skill-forge tool.
+
+    Honors SKILL_FORGE_CACHE_DIR, then XDG_CACHE_HOME, then ~/.cache.
+    """
+    base = os.environ.get("SKILL_FORGE_CACHE_DIR")
+    if base:
+        return Path(base).expanduser() / name
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    root = Path(xdg).expanduser() if xdg else Path.home() / ".cache"
+    return root / "skill-forge" / name
+
+
+class ResultCache:
+    """Persistent result cache keyed by content hash, with LRU eviction.
+
+    Values are JSON (get/put) or raw bytes (get_bytes/put_bytes).
+    Each entry is its own file, so worker processes can share the cache
+    without locking; writes land via atomic rename. A hit refreshes the
+    entry's mtime, which prune() uses as the LRU clock.
+    """
+
+    __slots__ = ('root', 'max_bytes', 'hits', 'misses')
+
+    def __init__(self, root: Path, max_bytes: int = DEFAULT_CACHE_MAX_BYTES) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_path(self, key: str, suffix: str = ".json") -> Path:
+        return self.root / key[:2] / f"{key}{suffix}"
+
+    def _read(self, key: str, suffix: str) -> bytes | None:
+        entry = self._entry_path(key, suffix)
+        try:
+            data = entry.read_bytes()
+            os.utime(entry)
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return data
+
+    def _write(self, key: str, suffix: str, data: bytes) -> None:
+        entry = self._entry_path(key, suffix)
+        tmp = entry.with_name(f"{entry.name}.{os.getpid()}.tmp")
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(data)
+            os.replace(tmp, entry)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value for key, or None on a miss."""
+        data = self._read(key, ".json")
+        if data is None:
+            return None
+        try:
+            return json.loads(data)
+        except ValueError:
+            self.hits -= 1
+            self.misses += 1
+            return None
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value under key; failures are ignored."""
+        self._write(key, ".json", json.dumps(value).encode())
+
+    def get_bytes(self, key: str) -> bytes | None:
+        """Return a cached binary blob for key, or None on a miss."""
+        return self._read(key, ".bin")
+
+    def put_bytes(self, key: str, data: bytes) -> None:
+        """Store a binary blob under key; failures are ignored."""
+        self._write(key, ".bin", data)
+
+    def prune(self) -> int:
+        """Evict least recently used entries until under max_bytes.
+
+        Returns the number of entries removed.
+        """
+        entries: list[tuple[float, int, Path]] = []
+        total = 0
+        try:
+            shards = list(os.scandir(self.root))
+        except OSError:
+            return 0
+        for shard in shards:
+            if not shard.is_dir():
+                continue
+            for item in os.scandir(shard.path):
+                if not item.name.endswith((".json", ".bin")):
+                    continue
+                stat = item.stat()
+                entries.append((stat.st_mtime, stat.st_size, Path(item.path)))
+                total += stat.st_size
+
+        removed = 0
+        entries.sort()
+        for _, size, entry in entries:
+            if total <= self.max_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        return removed
+
+
+# --- ZIP Archives ---
+
+# Written by hand (local headers, central directory, end record) so members
+# compressed on worker threads can be streamed into the archive as raw bytes.
+# Packages are far below ZIP64 limits; exceeding them is an error.
+# Method ids match zipfile's; zipfile itself is not imported here because
+# every script imports this module and startup time matters.
+ZIP_STORED = 0
+ZIP_DEFLATED = 8
+ZIP_BZIP2 = 12
+ZIP_LZMA = 14
+
+# Earliest timestamp a ZIP entry can hold; used for reproducible archives
+ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)
+
+_ZIP32_LIMIT = 0xFFFFFFFF
+_ZIP_VERSION = {ZIP_STORED: 20, ZIP_DEFLATED: 20, ZIP_BZIP2: 46, ZIP_LZMA: 63}
+_ZIP_UTF8_FLAG = 0x800
+_ZIP_LZMA_EOS_FLAG = 0x2
+_ZIP_METHOD_FLAGS = 0x6
+
+# xz preset dictionary sizes; the LZMA properties header must state it
+_LZMA_DICT_SIZES = (1 << 18, 1 << 20, 1 << 21, 1 << 22, 1 << 22, 1 << 23, 1 << 23, 1 << 24, 1 << 25, 1 << 26)
+
+
+class ZipMember:
+    """One archive member as already-compressed bytes plus its metadata."""
+
+    __slots__ = ('name', 'method', 'crc', 'size', 'data', 'flags', 'date_time', 'external_attr')
+
+    def __init__(
+        self,
+        name: str,
+        method: int,
+        crc: int,
+        size: int,
+        data: bytes,
+        date_time: tuple[int, int, int, int, int, int],
+        external_attr: int = 0o100644 << 16,
+        flags: int = 0,
+    ) -> None:
+        self.name = name
+        self.method = method
+        self.crc = crc
+        self.size = size
+        self.data = data
+        self.date_time = date_time
+        self.external_attr = external_attr
+        self.flags = flags
+
+
+def compress_bytes(data: bytes, method: int = ZIP_DEFLATED, level: int = 6) -> tuple[bytes, int]:
+    """Compress data for a ZIP member; returns (compressed, general purpose flags).
+
+    zlib, bz2 and lzma all release the GIL, so calls on different threads
+    run in parallel. level is the deflate level, bzip2 block size or xz
+    preset (0-9).
+    """
+    if method == ZIP_STORED:
+        return data, 0
+    if method == ZIP_DEFLATED:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+        return compressor.compress(data) + compressor.flush(), 0
+    if method == ZIP_BZIP2:
+        import bz2
+        return bz2.compress(data, max(level, 1)), 0
+    if method == ZIP_LZMA:
+        import lzma
+        lc, lp, pb, dict_size = 3, 0, 2, _LZMA_DICT_SIZES[level]
+        compressor = lzma.LZMACompressor(lzma.FORMAT_RAW, filters=[{
+            "id": lzma.FILTER_LZMA1, "preset": level,
+            "dict_size": dict_size, "lc": lc, "lp": lp, "pb": pb,
+        }])
+        properties = struct.pack('<BI', (pb * 5 + lp) * 9 + lc, dict_size)
+        header = struct.pack('<BBH', 9, 4, len(properties)) + properties
+        return header + compressor.compress(data) + compressor.flush(), _ZIP_LZMA_EOS_FLAG
+    raise ValueError(f"Unsupported ZIP compression method: {method}")
+
+
+def make_member(
+    name: str,
+    raw: bytes,
+    method: int = ZIP_DEFLATED,
+    level: int = 6,
+    date_time: tuple[int, int, int, int, int, int] = ZIP_EPOCH,
+    mode: int = 0o100644,
+) -> ZipMember:
+    """Compress raw file bytes into a ZipMember.
+
+    The defaults (fixed timestamp, plain file mode) make the member depend
+    only on its name, content, method and level.
+    """
+    data, flags = compress_bytes(raw, method, level)
+    return ZipMember(name, method, zlib.crc32(raw), len(raw), data, date_time, mode << 16, flags)
+
+
+def read_raw_member(f, info) -> ZipMember:
+    """Copy one member's compressed bytes out of an open archive without inflating.
+
+    info is the member's zipfile.ZipInfo; f is the archive opened in 'rb'.
+    Only the method option flags are kept; the writer emits sizes in the
+    local header, so a source data descriptor is dropped.
+    """
+    f.seek(info.header_offset)
+    header = f.read(30)
+    if header[:4] != b'PK\x03\x04':
+        raise ValueError(f"{info.filename}: bad local header")
+    name_length, extra_length = struct.unpack('<HH', header[26:30])
+    f.seek(info.header_offset + 30 + name_length + extra_length)
+    data = f.read(info.compress_size)
+    return ZipMember(
+        info.filename, info.compress_type, info.CRC, info.file_size, data,
+        info.date_time, info.external_attr, info.flag_bits & _ZIP_METHOD_FLAGS,
+    )
+
+
+def _dos_date_time(date_time: tuple[int, ...]) -> tuple[int, int]:
+    year, month, day, hour, minute, second = date_time
+    if year < 1980:
+        year, month, day, hour, minute, second = 1980, 1, 1, 0, 0, 0
+    return (
+        (year - 1980) << 9 | month << 5 | day,
+        hour << 11 | minute << 5 | second // 2,
+    )
+
+
+class ZipStreamWriter:
+    """Append precompressed ZipMembers to a new archive in call order.
+
+    Use as a context manager; the central directory is written on close.
+    """
+
+    __slots__ = ('_file', '_central', '_offset')
+
+    def __init__(self, path: Path) -> None:
+        self._file = open(path, 'wb')
+        self._central: list[bytes] = []
+        self._offset = 0
+
+    def add(self, member: ZipMember) -> None:
+        """Write one member's local header and data."""
+        name = member.name.encode('utf-8')
+        flags = member.flags | (_ZIP_UTF8_FLAG if not member.name.isascii() else 0)
+        compressed_size = len(member.data)
+        if max(compressed_size, member.size, self._offset) > _ZIP32_LIMIT:
+            raise ValueError(f"{member.name}: archive exceeds ZIP32 size limits")
+        dos_date, dos_time = _dos_date_time(member.date_time)
+        version = _ZIP_VERSION[member.method]
+
+        fields = struct.pack(
+            '<HHHHHIIIHH', version, flags, member.method, dos_time, dos_date,
+            member.crc, compressed_size, member.size, len(name), 0,
+        )
+        self._file.write(b'PK\x03\x04' + fields + name)
+        self._file.write(member.data)
+        self._central.append(
+            b'PK\x01\x02' + struct.pack('<H', 3 << 8 | version) + fields
+            + struct.pack('<HHHII', 0, 0, 0, member.external_attr, self._offset) + name
+        )
+        self._offset += 30 + len(name) + compressed_size
+
+    def close(self) -> None:
+        """Write the central directory and end record, then close the file."""
+        if self._file.closed:
+            return
+        if len(self._central) > 0xFFFF:
+            self._file.close()
+            raise ValueError("archive exceeds ZIP32 member count limit")
+        directory = b''.join(self._central)
+        self._file.write(directory)
+        self._file.write(b'PK\x05\x06' + struct.pack(
+            '<HHHHIIH', 0, 0, len(self._central), len(self._central),
+            len(directory), self._offset, 0,
+        ))
+        self._file.close()
+
+    def __enter__(self) -> "ZipStreamWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def safe_member_path(root: Path, name: str) -> Path:
+    """Resolve an archive member name under root; raises ValueError if it escapes.
+
+    Rejects absolute paths, drive letters and '..' components (zip-slip).
+    """
+    parts = name.replace('\\', '/').split('/')
+    if name.startswith(('/', '\\')) or ':' in parts[0] or '..' in parts or not name.strip('/'):
+        raise ValueError(f"Unsafe archive member path: {name!r}")
+    return root.joinpath(*[p for p in parts if p not in ('', '.')])
+
+
+def extract_verified(
+    zf, info, dest: Path, expected_sha256: str | None, mode: int | None = None
+) -> int:
+    """Stream one member of an open zipfile.ZipFile to dest, hashing as it goes.
+
+    The data lands in a temporary file beside dest and is renamed into
+    place only if its SHA-256 matches; otherwise ValueError is raised and
+    dest is untouched. With expected_sha256=None only the ZIP CRC is
+    checked. Returns the number of bytes written.
+    """
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dest.with_name(f".{dest.name}.{os.getpid()}.part")
+    digest = hashlib.sha256()
+    written = 0
+    try:
+        with zf.open(info) as src, open(tmp, 'wb') as out:
+            while chunk := src.read(HASH_CHUNK_BYTES):
+                digest.update(chunk)
+                out.write(chunk)
+                written += len(chunk)
+        if expected_sha256 is not None and digest.hexdigest() != expected_sha256:
+            raise ValueError(f"{info.filename}: SHA-256 mismatch (expected {expected_sha256[:12]}…)")
+        if mode is not None:
+            os.chmod(tmp, mode & 0o777)
+        os.replace(tmp, dest)
+    finally:
+        tmp.unlink(missing_ok=True)
+    return written
@@ -1,273 +1,482 @@
 #!/usr/bin/env python3
 """
 Purpose: Validate a Claude Code skill's structure, frontmatter, and quality.
-Input: Path to a skill directory
-Output: JSON validation report with pass/fail status and issues
-Usage: python scripts/validate_skill.py /path/to/skill [--strict]
+Input: Path to a skill directory (or --catalog ROOT for every skill and agent under ROOT)
+Output: JSON validation report with pass/fail status and issues (NDJSON in catalog mode)
+Usage: python scripts/validate_skill.py /path/to/skill [--strict] [--no-cache]
+       python scripts/validate_skill.py --catalog ~/.claude [--workers 8] [--strict]
+       python scripts/validate_skill.py /path/to/skill --watch
+       python scripts/validate_skill.py /path/to/skill --profile [json|table] [--tokenizer heuristic]
+       python scripts/validate_skill.py --catalog ~/.claude/skills --descriptions [--budget 4000]
+       python scripts/validate_skill.py --catalog /path/to/plugin --agents
+       python scripts/validate_skill.py /path/to/skill --profile-scripts [--cold-start-budget 500]
+
+Results are cached on disk, keyed by a hash of SKILL.md, scripts/*.py and the
+validator's rule version, so unchanged skills are not re-validated.
 """
 
 import argparse
+import functools
 import json
 import os
 import re
+import subprocess
 import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any
 
+from analyze_scripts import PERF_CHECKS, analyze_file, analyze_scripts
+from skill_utils import (
+    DEFAULT_CACHE_MAX_BYTES,
+    ResultCache,
+    SkillDocument,
+    default_cache_dir,
+    extract_trigger_phrases,
+    hash_inputs,
+    load_tokenizer,
+    locate_frontmatter,
+    parse_frontmatter_fields,
+    read_frontmatter,
+    sha256_file,
+)
 
-def parse_frontmatter(content: str) -> tuple[dict[str, Any] | None, str, list[str]]:
-    """Parse YAML frontmatter from SKILL.md content.
 
-    Returns (frontmatter_dict, body, errors).
-    Uses basic parsing to avoid PyYAML dependency.
+SEVERITIES = ("critical", "high", "medium", "low")
+
+# Bump whenever a check, message or weight changes so cached results are dropped
+RULES_VERSION = "5"
+
+# Directories never searched for skills or agents in catalog mode
+CATALOG_SKIP_DIRS = {'.git', 'node_modules', '__pycache__', '.venv', 'venv', 'dist', 'build'}
+
+
+# --- Rule Engine ---
+
+SEVERITY_WEIGHTS = {"CRITICAL": 20, "HIGH": 10, "MEDIUM": 5, "LOW": 2}
+
+
+class Issue(str):
+    """An issue message that remembers the rule and score weight behind it.
+
+    Behaves exactly like the plain "SEVERITY: message" strings in reports.
     """
-    errors: list[str] = []
 
-    if not content.startswith('---'):
-        return None, content, ["Missing opening '---' delimiter"]
+    rule = ""
+    weight: int | None = None
+
+    def __new__(cls, text: str, rule: str = "", weight: int | None = None) -> "Issue":
+        issue = super().__new__(cls, text)
+        issue.rule = rule
+        issue.weight = weight
+        return issue
 
-    parts = content.split('---', 2)
-    if len(parts) < 3:
-        return None, content, ["Missing closing '---' delimiter"]
 
-    yaml_text = parts[1].strip()
-    body = parts[2].strip()
+class Rule:
+    """A declarative check: the input it consumes, its severity and weight.
 
-    if not yaml_text:
-        return None, body, ["Empty frontmatter"]
+    calls and seconds are per-process counters used by --rule-timings.
+    """
 
-    # Basic YAML parsing (handles simple key: value and multiline >)
-    frontmatter: dict[str, Any] = {}
-    current_key = ""
-    current_value = ""
-    in_multiline = False
-    in_list = False
-    current_list: list[str] = []
+    __slots__ = ('id', 'consumes', 'severity', 'weight', 'check', 'calls', 'seconds')
 
-    for line in yaml_text.split('\n'):
-        stripped = line.strip()
+    def __init__(self, rule_id: str, consumes: str, severity: str, weight: int, check) -> None:
+        self.id = rule_id
+        self.consumes = consumes
+        self.severity = severity
+        self.weight = weight
+        self.check = check
+        self.calls = 0
+        self.seconds = 0.0
 
-        if in_multiline:
-            if stripped and not re.match(r'^[a-z_-]+:', stripped):
-                current_value += " " + stripped
-                continue
-            else:
-                frontmatter[current_key] = current_value.strip()
-                in_multiline = False
 
-        if in_list:
-            if stripped.startswith('- '):
-                current_list.append(stripped[2:].strip())
-                continue
-            else:
-                frontmatter[current_key] = current_list
-                in_list = False
-                current_list = []
-
-        match = re.match(r'^([a-z_-]+):\s*(.*)', stripped)
-        if match:
-            current_key = match.group(1)
-            value = match.group(2).strip()
-
-            if value == '>':
-                in_multiline = True
-                current_value = ""
-            elif value == '|':
-                in_multiline = True
-                current_value = ""
-            elif value == '':
-                # Check if next line starts a list
-                in_list = True
-                current_list = []
-            else:
-                frontmatter[current_key] = value.strip('"').strip("'")
-
-    # Handle final multiline/list value
-    if in_multiline:
-        frontmatter[current_key] = current_value.strip()
-    if in_list and current_list:
-        frontmatter[current_key] = current_list
-
-    return frontmatter, body, errors
+# Rules grouped by the input they consume, in registration (= report) order
+RULES: dict[str, list[Rule]] = {}
 
 
-def validate_name(name: str, folder_name: str) -> list[str]:
-    """Validate the 'name' field."""
+def rule(rule_id: str, consumes: str, severity: str, weight: int | None = None):
+    """Register a check function as a rule.
+
+    The function receives (value, context) and returns None, one message,
+    or a list of messages; the engine adds the severity prefix. Inputs are
+    "structure", "name", "description", "compatibility", "body_lines",
+    "headings", "body" and "script".
+    """
+    def register(check):
+        rule_weight = SEVERITY_WEIGHTS[severity] if weight is None else weight
+        RULES.setdefault(consumes, []).append(Rule(rule_id, consumes, severity, rule_weight, check))
+        return check
+    return register
+
+
+def run_rules(consumes: str, value: Any, context: dict[str, Any] | None = None) -> list[str]:
+    """Dispatch one input to every rule that consumes it and collect issues."""
     issues: list[str] = []
+    context = context if context is not None else {}
+    clock = time.perf_counter
+
+    for r in RULES.get(consumes, ()):
+        start = clock()
+        found = r.check(value, context)
+        r.seconds += clock() - start
+        r.calls += 1
+        if not found:
+            continue
+        for message in (found,) if isinstance(found, str) else found:
+            issues.append(Issue(f"{r.severity}: {message}", r.id, r.weight))
 
-    if not name:
-        issues.append("CRITICAL: 'name' field is missing")
-        return issues
+    return issues
+
+
+def rule_timings() -> list[dict[str, Any]]:
+    """Per-rule call counts and cumulative time in this process, slowest first."""
+    rows = [
+        {"rule": r.id, "consumes": r.consumes, "calls": r.calls, "ms": round(r.seconds * 1000, 3)}
+        for rules in RULES.values() for r in rules if r.calls
+    ]
+    return sorted(rows, key=lambda row: row["ms"], reverse=True)
+
+
+def reset_rule_timings() -> None:
+    """Zero every rule's counters."""
+    for rules in RULES.values():
+        for r in rules:
+            r.calls = 0
+            r.seconds = 0.0
+
+
+class ScriptSource:
+    """A bundled script as consumed by "script" rules.
+
+    analysis is the analyze_scripts report for the file, computed on first
+    use unless one (e.g. from the cache) is passed in.
+    """
+
+    __slots__ = ('path', '_analysis')
+
+    def __init__(self, path: Path, analysis: dict[str, Any] | None = None) -> None:
+        self.path = path
+        self._analysis = analysis
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+    @property
+    def analysis(self) -> dict[str, Any]:
+        if self._analysis is None:
+            self._analysis = analyze_file(str(self.path))
+        return self._analysis
+
+
+_KEBAB_CASE_RE = re.compile(r'[a-z][a-z0-9]*(-[a-z0-9]+)*')
+_TRIGGER_RE = re.compile(r'[Uu]se when|[Tt]rigger|[Uu]ser says|[Uu]se for|[Ww]hen .* says')
+
+
+# --- Structure Rules ---
 
+@rule("skill-md-missing", "structure", "CRITICAL")
+def _skill_md_missing(skill_path: Path, context: dict[str, Any]) -> str | None:
+    if (skill_path / "SKILL.md").exists():
+        context["has_skill_md"] = True
+        return None
+    context["has_skill_md"] = False
+    # Check for case variations
+    for f in skill_path.iterdir():
+        if f.name.lower() == "skill.md" and f.name != "SKILL.md":
+            return f"Found '{f.name}' but must be exactly 'SKILL.md'"
+    return "SKILL.md not found"
+
+
+@rule("readme-in-skill", "structure", "MEDIUM")
+def _readme_in_skill(skill_path: Path, context: dict[str, Any]) -> str | None:
+    if context.get("has_skill_md") and (skill_path / "README.md").exists():
+        return "README.md found inside skill folder (should be repo-level only)"
+    return None
+
+
+@rule("folder-kebab-case", "structure", "HIGH")
+def _folder_kebab_case(skill_path: Path, context: dict[str, Any]) -> str | None:
+    if context.get("has_skill_md") and not _KEBAB_CASE_RE.fullmatch(skill_path.name):
+        return f"Folder name '{skill_path.name}' is not valid kebab-case"
+    return None
+
+
+# --- Frontmatter Rules ---
+
+@rule("name-missing", "name", "CRITICAL")
+def _name_missing(name: str, context: dict[str, Any]) -> str | None:
+    return None if name else "'name' field is missing"
+
+
+@rule("name-length", "name", "CRITICAL")
+def _name_length(name: str, context: dict[str, Any]) -> str | None:
     if len(name) > 64:
-        issues.append(f"CRITICAL: Name too long ({len(name)} chars, max 64)")
+        return f"Name too long ({len(name)} chars, max 64)"
+    return None
 
-    if not re.match(r'^[a-z][a-z0-9]*(-[a-z0-9]+)*$', name):
-        issues.append(f"CRITICAL: Name '{name}' is not valid kebab-case")
 
+@rule("name-kebab-case", "name", "CRITICAL")
+def _name_kebab_case(name: str, context: dict[str, Any]) -> list[str]:
+    if not name:
+        return []
+    messages: list[str] = []
+    if not _KEBAB_CASE_RE.fullmatch(name):
+        messages.append(f"Name '{name}' is not valid kebab-case")
     if name.startswith('-') or name.endswith('-'):
-        issues.append("CRITICAL: Name cannot start or end with hyphen")
-
+        messages.append("Name cannot start or end with hyphen")
     if '--' in name:
-        issues.append("CRITICAL: Name cannot contain consecutive hyphens")
+        messages.append("Name cannot contain consecutive hyphens")
+    return messages
 
-    if 'claude' in name.lower() or 'anthropic' in name.lower():
-        issues.append("CRITICAL: Name cannot contain 'claude' or 'anthropic'")
 
-    if name != folder_name:
-        issues.append(f"HIGH: Name '{name}' does not match folder name '{folder_name}'")
+@rule("name-reserved", "name", "CRITICAL")
+def _name_reserved(name: str, context: dict[str, Any]) -> str | None:
+    lowered = name.lower()
+    if 'claude' in lowered or 'anthropic' in lowered:
+        return "Name cannot contain 'claude' or 'anthropic'"
+    return None
 
-    return issues
 
+@rule("name-matches-folder", "name", "HIGH")
+def _name_matches_folder(name: str, context: dict[str, Any]) -> str | None:
+    folder_name = context.get("folder_name")
+    if name and folder_name is not None and name != folder_name:
+        return f"Name '{name}' does not match folder name '{folder_name}'"
+    return None
 
-def validate_description(description: str) -> list[str]:
-    """Validate the 'description' field."""
-    issues: list[str] = []
 
-    if not description:
-        issues.append("CRITICAL: 'description' field is missing")
-        return issues
+@rule("description-missing", "description", "CRITICAL")
+def _description_missing(description: str, context: dict[str, Any]) -> str | None:
+    return None if description else "'description' field is missing"
+
 
+@rule("description-length", "description", "CRITICAL")
+def _description_length(description: str, context: dict[str, Any]) -> str | None:
     if len(description) > 1024:
-        issues.append(f"CRITICAL: Description too long ({len(description)} chars, max 1024)")
+        return f"Description too long ({len(description)} chars, max 1024)"
+    return None
+
 
+@rule("description-angle-brackets", "description", "CRITICAL")
+def _description_angle_brackets(description: str, context: dict[str, Any]) -> str | None:
     if '<' in description or '>' in description:
-        issues.append("CRITICAL: Description contains XML angle brackets (< >)")
-
-    # Check for WHAT component
-    has_what = len(description) > 20
-    if not has_what:
-        issues.append("HIGH: Description too short to explain capabilities")
-
-    # Check for WHEN component (trigger phrases)
-    trigger_patterns = [
-        r'[Uu]se when',
-        r'[Tt]rigger',
-        r'[Uu]ser says',
-        r'[Uu]se for',
-        r'[Ww]hen .* says',
-    ]
-    has_when = any(re.search(p, description) for p in trigger_patterns)
-    if not has_when:
-        issues.append("HIGH: Description missing trigger phrases (add 'Use when user says...')")
+        return "Description contains XML angle brackets (< >)"
+    return None
 
-    # Check for keywords
-    if description.count('"') < 2:
-        issues.append("MEDIUM: Description has few quoted trigger phrases (recommend 5-10)")
 
-    return issues
+@rule("description-what", "description", "HIGH")
+def _description_what(description: str, context: dict[str, Any]) -> str | None:
+    # WHAT component: long enough to explain capabilities
+    if description and len(description) <= 20:
+        return "Description too short to explain capabilities"
+    return None
 
 
-def validate_structure(skill_path: Path) -> list[str]:
-    """Validate directory structure."""
-    issues: list[str] = []
+@rule("description-when", "description", "HIGH")
+def _description_when(description: str, context: dict[str, Any]) -> str | None:
+    # WHEN component: trigger phrases
+    if description and not _TRIGGER_RE.search(description):
+        return "Description missing trigger phrases (add 'Use when user says...')"
+    return None
 
-    # Check SKILL.md exists
-    skill_md = skill_path / "SKILL.md"
-    if not skill_md.exists():
-        # Check for case variations
-        for f in skill_path.iterdir():
-            if f.name.lower() == "skill.md" and f.name != "SKILL.md":
-                issues.append(f"CRITICAL: Found '{f.name}' but must be exactly 'SKILL.md'")
-                break
-        else:
-            issues.append("CRITICAL: SKILL.md not found")
-        return issues
 
-    # Check for README.md inside skill folder
-    if (skill_path / "README.md").exists():
-        issues.append("MEDIUM: README.md found inside skill folder (should be repo-level only)")
+@rule("description-quoted-phrases", "description", "MEDIUM")
+def _description_quoted_phrases(description: str, context: dict[str, Any]) -> str | None:
+    if description and description.count('"') < 2:
+        return "Description has few quoted trigger phrases (recommend 5-10)"
+    return None
 
-    # Check folder name
-    folder_name = skill_path.name
-    if not re.match(r'^[a-z][a-z0-9]*(-[a-z0-9]+)*$', folder_name):
-        issues.append(f"HIGH: Folder name '{folder_name}' is not valid kebab-case")
 
-    return issues
+@rule("compatibility-length", "compatibility", "MEDIUM")
+def _compatibility_length(compat: Any, context: dict[str, Any]) -> str | None:
+    if isinstance(compat, str) and len(compat) > 500:
+        return f"Compatibility too long ({len(compat)} chars, max 500)"
+    return None
 
 
-def validate_body(body: str) -> list[str]:
-    """Validate SKILL.md body content."""
-    issues: list[str] = []
+# --- Body Rules ---
 
-    lines = body.split('\n')
-    line_count = len(lines)
+@rule("body-too-long", "body_lines", "MEDIUM")
+def _body_too_long(lines: list[str], context: dict[str, Any]) -> str | None:
+    if len(lines) > 500:
+        return f"SKILL.md body is {len(lines)} lines (recommend <500)"
+    return None
 
-    if line_count > 500:
-        issues.append(f"MEDIUM: SKILL.md body is {line_count} lines (recommend <500)")
 
-    if line_count < 10:
-        issues.append("MEDIUM: SKILL.md body seems too short (<10 lines)")
+@rule("body-too-short", "body_lines", "MEDIUM")
+def _body_too_short(lines: list[str], context: dict[str, Any]) -> str | None:
+    if len(lines) < 10:
+        return "SKILL.md body seems too short (<10 lines)"
+    return None
 
+
+@rule("body-token-budget", "body", "MEDIUM")
+def _body_token_budget(document: SkillDocument, context: dict[str, Any]) -> str | None:
     # Estimate token count (rough: ~4 chars per token)
-    char_count = len(body)
-    est_tokens = char_count // 4
-    if est_tokens > 5000:
-        issues.append(f"MEDIUM: Estimated ~{est_tokens} tokens (recommend <5000)")
+    if document.token_estimate > 5000:
+        return f"Estimated ~{document.token_estimate} tokens (recommend <5000)"
+    return None
+
 
-    # Check for headings
-    headings = [l for l in lines if l.startswith('#')]
+@rule("few-headings", "headings", "LOW")
+def _few_headings(headings: list[tuple[int, int, str]], context: dict[str, Any]) -> str | None:
     if len(headings) < 2:
-        issues.append("LOW: Few headings found (use ## sections for organization)")
+        return "Few headings found (use ## sections for organization)"
+    return None
+
+
+# --- Script Rules ---
+
+@rule("script-syntax-error", "script", "HIGH")
+def _script_syntax_error(script: ScriptSource, context: dict[str, Any]) -> str | None:
+    error = script.analysis["syntax_error"]
+    if error:
+        return f"Script {script.name} cannot be parsed: {error}"
+    return None
+
+
+@rule("script-docstring", "script", "LOW")
+def _script_docstring(script: ScriptSource, context: dict[str, Any]) -> str | None:
+    analysis = script.analysis
+    if not analysis["syntax_error"] and not analysis["docstring"]:
+        return f"Script {script.name} missing docstring"
+    return None
+
+
+@rule("script-cli", "script", "LOW")
+def _script_cli(script: ScriptSource, context: dict[str, Any]) -> str | None:
+    analysis = script.analysis
+    if not analysis["syntax_error"] and analysis["cli"] is None:
+        return f"Script {script.name} has no CLI interface"
+    return None
+
+
+@rule("script-import-side-effects", "script", "MEDIUM")
+def _script_import_side_effects(script: ScriptSource, context: dict[str, Any]) -> str | None:
+    effects = script.analysis["side_effects"]
+    if effects:
+        lines = ", ".join(str(e["line"]) for e in effects[:5])
+        return (
+            f"Script {script.name} runs code at import time (line {lines}); "
+            f"move it under `if __name__ == \"__main__\":`"
+        )
+    return None
 
+
+@rule("script-heavy-imports", "script", "LOW")
+def _script_heavy_imports(script: ScriptSource, context: dict[str, Any]) -> str | None:
+    heavy = script.analysis["heavy_imports"]
+    if heavy:
+        modules = ", ".join(f"{h['module']} (line {h['line']})" for h in heavy)
+        return f"Script {script.name} imports heavy modules at top level: {modules}; import them where used"
+    return None
+
+
+def _perf_rule(code: str, summary: str):
+    """Build the check for one performance-lint finding code."""
+    def check(script: ScriptSource, context: dict[str, Any]) -> str | None:
+        lines = [str(f["line"]) for f in script.analysis["perf"] if f["code"] == code]
+        if lines:
+            return f"Script {script.name} {summary} (line {', '.join(lines)})"
+        return None
+    return check
+
+
+for _code, (_severity, _summary) in PERF_CHECKS.items():
+    rule(f"script-perf-{_code}", "script", _severity)(_perf_rule(_code, _summary))
+
+
+# --- Checks ---
+
+def validate_name(name: str, folder_name: str) -> list[str]:
+    """Validate the 'name' field."""
+    return run_rules("name", name, {"folder_name": folder_name})
+
+
+def validate_description(description: str) -> list[str]:
+    """Validate the 'description' field."""
+    return run_rules("description", description)
+
+
+def validate_structure(skill_path: Path) -> list[str]:
+    """Validate directory structure."""
+    return run_rules("structure", skill_path)
+
+
+def validate_body(body: str | SkillDocument) -> list[str]:
+    """Validate SKILL.md body content.
+
+    Accepts raw body text or a SkillDocument, whose cached views are reused.
+    """
+    document = body if isinstance(body, SkillDocument) else SkillDocument.from_body(body)
+    context: dict[str, Any] = {}
+
+    issues = run_rules("body_lines", document.lines, context)
+    issues.extend(run_rules("body", document, context))
+    issues.extend(run_rules("headings", document.headings, context))
     return issues
 
 
-def validate_scripts(skill_path: Path) -> list[str]:
-    """Validate scripts if present."""
+def validate_scripts(skill_path: Path, cache: ResultCache | None = None) -> list[str]:
+    """Validate scripts if present.
+
+    Scripts are analyzed together so cached analyses are reused and large
+    script sets are parsed in parallel.
+    """
     issues: list[str] = []
     scripts_dir = skill_path / "scripts"
 
     if not scripts_dir.exists():
         return issues
 
-    for script in scripts_dir.glob("*.py"):
-        content = script.read_text()
+    scripts = sorted(scripts_dir.glob("*.py"))
+    analyses = analyze_scripts(scripts, cache)
+    for script in scripts:
+        issues.extend(run_rules("script", ScriptSource(script, analyses[script])))
 
-        if '"""' not in content and "'''" not in content:
-            issues.append(f"LOW: Script {script.name} missing docstring")
+    return issues
 
-        if 'argparse' not in content and 'sys.argv' not in content:
-            issues.append(f"LOW: Script {script.name} has no CLI interface")
 
-    return issues
+def validate_script_file(script: Path, cache: ResultCache | None = None) -> list[str]:
+    """Validate a single bundled script."""
+    analysis = analyze_scripts([script], cache)[script]
+    return run_rules("script", ScriptSource(script, analysis))
 
 
 def validate_agent(agent_path: Path) -> list[str]:
     """Validate an agent definition file."""
-    issues: list[str] = []
-
     if not agent_path.exists():
-        issues.append(f"CRITICAL: Agent file not found: {agent_path}")
-        return issues
+        return [f"CRITICAL: Agent file not found: {agent_path}"]
+    return check_agent_content(agent_path, agent_path.read_text())[0]
 
-    content = agent_path.read_text()
+
+def check_agent_content(agent_path: Path, content: str) -> tuple[list[str], dict[str, Any]]:
+    """Validate agent file content; returns (issues, parsed frontmatter)."""
+    issues: list[str] = []
 
     # Check for YAML frontmatter
     if not content.startswith('---'):
         issues.append("CRITICAL: Agent missing YAML frontmatter (must start with ---)")
-        return issues
+        return issues, {}
 
-    parts = content.split('---', 2)
-    if len(parts) < 3:
+    bounds = locate_frontmatter(content)
+    if bounds is None:
         issues.append("CRITICAL: Agent missing closing '---' delimiter")
-        return issues
+        return issues, {}
 
-    yaml_text = parts[1].strip()
-    body = parts[2].strip()
+    yaml_start, yaml_end, body_start = bounds
+    frontmatter = parse_frontmatter_fields(content[yaml_start:yaml_end])
+    body = content[body_start:].strip()
 
     # Check required fields
-    has_name = False
-    has_description = False
-    agent_name = ""
-
-    for line in yaml_text.split('\n'):
-        stripped = line.strip()
-        if stripped.startswith('name:'):
-            has_name = True
-            agent_name = stripped.split(':', 1)[1].strip().strip('"').strip("'")
-        elif stripped.startswith('description:'):
-            has_description = True
+    has_name = "name" in frontmatter
+    has_description = "description" in frontmatter
+    agent_name = frontmatter.get("name", "")
+    if not isinstance(agent_name, str):
+        agent_name = ""
 
     if not has_name:
         issues.append("CRITICAL: Agent missing 'name' field")
@@ -285,29 +494,137 @@ def validate_agent(agent_path: Path) -> list[str]:
     if len(body) < 20:
         issues.append("HIGH: Agent body (system prompt) too short")
 
-    return issues
+    return issues, frontmatter
 
 
 def calculate_score(issues: list[str]) -> int:
-    """Calculate health score based on issues found."""
+    """Calculate health score based on issues found.
+
+    Issues raised by rules carry their rule's weight; plain strings fall
+    back to the weight of their severity prefix.
+    """
     score = 100
 
     for issue in issues:
-        if issue.startswith("CRITICAL:"):
-            score -= 20
-        elif issue.startswith("HIGH:"):
-            score -= 10
-        elif issue.startswith("MEDIUM:"):
-            score -= 5
-        elif issue.startswith("LOW:"):
-            score -= 2
+        weight = getattr(issue, "weight", None)
+        if weight is None:
+            severity = issue.split(":", 1)[0]
+            weight = SEVERITY_WEIGHTS.get(severity, 0)
+        score -= weight
 
     return max(0, score)
 
 
-def validate_skill(skill_path: str, strict: bool = False) -> dict[str, Any]:
-    """Run full validation on a skill directory."""
-    path = Path(skill_path).resolve()
+# --- Result Cache ---
+
+@functools.lru_cache(maxsize=None)
+def validator_fingerprint() -> str:
+    """Hash of RULES_VERSION and the validator sources, part of every cache key."""
+    here = Path(__file__).resolve().parent
+    return hash_inputs([
+        RULES_VERSION,
+        (here / "validate_skill.py").read_bytes(),
+        (here / "skill_utils.py").read_bytes(),
+        (here / "analyze_scripts.py").read_bytes(),
+    ])
+
+
+def skill_cache_key(path: Path, strict: bool = False) -> str | None:
+    """Hash every input the skill checks read; None if SKILL.md is missing."""
+    skill_md = path / "SKILL.md"
+    if not skill_md.is_file():
+        return None
+
+    parts: list[bytes | str] = [
+        validator_fingerprint(), "skill", path.name, str(strict),
+        str((path / "README.md").exists()), skill_md.read_bytes(),
+    ]
+    scripts_dir = path / "scripts"
+    if scripts_dir.is_dir():
+        for script in sorted(scripts_dir.glob("*.py")):
+            parts += [script.name, sha256_file(script)]
+    return hash_inputs(parts)
+
+
+def agent_cache_key(agent_path: Path) -> str | None:
+    """Hash an agent file and its name; None if it cannot be read."""
+    try:
+        content = agent_path.read_bytes()
+    except OSError:
+        return None
+    return hash_inputs([validator_fingerprint(), "agent", agent_path.name, content])
+
+
+def cached_result(
+    cache: ResultCache | None, key: str | None, path: Path, compute
+) -> dict[str, Any]:
+    """Return a cached report for key, or compute and store it.
+
+    The report gains a "cache" field ("hit" or "miss") when a cache is used.
+    """
+    if cache is None or key is None:
+        return compute()
+
+    result = cache.get(key)
+    if result is not None:
+        result["path"] = str(path)
+        result["cache"] = "hit"
+        return result
+
+    result = compute()
+    cache.put(key, result)
+    result["cache"] = "miss"
+    return result
+
+
+def validate_skill_document(document: SkillDocument, folder_name: str) -> list[str]:
+    """Run every check that reads SKILL.md: frontmatter fields and body."""
+    issues: list[str] = list(document.errors)
+    frontmatter = document.frontmatter
+
+    if frontmatter:
+        issues.extend(validate_name(frontmatter.get("name", ""), folder_name))
+        issues.extend(validate_description(frontmatter.get("description", "")))
+
+        # Check optional fields
+        if "compatibility" in frontmatter:
+            issues.extend(run_rules("compatibility", frontmatter["compatibility"]))
+
+    # Body validation
+    issues.extend(validate_body(document))
+
+    return issues
+
+
+def build_report(
+    path: Path, issues: list[str], strict: bool = False, name: str = "unknown"
+) -> dict[str, Any]:
+    """Score a skill's issues and build its JSON report."""
+    score = calculate_score(issues)
+    status = "pass" if score >= 60 else "fail"
+    if strict and score < 80:
+        status = "fail"
+
+    return {
+        "status": status,
+        "path": str(path),
+        "name": name,
+        "score": score,
+        "issues_count": len(issues),
+        "critical": [i for i in issues if i.startswith("CRITICAL:")],
+        "high": [i for i in issues if i.startswith("HIGH:")],
+        "medium": [i for i in issues if i.startswith("MEDIUM:")],
+        "low": [i for i in issues if i.startswith("LOW:")],
+    }
+
+
+def run_skill_checks(
+    path: Path, strict: bool = False, cache: ResultCache | None = None
+) -> dict[str, Any]:
+    """Run every check on a resolved skill directory, bypassing the report cache.
+
+    cache, if given, still serves per-script analyses.
+    """
     all_issues: list[str] = []
 
     # Structure validation
@@ -323,59 +640,793 @@ def validate_skill(skill_path: str, strict: bool = False) -> dict[str, Any]:
             "issues": all_issues,
         }
 
-    content = skill_md.read_text()
+    # Parse once; every check below reads from the same document
+    document = SkillDocument.from_path(skill_md)
+    all_issues.extend(validate_skill_document(document, path.name))
 
-    # Parse frontmatter
-    frontmatter, body, parse_errors = parse_frontmatter(content)
-    all_issues.extend(parse_errors)
+    # Script validation
+    all_issues.extend(validate_scripts(path, cache))
 
-    if frontmatter:
-        # Name validation
-        name = frontmatter.get("name", "")
-        all_issues.extend(validate_name(name, path.name))
+    frontmatter = document.frontmatter
+    name = frontmatter.get("name", "unknown") if frontmatter else "unknown"
+    return build_report(path, all_issues, strict, name)
 
-        # Description validation
-        description = frontmatter.get("description", "")
-        all_issues.extend(validate_description(description))
 
-        # Check optional fields
-        if "compatibility" in frontmatter:
-            compat = frontmatter["compatibility"]
-            if isinstance(compat, str) and len(compat) > 500:
-                all_issues.append(
-                    f"MEDIUM: Compatibility too long ({len(compat)} chars, max 500)"
-                )
+def validate_skill(
+    skill_path: str, strict: bool = False, cache: ResultCache | None = None
+) -> dict[str, Any]:
+    """Run full validation on a skill directory, reusing cached results."""
+    path = Path(skill_path).resolve()
+    key = skill_cache_key(path, strict) if cache is not None else None
+    return cached_result(cache, key, path, lambda: run_skill_checks(path, strict, cache))
 
-    # Body validation
-    all_issues.extend(validate_body(body))
 
-    # Script validation
-    all_issues.extend(validate_scripts(path))
+def validate_agent_file(agent_path: Path, cache: ResultCache | None = None) -> dict[str, Any]:
+    """Run agent validation and build the JSON report for one agent file."""
+    key = agent_cache_key(agent_path) if cache is not None else None
+    return cached_result(cache, key, agent_path, lambda: agent_report(agent_path))
 
-    # Calculate score
-    score = calculate_score(all_issues)
-    status = "pass" if score >= 60 else "fail"
-    if strict and score < 80:
-        status = "fail"
 
+def agent_report(agent_path: Path, issues: list[str] | None = None) -> dict[str, Any]:
+    """Build the JSON report for one agent file, bypassing the cache.
+
+    Pass issues when they are already known to skip re-validation.
+    """
+    if issues is None:
+        issues = validate_agent(agent_path)
+    score = calculate_score(issues)
     return {
-        "status": status,
-        "path": str(path),
-        "name": frontmatter.get("name", "unknown") if frontmatter else "unknown",
+        "status": "pass" if score >= 60 else "fail",
+        "path": str(agent_path),
+        "type": "agent",
         "score": score,
-        "issues_count": len(all_issues),
-        "critical": [i for i in all_issues if i.startswith("CRITICAL:")],
-        "high": [i for i in all_issues if i.startswith("HIGH:")],
-        "medium": [i for i in all_issues if i.startswith("MEDIUM:")],
-        "low": [i for i in all_issues if i.startswith("LOW:")],
+        "issues_count": len(issues),
+        "critical": [i for i in issues if i.startswith("CRITICAL:")],
+        "high": [i for i in issues if i.startswith("HIGH:")],
+        "medium": [i for i in issues if i.startswith("MEDIUM:")],
+        "low": [i for i in issues if i.startswith("LOW:")],
+    }
+
+
+# --- Catalog Mode ---
+
+def discover_catalog(root: Path) -> list[tuple[str, Path]]:
+    """Find every skill directory and agent file under root.
+
+    Returns sorted (kind, path) pairs where kind is "skill" or "agent".
+    A directory containing SKILL.md is a skill and is not searched further;
+    agents are the .md files directly inside any agents/ directory.
+    """
+    entries: list[tuple[str, Path]] = []
+
+    for dirpath, dirnames, filenames in os.walk(root):
+        current = Path(dirpath)
+        if "SKILL.md" in filenames:
+            entries.append(("skill", current))
+            dirnames[:] = []
+            continue
+        if current.name == "agents":
+            for filename in filenames:
+                if filename.endswith(".md"):
+                    entries.append(("agent", current / filename))
+        dirnames[:] = [
+            d for d in dirnames
+            if d not in CATALOG_SKIP_DIRS and not (d.startswith('.') and d not in ('.claude', '.agents'))
+        ]
+
+    return sorted(entries, key=lambda e: (e[0], str(e[1])))
+
+
+def validate_catalog_entry(
+    kind: str,
+    path: str,
+    strict: bool = False,
+    cache_dir: str | None = None,
+    timings: bool = False,
+) -> dict[str, Any]:
+    """Validate one catalog entry and record how long it took.
+
+    Top-level so it can run in a worker process; each worker opens the
+    shared on-disk cache itself. With timings, the entry's per-rule
+    counters are attached under "rule_timings".
+    """
+    if timings:
+        reset_rule_timings()
+    start = time.perf_counter()
+    cache = ResultCache(Path(cache_dir)) if cache_dir else None
+    if kind == "agent":
+        result = validate_agent_file(Path(path), cache)
+    else:
+        result = validate_skill(path, strict, cache)
+        result.setdefault("type", "skill")
+    result["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 2)
+    if timings:
+        result["rule_timings"] = rule_timings()
+    return result
+
+
+def iter_catalog_results(
+    entries: list[tuple[str, Path]],
+    strict: bool = False,
+    workers: int | None = None,
+    cache_dir: Path | None = None,
+    timings: bool = False,
+):
+    """Yield one result per entry, in completion order.
+
+    workers=1 validates in-process; otherwise entries are spread across a
+    process pool (default: os.cpu_count()).
+    """
+    cache_arg = str(cache_dir) if cache_dir else None
+
+    if workers == 1 or len(entries) <= 1:
+        for kind, path in entries:
+            yield validate_catalog_entry(kind, str(path), strict, cache_arg, timings)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(validate_catalog_entry, kind, str(path), strict, cache_arg, timings): path
+            for kind, path in entries
+        }
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as exc:  # A crashed worker fails its entry, not the run
+                yield {
+                    "status": "fail",
+                    "path": str(futures[future]),
+                    "score": 0,
+                    "error": f"{type(exc).__name__}: {exc}",
+                    "elapsed_ms": 0.0,
+                }
+
+
+def merge_rule_timings(per_entry: list[list[dict[str, Any]]]) -> list[dict[str, Any]]:
+    """Sum per-entry rule timings into one table, slowest rule first."""
+    merged: dict[str, dict[str, Any]] = {}
+    for rows in per_entry:
+        for row in rows:
+            total = merged.setdefault(row["rule"], {**row, "calls": 0, "ms": 0.0})
+            total["calls"] += row["calls"]
+            total["ms"] = round(total["ms"] + row["ms"], 3)
+    return sorted(merged.values(), key=lambda row: row["ms"], reverse=True)
+
+
+def summarize_catalog(results: list[dict[str, Any]], elapsed: float, slowest: int = 5) -> dict[str, Any]:
+    """Summarize catalog results: pass/fail and severity counts, slowest entries."""
+    by_severity = {sev: sum(len(r.get(sev, [])) for r in results) for sev in SEVERITIES}
+    ranked = sorted(results, key=lambda r: r.get("elapsed_ms", 0.0), reverse=True)
+
+    return {
+        "total": len(results),
+        "skills": sum(1 for r in results if r.get("type") != "agent"),
+        "agents": sum(1 for r in results if r.get("type") == "agent"),
+        "passed": sum(1 for r in results if r["status"] == "pass"),
+        "failed": sum(1 for r in results if r["status"] != "pass"),
+        "issues_by_severity": by_severity,
+        "slowest": [
+            {"path": r["path"], "elapsed_ms": r.get("elapsed_ms", 0.0)}
+            for r in ranked[:slowest]
+        ],
+        "cache": {
+            "hits": sum(1 for r in results if r.get("cache") == "hit"),
+            "misses": sum(1 for r in results if r.get("cache") == "miss"),
+        },
+        "elapsed_seconds": round(elapsed, 3),
+    }
+
+
+# --- Agent Index ---
+
+# `agents/<name>.md` paths and `subagent_type: <name>` mentions in skill bodies
+_AGENT_REF_RE = re.compile(
+    r'agents/([A-Za-z0-9][\w-]*)\.md\b'
+    r'|subagent_type["\']?\s*[:=]\s*["\']?([A-Za-z0-9][\w-]*)'
+)
+
+
+def validate_agents_bulk(root: Path) -> dict[str, Any]:
+    """Validate every agent under root in one pass and cross-check references.
+
+    Builds a name -> file index from the agents' frontmatter (falling back
+    to the file stem), then scans each skills/*/SKILL.md body once for
+    agent references. Duplicate names and references to missing agents fail
+    the run; agents no skill references are reported as orphans.
+    """
+    entries = discover_catalog(root)
+    index: dict[str, str] = {}
+    duplicates: dict[str, list[str]] = {}
+    results: list[dict[str, Any]] = []
+
+    for kind, path in entries:
+        if kind != "agent":
+            continue
+        try:
+            # Each agent is read once and checked in full
+            issues, frontmatter = check_agent_content(path, path.read_text())  # noqa: whole-file-read-in-loop
+        except (OSError, UnicodeDecodeError) as exc:
+            issues, frontmatter = [f"CRITICAL: Agent file unreadable: {exc}"], {}
+        name = frontmatter.get("name")
+        name = name if isinstance(name, str) and name else path.stem
+        results.append({"name": name, **agent_report(path, issues)})
+        if name in index:
+            duplicates.setdefault(name, [index[name]]).append(str(path))
+        else:
+            index[name] = str(path)
+
+    referenced: dict[str, list[str]] = {}
+    skills_scanned = 0
+    for kind, path in entries:
+        if kind != "skill" or path.parent.name != "skills":
+            continue
+        skills_scanned += 1
+        document = SkillDocument.from_path(path / "SKILL.md")
+        for match in document.find_all(_AGENT_REF_RE):
+            name = match.group(1) or match.group(2)
+            sources = referenced.setdefault(name, [])
+            if str(path) not in sources:
+                sources.append(str(path))
+
+    missing = [
+        {"agent": name, "referenced_from": sources}
+        for name, sources in sorted(referenced.items()) if name not in index
+    ]
+    orphans = sorted(name for name in index if name not in referenced)
+    failed = sum(1 for r in results if r["status"] == "fail")
+
+    return {
+        "status": "fail" if failed or duplicates or missing else "pass",
+        "root": str(root),
+        "agents": len(results),
+        "skills_scanned": skills_scanned,
+        "passed": len(results) - failed,
+        "failed": failed,
+        "duplicates": [{"name": name, "paths": paths} for name, paths in sorted(duplicates.items())],
+        "missing": missing,
+        "orphans": orphans,
+        "index": dict(sorted(index.items())),
+        "results": results,
+    }
+
+
+# --- Context Profiler ---
+
+def _section_rows(document: SkillDocument, count_tokens, first_line: int) -> list[dict[str, Any]]:
+    """Split the SKILL.md body at every heading and price each section.
+
+    first_line is the 1-based file line on which the body starts.
+    """
+    body = document.body
+    offsets = document.line_offsets
+    starts = [(0, 0, "(preamble)")] + list(document.headings)
+    rows: list[dict[str, Any]] = []
+
+    for i, (line_index, level, title) in enumerate(starts):
+        end_line = starts[i + 1][0] if i + 1 < len(starts) else len(offsets)
+        if end_line <= line_index:
+            continue
+        start = offsets[line_index]
+        end = offsets[end_line] if end_line < len(offsets) else len(body)
+        text = body[start:end]
+        if not text.strip():
+            continue
+        rows.append({
+            "source": "SKILL.md",
+            "section": ("#" * level + " " + title) if level else title,
+            "line": first_line + line_index,
+            "loaded": "on_activation",
+            "tokens": count_tokens(text),
+        })
+    return rows
+
+
+def profile_context_cost(skill_path: str, tokenizer: str = "heuristic") -> dict[str, Any]:
+    """Break down the context tokens a skill costs, per section and file.
+
+    The description is loaded into every session; SKILL.md (frontmatter
+    and body sections) is loaded when the skill activates; references/
+    files are loaded on demand. The description is counted once, in its
+    own row: the frontmatter row holds the rest of the header.
+    """
+    path = Path(skill_path).resolve()
+    skill_md = path / "SKILL.md"
+    if not skill_md.exists():
+        return {"error": f"SKILL.md not found in {path}"}
+
+    count_tokens = load_tokenizer(tokenizer)
+    document = SkillDocument.from_path(skill_md)
+    rows: list[dict[str, Any]] = []
+
+    description_tokens = count_tokens(document.description)
+    rows.append({
+        "source": "SKILL.md",
+        "section": "description",
+        "line": 1,
+        "loaded": "always",
+        "tokens": description_tokens,
+    })
+
+    content = document.content
+    bounds = locate_frontmatter(content)
+    body_at = content.find(document.body, bounds[2] if bounds else 0) if document.body else 0
+    first_line = content.count('\n', 0, max(body_at, 0)) + 1
+    if bounds:
+        rows.append({
+            "source": "SKILL.md",
+            "section": "(frontmatter)",
+            "line": 1,
+            "loaded": "on_activation",
+            "tokens": max(0, count_tokens(content[:bounds[2]]) - description_tokens),
+        })
+    rows.extend(_section_rows(document, count_tokens, first_line))
+
+    refs_dir = path / "references"
+    if refs_dir.is_dir():
+        for ref in sorted(p for p in refs_dir.rglob("*") if p.is_file()):
+            try:
+                text = ref.read_text()  # noqa: whole-file-read-in-loop -- each file is counted in full once
+            except (UnicodeDecodeError, OSError):
+                continue
+            rows.append({
+                "source": str(ref.relative_to(path)),
+                "section": "(file)",
+                "line": 1,
+                "loaded": "on_demand",
+                "tokens": count_tokens(text),
+            })
+
+    totals = {"always": 0, "on_activation": 0, "on_demand": 0}
+    for row in rows:
+        totals[row["loaded"]] += row["tokens"]
+
+    ranked = sorted(rows, key=lambda r: r["tokens"], reverse=True)
+    grand_total = sum(totals.values()) or 1
+    for row in ranked:
+        row["share"] = round(row["tokens"] / grand_total, 4)
+
+    return {
+        "status": "success",
+        "path": str(path),
+        "name": document.name or path.name,
+        "tokenizer": tokenizer,
+        "totals": {
+            "always_loaded": totals["always"],
+            "per_activation": totals["always"] + totals["on_activation"],
+            "references_on_demand": totals["on_demand"],
+        },
+        "sections": ranked,
     }
 
 
+def format_profile_table(profile: dict[str, Any], limit: int = 20) -> str:
+    """Render the heaviest sections of a context profile as a markdown table."""
+    totals = profile["totals"]
+    lines = [
+        f"# Context Cost: {profile['name']} ({profile['tokenizer']} tokenizer)",
+        "",
+        f"Always loaded: {totals['always_loaded']:,} tokens  ",
+        f"Per activation: {totals['per_activation']:,} tokens  ",
+        f"References (on demand): {totals['references_on_demand']:,} tokens",
+        "",
+        "| # | Tokens | Share | Loaded | Source | Section |",
+        "|---|-------:|------:|--------|--------|---------|",
+    ]
+    for rank, row in enumerate(profile["sections"][:limit], 1):
+        section = row["section"].replace("|", "\\|")
+        lines.append(
+            f"| {rank} | {row['tokens']:,} | {row['share']:.1%} | {row['loaded']} "
+            f"| {row['source']}:{row['line']} | {section} |"
+        )
+    return "\n".join(lines) + "\n"
+
+
+# --- Script Startup Profiler ---
+
+DEFAULT_COLD_START_BUDGET_MS = 500.0
+DEFAULT_SCRIPT_TIMEOUT = 10.0
+
+_IMPORTTIME_RE = re.compile(r'import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)')
+_PEAK_RSS_RE = re.compile(r'^skill-forge-peak-rss-kb: (\d+)$', re.MULTILINE)
+_SCRIPT_START_MARKER = "skill-forge-script-start\n"
+
+# Runs the script as __main__ and reports the child's own peak RSS at exit.
+# ru_maxrss of a waited child is useless on Linux: exec keeps the parent's
+# high-water mark. Imports made before the marker belong to interpreter
+# startup and this bootstrap, not to the script.
+_STARTUP_BOOTSTRAP = """\
+import atexit, os, sys
+def _peak_rss():
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == 'darwin' else rss
+def _report():
+    rss = _peak_rss()
+    if rss is not None:
+        sys.stderr.write(f'skill-forge-peak-rss-kb: {rss}\\n')
+atexit.register(_report)
+import pkgutil, runpy
+script = sys.argv[1]
+sys.argv = sys.argv[1:]
+sys.path[0] = os.path.dirname(script)
+sys.stderr.write(%r)
+sys.stderr.flush()
+runpy.run_path(script, run_name='__main__')
+""" % _SCRIPT_START_MARKER
+
+
+def parse_importtime(stderr: str) -> list[dict[str, Any]]:
+    """Parse `-X importtime` lines into {module, self_ms, cumulative_ms, depth}."""
+    rows = []
+    for match in _IMPORTTIME_RE.finditer(stderr):
+        self_us, cumulative_us, indent, module = match.groups()
+        rows.append({
+            "module": module,
+            "self_ms": round(int(self_us) / 1000, 2),
+            "cumulative_ms": round(int(cumulative_us) / 1000, 2),
+            "depth": (len(indent) - 1) // 2,
+        })
+    return rows
+
+
+def profile_script_startup(script: Path, timeout: float = DEFAULT_SCRIPT_TIMEOUT) -> dict[str, Any]:
+    """Run `script --help` once under -X importtime in a sandboxed subprocess.
+
+    The child gets a throwaway working directory and HOME, no stdin, and
+    ignores PYTHON* environment variables and user site-packages; it is
+    killed after timeout seconds.
+    """
+    command = [sys.executable, "-E", "-s", "-X", "importtime", "-c", _STARTUP_BOOTSTRAP,
+               str(script.resolve()), "--help"]
+    with tempfile.TemporaryDirectory(prefix="skill-forge-profile-") as sandbox, \
+            tempfile.TemporaryFile() as stderr_file:
+        env = {"PATH": os.environ.get("PATH", ""), "HOME": sandbox, "LANG": "C.UTF-8"}
+        start = time.perf_counter()
+        proc = subprocess.Popen(
+            command, cwd=sandbox, env=env,
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=stderr_file,
+        )
+        timed_out = False
+        try:
+            proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            timed_out = True
+        wall_ms = round((time.perf_counter() - start) * 1000, 2)
+        stderr_file.seek(0)
+        stderr = stderr_file.read().decode(errors="replace")
+
+    rss_match = _PEAK_RSS_RE.search(stderr)
+    imports = parse_importtime(stderr.partition(_SCRIPT_START_MARKER)[2])
+    top_level = sorted(
+        (row for row in imports if row["depth"] == 0),
+        key=lambda row: row["cumulative_ms"], reverse=True,
+    )
+    return {
+        "name": script.name,
+        "exit_code": proc.returncode,
+        "timed_out": timed_out,
+        "wall_ms": wall_ms,
+        "peak_rss_kb": int(rss_match.group(1)) if rss_match else None,
+        "import_ms": round(sum(row["cumulative_ms"] for row in top_level), 2),
+        "slowest_imports": [
+            {"module": row["module"], "cumulative_ms": row["cumulative_ms"]} for row in top_level[:5]
+        ],
+    }
+
+
+def profile_scripts(
+    skill_path: str,
+    budget_ms: float = DEFAULT_COLD_START_BUDGET_MS,
+    timeout: float = DEFAULT_SCRIPT_TIMEOUT,
+    workers: int | None = None,
+) -> dict[str, Any]:
+    """Measure cold start of every scripts/*.py and flag scripts over budget.
+
+    Scripts run concurrently on a thread pool (each in its own process);
+    use workers=1 for the least noisy timings. Wall time includes the
+    overhead of -X importtime itself.
+    """
+    path = Path(skill_path).resolve()
+    scripts = sorted((path / "scripts").glob("*.py"))
+    if not scripts:
+        return {"error": f"No scripts/*.py found in {path}"}
+
+    with ThreadPoolExecutor(max_workers=workers or min(len(scripts), os.cpu_count() or 1)) as pool:
+        rows = list(pool.map(lambda script: profile_script_startup(script, timeout), scripts))
+
+    issues: list[str] = []
+    slowest: dict[str, dict[str, Any]] = {}
+    for row in rows:
+        for item in row["slowest_imports"]:
+            entry = slowest.setdefault(item["module"], {"module": item["module"], "max_ms": 0.0, "scripts": []})
+            entry["max_ms"] = max(entry["max_ms"], item["cumulative_ms"])
+            entry["scripts"].append(row["name"])
+        if row["timed_out"]:
+            issues.append(f"HIGH: Script {row['name']} --help did not finish within {timeout:g}s")
+        elif row["wall_ms"] > budget_ms:
+            culprit = row["slowest_imports"][0] if row["slowest_imports"] else None
+            hint = f" (slowest import: {culprit['module']} {culprit['cumulative_ms']:g} ms)" if culprit else ""
+            issues.append(
+                f"HIGH: Script {row['name']} cold start {row['wall_ms']:g} ms exceeds "
+                f"budget {budget_ms:g} ms{hint}"
+            )
+        if not row["timed_out"] and row["exit_code"] != 0:
+            issues.append(f"MEDIUM: Script {row['name']} --help exited with status {row['exit_code']}")
+
+    rows.sort(key=lambda row: row["wall_ms"], reverse=True)
+    return {
+        "status": "fail" if any(i.startswith("HIGH:") for i in issues) else "pass",
+        "path": str(path),
+        "budget_ms": budget_ms,
+        "scripts": rows,
+        "slowest_imports": sorted(slowest.values(), key=lambda e: e["max_ms"], reverse=True)[:10],
+        "high": [i for i in issues if i.startswith("HIGH:")],
+        "medium": [i for i in issues if i.startswith("MEDIUM:")],
+    }
+
+
+# --- Description Budget ---
+
+# Quoted spans are matched whole so sentence ends inside them are skipped
+_SENTENCE_SCAN_RE = re.compile(r'"[^"]*"|[.!?](?=\s|$)')
+
+
+def first_sentence(text: str) -> str:
+    """Text up to the first sentence end outside double quotes."""
+    for match in _SENTENCE_SCAN_RE.finditer(text):
+        if not match.group().startswith('"'):
+            return text[:match.end()]
+    return text
+
+
+def compact_description(description: str, phrases: list[str]) -> str:
+    """Rewrite a description as its capability sentence plus every trigger phrase.
+
+    This is the shortest form that keeps each quoted phrase, used to spot
+    descriptions carrying more always-loaded text than they need.
+    """
+    if not phrases:
+        return description.strip()
+    kept = first_sentence(description.strip())
+    missing = [phrase for phrase in dict.fromkeys(phrases) if f'"{phrase}"' not in kept]
+    if not missing:
+        return kept
+    quoted = ", ".join(f'"{phrase}"' for phrase in missing)
+    return f"{kept} Use when user says {quoted}."
+
+
+def description_budget_report(
+    root: Path,
+    budget: int | None = None,
+    tokenizer: str = "heuristic",
+    min_savings: int = 15,
+) -> dict[str, Any]:
+    """Sum the always-loaded description cost of every skill under root.
+
+    Reads only frontmatter headers. Descriptions whose compact rewrite
+    (capability sentence plus quoted trigger phrases) saves at least
+    min_savings tokens and a quarter of their cost are flagged.
+    """
+    count_tokens = load_tokenizer(tokenizer)
+    rows: list[dict[str, Any]] = []
+
+    for kind, path in discover_catalog(root):
+        if kind != "skill":
+            continue
+        frontmatter = read_frontmatter(path / "SKILL.md") or {}
+        description = frontmatter.get("description", "")
+        if not isinstance(description, str):
+            description = ""
+        name = frontmatter.get("name") or path.name
+        phrases = extract_trigger_phrases(description)
+        tokens = count_tokens(description)
+        compact = compact_description(description, phrases)
+        compact_tokens = count_tokens(compact)
+        rows.append({
+            "name": name,
+            "path": str(path),
+            "tokens": tokens,
+            "chars": len(description),
+            "quoted_phrases": len(phrases),
+            "duplicate_phrases": sorted({p for p in phrases if phrases.count(p) > 1}),
+            "compact_tokens": compact_tokens,
+            "suggestion": compact,
+        })
+
+    total = sum(r["tokens"] for r in rows)
+    ranked = sorted(rows, key=lambda r: r["tokens"], reverse=True)
+    shortenable: list[dict[str, Any]] = []
+    for row in ranked:
+        row["share"] = round(row["tokens"] / total, 4) if total else 0.0
+        savings = row["tokens"] - row.pop("compact_tokens")
+        suggestion = row.pop("suggestion")
+        if savings >= min_savings and savings * 4 >= row["tokens"]:
+            shortenable.append({
+                "name": row["name"],
+                "path": row["path"],
+                "tokens": row["tokens"],
+                "savings": savings,
+                "suggestion": suggestion,
+            })
+
+    over_budget = budget is not None and total > budget
+    return {
+        "status": "fail" if over_budget else "pass",
+        "root": str(root),
+        "tokenizer": tokenizer,
+        "skills": len(rows),
+        "total_tokens": total,
+        "budget": budget,
+        "over_budget": over_budget,
+        "potential_savings": sum(s["savings"] for s in shortenable),
+        "ranked": ranked,
+        "shortenable": shortenable,
+    }
+
+
+# --- Watch Mode ---
+
+def watched_files(kind: str, path: Path) -> dict[Path, str]:
+    """Map each file a catalog entry depends on to the check group it feeds."""
+    if kind == "agent":
+        return {path: "agent"}
+
+    files = {path / "SKILL.md": "skill_md", path / "README.md": "structure"}
+    try:
+        for item in os.scandir(path / "scripts"):
+            if item.name.endswith(".py") and item.is_file():
+                files[Path(item.path)] = "script"
+    except OSError:
+        pass
+    return files
+
+
+def file_signature(path: Path) -> tuple[int, int] | None:
+    """Return (mtime_ns, size) for a file, or None if it does not exist."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def entry_check_groups(kind: str, path: Path) -> dict[str, list[str]]:
+    """Run every check for one entry, keeping issues grouped by input file."""
+    if kind == "agent":
+        return {"agent": validate_agent(path)}
+
+    groups: dict[str, list[str]] = {"structure": validate_structure(path)}
+    skill_md = path / "SKILL.md"
+    if skill_md.exists():
+        groups["skill_md"] = validate_skill_document(SkillDocument.from_path(skill_md), path.name)
+    for script in sorted((path / "scripts").glob("*.py")):
+        groups[f"script:{script.name}"] = validate_script_file(script)
+    return groups
+
+
+def rerun_check_group(
+    kind: str, path: Path, groups: dict[str, list[str]], changed: Path, group: str
+) -> None:
+    """Re-run only the checks fed by one changed file, updating groups in place."""
+    if group == "agent":
+        groups["agent"] = validate_agent(path)
+    elif group == "script":
+        if changed.exists():
+            groups[f"script:{changed.name}"] = validate_script_file(changed)
+        else:
+            groups.pop(f"script:{changed.name}", None)
+    elif group == "skill_md":
+        groups["structure"] = validate_structure(path)
+        if changed.exists():
+            groups["skill_md"] = validate_skill_document(SkillDocument.from_path(changed), path.name)
+        else:
+            groups.pop("skill_md", None)
+    else:
+        groups["structure"] = validate_structure(path)
+
+
+def groups_score(kind: str, groups: dict[str, list[str]]) -> int:
+    """Score grouped issues the same way a full validation would."""
+    if kind == "skill" and "skill_md" not in groups:
+        return 0
+    return calculate_score([i for issues in groups.values() for i in issues])
+
+
+def watch(
+    entries: list[tuple[str, Path]],
+    interval: float = 0.5,
+    max_polls: int | None = None,
+    emit=print,
+) -> None:
+    """Poll watched files and print issue deltas as NDJSON whenever they change.
+
+    Uses only os.stat, so it works without inotify or other bindings. Each
+    changed file re-runs just the checks that read it: SKILL.md edits re-run
+    structure and SKILL.md checks, scripts/*.py edits re-run that script's
+    checks, and agents/*.md edits re-run validate_agent.
+    """
+    kinds = {path: kind for kind, path in entries}
+    states: dict[Path, dict[str, list[str]]] = {}
+    signatures: dict[Path, tuple[int, int] | None] = {}
+    owners: dict[Path, tuple[str, Path, str]] = {}
+
+    start = time.perf_counter()
+    for kind, path in entries:
+        states[path] = entry_check_groups(kind, path)
+        for file, group in watched_files(kind, path).items():
+            owners[file] = (kind, path, group)
+            signatures[file] = file_signature(file)
+
+    emit(json.dumps({
+        "event": "ready",
+        "entries": len(entries),
+        "files": len(signatures),
+        "scores": {str(p): groups_score(k, states[p]) for k, p in entries},
+        "elapsed_ms": round((time.perf_counter() - start) * 1000, 2),
+    }), flush=True)
+
+    polls = 0
+    while max_polls is None or polls < max_polls:
+        time.sleep(interval)
+        polls += 1
+        tick = time.perf_counter()
+
+        # Re-list scripts/ so new and deleted scripts are noticed
+        current: dict[Path, tuple[str, Path, str]] = {}
+        for kind, path in entries:
+            for file, group in watched_files(kind, path).items():
+                current[file] = (kind, path, group)
+        for file in owners.keys() - current.keys():
+            current[file] = owners[file]
+
+        changed_by_entry: dict[Path, list[tuple[Path, str]]] = {}
+        for file, (_, path, group) in current.items():
+            signature = file_signature(file)
+            if signature != signatures.get(file):
+                signatures[file] = signature
+                changed_by_entry.setdefault(path, []).append((file, group))
+        owners = {f: o for f, o in current.items() if signatures.get(f) is not None}
+
+        for path, changes in changed_by_entry.items():
+            kind = kinds[path]
+            groups = states[path]
+            before = {i for issues in groups.values() for i in issues}
+            score_before = groups_score(kind, groups)
+
+            for file, group in changes:
+                rerun_check_group(kind, path, groups, file, group)
+
+            after = {i for issues in groups.values() for i in issues}
+            score_after = groups_score(kind, groups)
+            emit(json.dumps({
+                "event": "change",
+                "path": str(path),
+                "changed": sorted(str(f.relative_to(path.parent)) for f, _ in changes),
+                "new_issues": sorted(after - before),
+                "resolved_issues": sorted(before - after),
+                "score": score_after,
+                "score_delta": score_after - score_before,
+                "elapsed_ms": round((time.perf_counter() - tick) * 1000, 2),
+            }), flush=True)
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
         description="Validate a Claude Code skill or agent"
     )
-    parser.add_argument("path", help="Path to skill directory or agent file")
+    parser.add_argument("path", nargs="?", help="Path to skill directory or agent file")
     parser.add_argument(
         "--strict", action="store_true",
         help="Strict mode: require score >= 80"
@@ -384,27 +1435,188 @@ if __name__ == "__main__":
         "--agent", action="store_true",
         help="Validate an agent .md file instead of a skill directory"
     )
+    parser.add_argument(
+        "--catalog", metavar="ROOT",
+        help="Validate every skill directory and agent file under ROOT (NDJSON output)"
+    )
+    parser.add_argument(
+        "--workers", "-j", type=int, default=None,
+        help="Parallelism for --catalog and --profile-scripts (default: CPU count; 1 = serial)"
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Ignore and do not update the on-disk result cache"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="Result cache directory (default: ~/.cache/skill-forge/validate)"
+    )
+    parser.add_argument(
+        "--cache-max-mb", type=float, default=DEFAULT_CACHE_MAX_BYTES / (1024 * 1024),
+        help="Evict least recently used cache entries beyond this size (default: 64)"
+    )
+    parser.add_argument(
+        "--rule-timings", action="store_true",
+        help="Report per-rule call counts and time (catalog summary or single report)"
+    )
+    parser.add_argument(
+        "--profile", nargs="?", const="json", choices=["json", "table"],
+        help="Report context token cost per SKILL.md section and references/ file"
+    )
+    parser.add_argument(
+        "--tokenizer", default="heuristic",
+        help="Token counter for --profile/--descriptions: heuristic, chars4, or module:function (default: heuristic)"
+    )
+    parser.add_argument(
+        "--profile-scripts", action="store_true",
+        help="Run each scripts/*.py --help in a sandboxed subprocess and report cold-start cost"
+    )
+    parser.add_argument(
+        "--cold-start-budget", type=float, default=DEFAULT_COLD_START_BUDGET_MS, metavar="MS",
+        help="With --profile-scripts: HIGH issue for scripts slower than this (default: 500)"
+    )
+    parser.add_argument(
+        "--script-timeout", type=float, default=DEFAULT_SCRIPT_TIMEOUT, metavar="SECONDS",
+        help="With --profile-scripts: kill a script after this long (default: 10)"
+    )
+    parser.add_argument(
+        "--agents", action="store_true",
+        help="With --catalog: validate all agents in one pass and cross-check skill references to them"
+    )
+    parser.add_argument(
+        "--descriptions", action="store_true",
+        help="With --catalog: report the always-loaded token cost of every skill description"
+    )
+    parser.add_argument(
+        "--budget", type=int,
+        help="With --descriptions: fail if the total description cost exceeds this many tokens"
+    )
+    parser.add_argument(
+        "--watch", action="store_true",
+        help="Keep running and re-validate changed files (skill path, --agent file, or --catalog ROOT)"
+    )
+    parser.add_argument(
+        "--interval", type=float, default=0.5,
+        help="Seconds between polls in --watch mode (default: 0.5)"
+    )
     args = parser.parse_args()
 
+    if args.profile:
+        if not args.path or not os.path.isdir(args.path):
+            print(json.dumps({"error": "--profile needs a skill directory"}), file=sys.stderr)
+            sys.exit(1)
+        try:
+            profile = profile_context_cost(args.path, args.tokenizer)
+        except ValueError as exc:
+            print(json.dumps({"error": str(exc)}), file=sys.stderr)
+            sys.exit(1)
+        if "error" in profile:
+            print(json.dumps(profile), file=sys.stderr)
+            sys.exit(1)
+        if args.profile == "table":
+            print(format_profile_table(profile), end="")
+        else:
+            print(json.dumps(profile, indent=2))
+        sys.exit(0)
+
+    if args.profile_scripts:
+        if not args.path or not os.path.isdir(args.path):
+            print(json.dumps({"error": "--profile-scripts needs a skill directory"}), file=sys.stderr)
+            sys.exit(1)
+        if args.workers is not None and args.workers < 1:
+            print(json.dumps({"error": "--workers must be >= 1"}), file=sys.stderr)
+            sys.exit(1)
+        report = profile_scripts(args.path, args.cold_start_budget, args.script_timeout, args.workers)
+        if "error" in report:
+            print(json.dumps(report), file=sys.stderr)
+            sys.exit(1)
+        print(json.dumps(report, indent=2))
+        sys.exit(0 if report["status"] == "pass" else 1)
+
+    if args.agents:
+        if not args.catalog or not os.path.isdir(os.path.expanduser(args.catalog)):
+            print(json.dumps({"error": "--agents needs --catalog ROOT"}), file=sys.stderr)
+            sys.exit(1)
+        report = validate_agents_bulk(Path(args.catalog).expanduser().resolve())
+        print(json.dumps(report, indent=2))
+        sys.exit(0 if report["status"] == "pass" else 1)
+
+    if args.descriptions:
+        if not args.catalog or not os.path.isdir(os.path.expanduser(args.catalog)):
+            print(json.dumps({"error": "--descriptions needs --catalog ROOT"}), file=sys.stderr)
+            sys.exit(1)
+        try:
+            report = description_budget_report(
+                Path(args.catalog).expanduser().resolve(), args.budget, args.tokenizer
+            )
+        except ValueError as exc:
+            print(json.dumps({"error": str(exc)}), file=sys.stderr)
+            sys.exit(1)
+        print(json.dumps(report, indent=2))
+        sys.exit(0 if report["status"] == "pass" else 1)
+
+    if args.watch:
+        if args.catalog:
+            watch_entries = discover_catalog(Path(args.catalog).expanduser().resolve())
+        elif args.path and args.agent:
+            watch_entries = [("agent", Path(args.path).resolve())]
+        elif args.path and os.path.isdir(args.path):
+            watch_entries = [("skill", Path(args.path).resolve())]
+        else:
+            print(json.dumps({"error": "--watch needs a skill directory, --agent file, or --catalog ROOT"}), file=sys.stderr)
+            sys.exit(1)
+        try:
+            watch(watch_entries, args.interval)
+        except KeyboardInterrupt:
+            pass
+        sys.exit(0)
+
+    cache: ResultCache | None = None
+    if not args.no_cache:
+        cache_root = Path(args.cache_dir).expanduser() if args.cache_dir else default_cache_dir("validate")
+        cache = ResultCache(cache_root, int(args.cache_max_mb * 1024 * 1024))
+
+    if args.catalog:
+        root = Path(args.catalog).expanduser().resolve()
+        if not root.is_dir():
+            print(json.dumps({"error": f"Not a directory: {args.catalog}"}), file=sys.stderr)
+            sys.exit(1)
+        if args.workers is not None and args.workers < 1:
+            print(json.dumps({"error": "--workers must be >= 1"}), file=sys.stderr)
+            sys.exit(1)
+
+        start = time.perf_counter()
+        results: list[dict[str, Any]] = []
+        entries = discover_catalog(root)
+        cache_dir = cache.root if cache else None
+        entry_timings: list[list[dict[str, Any]]] = []
+        for result in iter_catalog_results(entries, args.strict, args.workers, cache_dir, args.rule_timings):
+            entry_timings.append(result.pop("rule_timings", []))
+            results.append(result)
+            print(json.dumps(result), flush=True)
+
+        summary = summarize_catalog(results, time.perf_counter() - start)
+        if args.rule_timings:
+            summary["rule_timings"] = merge_rule_timings(entry_timings)
+        summary["cache"]["enabled"] = cache is not None
+        summary["cache"]["evicted"] = cache.prune() if cache else 0
+        print(json.dumps({"summary": summary}), flush=True)
+        sys.exit(0 if summary["failed"] == 0 else 1)
+
+    if not args.path:
+        parser.error("a path is required unless --catalog is given")
+
     if args.agent:
         # Validate agent file
         agent_path = Path(args.path).resolve()
         if not agent_path.exists():
             print(json.dumps({"error": f"File not found: {args.path}"}), file=sys.stderr)
             sys.exit(1)
-        issues = validate_agent(agent_path)
-        score = calculate_score(issues)
-        result = {
-            "status": "pass" if score >= 60 else "fail",
-            "path": str(agent_path),
-            "type": "agent",
-            "score": score,
-            "issues_count": len(issues),
-            "critical": [i for i in issues if i.startswith("CRITICAL:")],
-            "high": [i for i in issues if i.startswith("HIGH:")],
-            "medium": [i for i in issues if i.startswith("MEDIUM:")],
-            "low": [i for i in issues if i.startswith("LOW:")],
-        }
+        result = validate_agent_file(agent_path, cache)
+        if args.rule_timings:
+            result["rule_timings"] = rule_timings()
+        if cache:
+            cache.prune()
         print(json.dumps(result, indent=2))
         sys.exit(0 if result["status"] == "pass" else 1)
 
@@ -412,7 +1624,11 @@ if __name__ == "__main__":
         print(json.dumps({"error": f"Not a directory: {args.path}"}), file=sys.stderr)
         sys.exit(1)
 
-    result = validate_skill(args.path, args.strict)
+    result = validate_skill(args.path, args.strict, cache)
+    if args.rule_timings:
+        result["rule_timings"] = rule_timings()
+    if cache:
+        cache.prune()
     print(json.dumps(result, indent=2))
 
     sys.exit(0 if result["status"] == "pass" else 1)